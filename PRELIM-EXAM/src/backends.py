@@ -0,0 +1,145 @@
+"""
+Execution backends for running a sort off the Tk thread.
+
+A backend runs one of the ALGORITHMS on row positions 0..n-1 with a
+prebuilt key column. It returns (sorted positions, sort seconds), or
+(None, seconds) if the run was stopped. The seconds only cover the
+algorithm itself, measured where it runs with perf_counter_ns, minus the
+time it spent waiting while paused.
+
+ThreadBackend runs the algorithm in the calling (worker) thread.
+ProcessBackend runs it in a separate process, so a CPU-bound sort doesn't
+compete with the Tk event loop for the GIL. Keys and results cross the
+process boundary as int64 arrays in shared memory, not as pickled
+records. Pause/stop map onto multiprocessing events, and progress comes
+back through two shared integers.
+"""
+import multiprocessing as mp
+import time
+from array import array
+from multiprocessing import shared_memory
+
+from sorting import ALGORITHMS, rank_keys
+from sortlab.parallel import shutdown_pools
+from sortlab.timing import PauseMeter
+
+RELAY_SECONDS = 0.03  # how often the parent relays progress and pause/stop
+
+
+def int_keys(keys):
+    """Keys as array('q'); string or oversized keys are replaced by their ranks."""
+    try:
+        return array("q", keys)
+    except (TypeError, OverflowError):
+        return array("q", rank_keys(keys))
+
+
+class ThreadBackend:
+    name = "Thread"
+
+    def run(self, algorithm, keys, progress, pause_event, stop_event):
+        pause_meter = PauseMeter(pause_event)
+        start = time.perf_counter_ns()
+        order = ALGORITHMS[algorithm](list(range(len(keys))), keys, progress, pause_meter, stop_event)
+        return order, pause_meter.running_seconds(start)
+
+
+class ProcessBackend:
+    name = "Process"
+
+    def __init__(self):
+        # spawn, not fork: forking a process that is running Tk and worker
+        # threads is unsafe, and spawn behaves the same on every OS
+        self.context = mp.get_context("spawn")
+
+    def run(self, algorithm, keys, progress, pause_event, stop_event):
+        n = len(keys)
+        size = max(1, n * 8)
+        keys_shm = shared_memory.SharedMemory(create=True, size=size)
+        order_shm = shared_memory.SharedMemory(create=True, size=size)
+        process = None
+        try:
+            keys_shm.buf[:n * 8] = int_keys(keys).tobytes()
+
+            ctx = self.context
+            current = ctx.Value("q", 0, lock=False)
+            total = ctx.Value("q", n, lock=False)
+            child_pause, child_stop = ctx.Event(), ctx.Event()
+            child_pause.set()
+            receiver, sender = ctx.Pipe(duplex=False)
+
+            # Not a daemon: the parallel sort starts its own worker pool
+            process = ctx.Process(
+                target=sort_in_process,
+                args=(algorithm, keys_shm.name, order_shm.name, n,
+                      current, total, child_pause, child_stop, sender)
+            )
+            process.start()
+            sender.close()
+
+            # Relay pause/stop into the child and its progress back out
+            while not receiver.poll(RELAY_SECONDS):
+                if not process.is_alive():
+                    break
+                if stop_event.is_set():
+                    child_stop.set()
+                if pause_event.is_set():
+                    child_pause.set()
+                else:
+                    child_pause.clear()
+                progress(current.value, total.value)
+
+            status, value = receiver.recv() if receiver.poll() else ("error", "sort process exited unexpectedly")
+            process.join()
+            if status == "error":
+                raise RuntimeError(value)
+            if status == "stopped":
+                return None, value
+
+            progress(n, n)
+            order = array("q")
+            with order_shm.buf[:n * 8] as raw:
+                order.frombytes(raw)
+            return order.tolist(), value
+        finally:
+            if process is not None and process.is_alive():
+                process.terminate()
+            for shm in (keys_shm, order_shm):
+                shm.close()
+                shm.unlink()
+
+
+def sort_in_process(algorithm, keys_name, order_name, n, current, total, pause_event, stop_event, conn):
+    """Child process entry point; reports ("ok" | "stopped", seconds) or ("error", message)."""
+    keys_shm = shared_memory.SharedMemory(name=keys_name)
+    order_shm = shared_memory.SharedMemory(name=order_name)
+    try:
+        with keys_shm.buf[:n * 8] as raw, raw.cast("q") as view:
+            keys = view.tolist()
+
+        def report(done, out_of):
+            current.value = done
+            total.value = out_of
+
+        pause_meter = PauseMeter(pause_event)
+        start = time.perf_counter_ns()
+        order = ALGORITHMS[algorithm](list(range(n)), keys, report, pause_meter, stop_event)
+        seconds = pause_meter.running_seconds(start)
+
+        if order is None:
+            conn.send(("stopped", seconds))
+            return
+        order_shm.buf[:n * 8] = array("q", order).tobytes()
+        conn.send(("ok", seconds))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        # A process child joins its own children on exit, so idle pool
+        # workers started by a parallel sort would otherwise keep it alive
+        shutdown_pools()
+        conn.close()
+        keys_shm.close()
+        order_shm.close()
+
+
+BACKENDS = {backend.name: backend for backend in (ThreadBackend(), ProcessBackend())}
@@ -0,0 +1,209 @@
+"""
+Headless benchmark runner for SortingAlgorithms.
+
+Runs an algorithm x column x row-count matrix against a CSV dataset and
+writes the timings as JSON and/or CSV. Nothing here imports tkinter, so it
+works on display-less machines:
+
+    python benchmark.py ../data/generated_data.csv -a merge-sort -c ID LastName \\
+        -n 1000 10000 100000 --json results.json --csv results.csv
+
+--count-ops adds comparison/move/key-evaluation/allocation counts from a
+second, instrumented run of each combination (the timed run stays untouched).
+--generate ROWS [--seed SEED] benchmarks seeded, generated records of the same
+shape instead of a CSV file, so a run can be repeated exactly anywhere.
+"""
+import argparse, csv, json, sys, threading
+
+from backends import BACKENDS
+from sorting import ALGORITHMS, KEY_FUNCS, KeyCache, count_operations, generated_records, load_records
+from sortlab.generate import DEFAULT_SEED
+from sortlab.instrument import FIELDS as COUNT_FIELDS
+from sortlab.parallel import chunk_bounds
+
+
+RESULT_FIELDS = ["algorithm", "column", "rows", "backend", "seconds", "key_seconds"]
+
+
+def slug(name):
+    """'Merge Sort' -> 'merge-sort'"""
+    return name.lower().replace(" ", "-")
+
+
+ALGORITHM_SLUGS = {slug(name): name for name in ALGORITHMS}
+
+
+def no_progress(current, total):
+    pass
+
+
+def run_benchmark(data, algorithms, columns, sizes, backend="Thread", on_result=None, count_ops=False):
+    """
+    Time every (algorithm, column, size) combination on a prefix of data.
+
+    Key columns are built once per column and shared by every run; the
+    build time is reported as key_seconds on the first run that needs it
+    and is not included in seconds.
+
+    Args:
+        data: RecordTable from load_records
+        algorithms: Names from ALGORITHMS
+        columns: Names from KEY_FUNCS
+        sizes: Row counts; each is capped at len(data)
+        backend: Name from BACKENDS; seconds is measured where the sort runs
+        on_result: Optional callback invoked with each result as it finishes
+        count_ops: Also count operations in a separate instrumented run and
+                   add the COUNT_FIELDS to each result
+
+    Returns:
+        List of result dicts with the keys in RESULT_FIELDS (and COUNT_FIELDS)
+    """
+    pause_event = threading.Event()
+    pause_event.set()
+    stop_event = threading.Event()
+    key_cache = KeyCache()
+
+    results = []
+    for algorithm in algorithms:
+        for column in columns:
+            for size in sizes:
+                n = min(size, len(data))
+                keys, key_time, cached = key_cache.get(data, column)
+
+                _, elapsed = BACKENDS[backend].run(algorithm, keys[:n], no_progress, pause_event, stop_event)
+
+                result = {
+                    "algorithm": algorithm, "column": column, "rows": n, "backend": backend,
+                    "seconds": elapsed, "key_seconds": 0.0 if cached else key_time
+                }
+                if count_ops:
+                    _, counts = count_operations(algorithm, keys[:n], no_progress)
+                    counts.key_evaluations = 0 if cached else len(keys)
+                    result.update(counts.as_dict())
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    return results
+
+
+def parallel_speedups(results):
+    """(column, rows, speedup) wherever both Merge Sort and Parallel Merge Sort ran."""
+    merge_times = {
+        (r["column"], r["rows"]): r["seconds"] for r in results if r["algorithm"] == "Merge Sort"
+    }
+    speedups = []
+    for r in results:
+        baseline = merge_times.get((r["column"], r["rows"]))
+        if r["algorithm"] == "Parallel Merge Sort" and baseline and r["seconds"] > 0:
+            speedups.append((r["column"], r["rows"], baseline / r["seconds"]))
+    return speedups
+
+
+def write_json(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def write_csv(results, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        counted = bool(results) and "comparisons" in results[0]
+        writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS + (list(COUNT_FIELDS) if counted else []))
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run sorting benchmarks without the GUI.")
+    parser.add_argument("csv_path", nargs="?", help="dataset CSV with ID, FirstName and LastName columns")
+    parser.add_argument(
+        "-g", "--generate", type=int, metavar="ROWS",
+        help="benchmark this many generated records instead of a CSV file"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=DEFAULT_SEED,
+        help=f"seed for --generate; the same seed gives the same records (default: {DEFAULT_SEED})"
+    )
+    parser.add_argument(
+        "-a", "--algorithms", nargs="+", default=["merge-sort"],
+        choices=sorted(ALGORITHM_SLUGS), metavar="ALGO",
+        help=f"algorithms to run: {', '.join(ALGORITHM_SLUGS)} (default: merge-sort)"
+    )
+    parser.add_argument(
+        "-c", "--columns", nargs="+", default=["ID"], choices=list(KEY_FUNCS),
+        help="columns to sort by (default: ID)"
+    )
+    parser.add_argument(
+        "-n", "--rows", nargs="+", type=int, default=[1000],
+        help="row counts to test (default: 1000)"
+    )
+    parser.add_argument(
+        "-b", "--backend", default="Thread", choices=list(BACKENDS),
+        help="run each sort in this thread or in a separate process (default: Thread)"
+    )
+    parser.add_argument(
+        "--count-ops", action="store_true",
+        help="also count comparisons, moves, key evaluations and allocations (extra, slower run)"
+    )
+    parser.add_argument("--json", dest="json_path", help="write results to this JSON file")
+    parser.add_argument("--csv", dest="out_csv_path", help="write results to this CSV file")
+    args = parser.parse_args(argv)
+    if (args.csv_path is None) == (args.generate is None):
+        parser.error("give either a CSV file or --generate ROWS")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.generate is not None:
+        try:
+            data = generated_records(args.generate, args.seed)
+        except ValueError as e:
+            print(f"Error: could not generate records - {e}", file=sys.stderr)
+            return 1
+        print(f"Generated {len(data):,} records (seed {args.seed})")
+    else:
+        try:
+            data = load_records(args.csv_path)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Error: could not load {args.csv_path} - {e}", file=sys.stderr)
+            return 1
+        print(f"Loaded {len(data):,} records from {args.csv_path}")
+
+    count_header = f" {'Comparisons':>14} {'Moves':>14}" if args.count_ops else ""
+    print(f"{'Algorithm':<22} {'Column':<10} {'Rows':>10} {'Time (s)':>12} {'Key Build (s)':>14}" + count_header)
+    print("-" * (72 + len(count_header)))
+
+    def report(result):
+        counts = f" {result['comparisons']:>14,} {result['moves']:>14,}" if args.count_ops else ""
+        print(f"{result['algorithm']:<22} {result['column']:<10} "
+              f"{result['rows']:>10,} {result['seconds']:>12.4f} {result['key_seconds']:>14.4f}" + counts, flush=True)
+
+    results = run_benchmark(
+        data,
+        [ALGORITHM_SLUGS[a] for a in args.algorithms],
+        args.columns,
+        args.rows,
+        backend=args.backend,
+        on_result=report,
+        count_ops=args.count_ops
+    )
+
+    speedups = parallel_speedups(results)
+    if speedups:
+        workers = len(chunk_bounds(max(r[1] for r in speedups)))
+        print(f"\nParallel Merge Sort speedup vs Merge Sort (up to {workers} workers):")
+        for column, rows, speedup in speedups:
+            print(f"  {column:<10} {rows:>10,} rows: {speedup:.2f}x")
+
+    if args.json_path:
+        write_json(results, args.json_path)
+        print(f"Results written to {args.json_path}")
+    if args.out_csv_path:
+        write_csv(results, args.out_csv_path)
+        print(f"Results written to {args.out_csv_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Exporting sorted results.
+
+Rows are written in batches (csv.writer.writerows over a generator) and
+progress is reported between batches, so an export can run on a worker
+thread and be polled through a ProgressChannel. Run metadata (algorithm,
+column, timings, ...) is written once, instead of being repeated on every
+row.
+
+The format follows the file extension:
+
+    .csv     plain CSV, metadata in <file>.meta.json
+    .csv.gz  gzip-compressed CSV, metadata in <file>.meta.json
+    .slc     sortlab columnar file (sortlab/columnar.py), metadata in its header
+"""
+import csv, gzip, json, os
+from itertools import count, islice
+
+from sorting import RecordTable
+from sortlab.columnar import read_columns, write_columns
+
+HEADER = ["Rank", "ID", "First Name", "Last Name"]
+BATCH_ROWS = 50_000
+FILETYPES = [("CSV Files", "*.csv"), ("Gzip CSV", "*.csv.gz"), ("Columnar Files", "*.slc")]
+
+
+def export_format(path):
+    lower = path.lower()
+    if lower.endswith(".gz"):
+        return "csv.gz"
+    if lower.endswith(".slc"):
+        return "columnar"
+    return "csv"
+
+
+def export_results(table, path, meta, progress=None, stop_event=None):
+    """
+    Write a sorted RecordTable to path; a row's rank is its position.
+
+    Args:
+        table: Sorted RecordTable
+        path: Destination; the extension picks the format
+        meta: JSON-serializable dict describing the run
+        progress: Optional progress(rows_written, total_rows)
+        stop_event: Optional threading.Event; once set, the export stops and
+                    the partial file is removed
+
+    Returns:
+        Path the metadata was written to, or None if stopped
+    """
+    n = len(table)
+    report = progress or (lambda done, total: None)
+    meta = dict(meta, rows=n)
+
+    if export_format(path) == "columnar":
+        report(0, n)
+        columns, strings = table.to_columns()
+        write_columns(path, columns, strings, meta)
+        report(n, n)
+        return path
+
+    if export_format(path) == "csv.gz":
+        f = gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=6)
+    else:
+        f = open(path, "w", encoding="utf-8", newline="")
+    stopped = False
+    try:
+        with f:
+            writer = csv.writer(f)
+            writer.writerow(HEADER)
+            rows = table.rows()
+            ranks = count(1)
+            for start in range(0, n, BATCH_ROWS):
+                writer.writerows((rank, *row) for rank, row in zip(ranks, islice(rows, BATCH_ROWS)))
+                report(min(start + BATCH_ROWS, n), n)
+                if stop_event is not None and stop_event.is_set():
+                    stopped = True
+                    break
+    except BaseException:
+        os.remove(path)
+        raise
+    if stopped:
+        os.remove(path)
+        return None
+
+    meta_path = path + ".meta.json"
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    report(n, n)
+    return meta_path
+
+
+def load_exported(path):
+    """Read a columnar (.slc) export back as (RecordTable, metadata dict)."""
+    columns, strings, meta = read_columns(path)
+    return RecordTable().load_columns(columns, strings), meta
@@ -0,0 +1,835 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, simpledialog
+import os, threading
+from datetime import datetime
+
+from backends import BACKENDS
+from exporter import FILETYPES, export_format, export_results
+from loader import CsvLoader
+from progress import ProgressChannel, poll_channel
+from results_view import ResultsView
+from sorting import (
+    ALGORITHMS, KEY_FUNCS, KeyCache, RecordTable,
+    count_operations, external_sort_records, generated_records, top_k_csv, top_k_positions
+)
+from sortlab.external import DEFAULT_MEMORY_MB
+from sortlab.generate import DEFAULT_SEED
+from sortlab.parallel import chunk_bounds
+from sortlab import scaling
+from sortlab.timing import NS, PhaseTimer
+from sortlab.verify import verify_order
+
+
+# ===================== GUI =====================
+class SortingBenchmarkGUI:
+
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Sorting Algorithm Stress Test")
+        self.root.geometry("1000x820")
+
+        self.data = RecordTable()
+        self.sorted_result = RecordTable()
+        self.loaded_file = None
+        self.loader = None
+        self.key_cache = KeyCache()
+        self.sort_running = False
+        self.last_run = {}
+        # Single-core Merge Sort times by (column, rows), for parallel speedup
+        self.merge_times = {}
+
+        self.pause_event = threading.Event()
+        self.pause_event.set()
+        self.stop_event = threading.Event()
+
+        # Pause-aware timer of the current (or last) job, and the last load time
+        self.timer = PhaseTimer()
+        self.load_seconds = None
+
+        self.setup_style()
+        self.build_ui()
+
+    # ---------- STYLE ----------
+    def setup_style(self):
+        style = ttk.Style()
+        style.theme_use("clam")
+
+        BG = "#f7f9fc"
+        FG = "#1f2933"
+        ACCENT = "#2563eb"
+        BORDER = "#d1d5db"
+
+        self.root.configure(bg=BG)
+
+        style.configure(".", background=BG, foreground=FG, font=("Segoe UI", 10))
+        style.configure("Title.TLabel", font=("Segoe UI Semibold", 17), foreground=ACCENT)
+        style.configure("TButton", padding=(12, 6), background=ACCENT, foreground="white")
+        style.map("TButton", background=[("active", "#1d4ed8")])
+        style.configure("TProgressbar", thickness=12, troughcolor=BORDER, background=ACCENT)
+
+    # ---------- UI ----------
+    def build_ui(self):
+        container = ttk.Frame(self.root, padding=20)
+        container.pack(expand=True, fill="both")
+
+        ttk.Label(
+            container,
+            text="Sorting Algorithm Stress Test – Benchmarking Tool",
+            style="Title.TLabel"
+        ).pack(pady=(0, 20))
+
+        # Top controls
+        controls = ttk.Frame(container)
+        controls.pack()
+
+        ttk.Button(controls, text="Load CSV", command=self.load_csv).grid(row=0, column=0, padx=6)
+        ttk.Button(controls, text="🎲 Generate", command=self.generate_data).grid(row=1, column=0, padx=6, pady=(8, 0))
+
+        ttk.Label(controls, text="Rows:").grid(row=0, column=1)
+        self.rows_var = tk.StringVar(value="1000")
+        ttk.Entry(controls, textvariable=self.rows_var, width=8).grid(row=0, column=2)
+
+        ttk.Label(controls, text="Column:").grid(row=0, column=3)
+        self.col_var = tk.StringVar(value="ID")
+        ttk.Combobox(
+            controls,
+            textvariable=self.col_var,
+            values=list(KEY_FUNCS),
+            state="readonly",
+            width=12
+        ).grid(row=0, column=4)
+
+        ttk.Label(controls, text="Algorithm:").grid(row=0, column=5)
+        self.algo_var = tk.StringVar(value="Merge Sort")
+        ttk.Combobox(
+            controls,
+            textvariable=self.algo_var,
+            values=list(ALGORITHMS),
+            state="readonly",
+            width=14
+        ).grid(row=0, column=6)
+
+        ttk.Label(controls, text="Backend:").grid(row=0, column=7)
+        self.backend_var = tk.StringVar(value="Thread")
+        ttk.Combobox(
+            controls,
+            textvariable=self.backend_var,
+            values=list(BACKENDS),
+            state="readonly",
+            width=9
+        ).grid(row=0, column=8)
+
+        # Top K mode: only the first K rows in key order, via a bounded heap
+        self.topk_mode = tk.BooleanVar(value=False)
+        ttk.Checkbutton(controls, text="Top K only:", variable=self.topk_mode).grid(row=1, column=5, pady=(8, 0))
+        self.topk_var = tk.StringVar(value="10")
+        ttk.Entry(controls, textvariable=self.topk_var, width=8).grid(row=1, column=6, sticky="w", pady=(8, 0))
+
+        # Counted runs sort instrumented inputs on a thread; slower, so off by default
+        self.count_ops = tk.BooleanVar(value=False)
+        ttk.Checkbutton(controls, text="Count operations", variable=self.count_ops).grid(
+            row=1, column=7, columnspan=2, sticky="w", pady=(8, 0))
+
+        # Action buttons
+        action_buttons = ttk.Frame(container)
+        action_buttons.pack(pady=12)
+
+        ttk.Button(action_buttons, text="▶ Start", command=self.start_sort).grid(row=0, column=0, padx=6)
+        ttk.Button(action_buttons, text="⏸ Pause", command=self.pause_sort).grid(row=0, column=1, padx=6)
+        ttk.Button(action_buttons, text="⏹ Stop", command=self.stop_sort).grid(row=0, column=2, padx=6)
+
+        self.progress = ttk.Progressbar(container, mode="determinate")
+        self.progress.pack(fill="x", pady=(10, 5))
+
+        self.status = ttk.Label(container, text="Ready")
+        self.status.pack(anchor="w")
+
+        self.file_label = ttk.Label(container, text="No file loaded", foreground="#6b7280")
+        self.file_label.pack(anchor="w", pady=(2, 0))
+
+        # Table: one page of the full sorted result, filled lazily
+        self.results = ResultsView(container)
+        self.results.pack(fill="both", expand=True, pady=15)
+
+        # Bottom buttons
+        bottom_buttons = ttk.Frame(container)
+        bottom_buttons.pack(pady=5)
+
+        ttk.Button(bottom_buttons, text="🧹 Clear Results", command=self.clear_results).grid(row=0, column=0, padx=8)
+        ttk.Button(bottom_buttons, text="⬇ Export", command=self.export_results).grid(row=0, column=1, padx=8)
+        ttk.Button(bottom_buttons, text="⇅ External Sort", command=self.external_sort).grid(row=0, column=2, padx=8)
+        ttk.Button(bottom_buttons, text="⤓ Top K from File", command=self.top_k_from_file).grid(row=0, column=3, padx=8)
+        ttk.Button(bottom_buttons, text="📈 Scaling Sweep", command=self.scaling_sweep).grid(row=0, column=4, padx=8)
+
+    # ---------- LOGIC ----------
+    def load_csv(self):
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+        path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
+        if not path:
+            return
+        if self.loader and not self.loader.done:
+            self.loader.cancel()
+        try:
+            self.loader = CsvLoader(path)
+        except OSError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        # Rows become sortable as soon as each chunk is parsed
+        self.data = self.loader.table
+        self.merge_times = {}
+        self.loaded_file = os.path.basename(path)
+        self.file_label.config(text=f"Loading file: {self.loaded_file}")
+        self.loader.start()
+        self.poll_loader(self.loader)
+
+    def poll_loader(self, loader):
+        if loader is not self.loader:
+            return  # superseded by a newer load
+
+        rows = len(loader.table)
+        if not self.sort_running:
+            self.progress["value"] = loader.percent
+            self.status.config(
+                text=f"Loading... {loader.percent:.1f}% | "
+                     f"{loader.bytes_read / 1e6:.1f} of {loader.total_bytes / 1e6:.1f} MB | "
+                     f"{rows:,} rows | {loader.rows_per_second:,.0f} rows/s"
+            )
+
+        if not loader.done:
+            self.root.after(100, self.poll_loader, loader)
+            return
+
+        if loader.error:
+            self.data = RecordTable()
+            self.loaded_file = None
+            self.file_label.config(text="No file loaded")
+            messagebox.showerror("Error", str(loader.error))
+            return
+
+        self.file_label.config(text=f"Loaded file: {self.loaded_file}")
+        self.load_seconds = loader.elapsed
+        if loader.from_cache:
+            summary = f"Loaded {rows:,} rows from the dataset cache in {loader.elapsed:.2f}s"
+        else:
+            summary = f"Loaded {rows:,} rows in {loader.elapsed:.2f}s ({loader.rows_per_second:,.0f} rows/s)"
+        if not self.sort_running:
+            self.status.config(text=summary)
+        messagebox.showinfo("Loaded", f"{rows:,} records loaded from:\n{self.loaded_file}\n\n{summary}")
+
+    def generate_data(self):
+        """Replace the data with seeded rows shaped like generated_data.csv."""
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+        rows = simpledialog.askinteger("Generate Data", "Number of records:", initialvalue=100_000, minvalue=1)
+        if rows is None:
+            return
+        seed = simpledialog.askinteger("Generate Data", "Seed (same seed, same data):", initialvalue=DEFAULT_SEED)
+        if seed is None:
+            return
+        if self.loader and not self.loader.done:
+            self.loader.cancel()
+        self.loader = None
+
+        self.sort_running = True
+        self.timer = PhaseTimer()
+        self.status.config(text=f"Generating {rows:,} records...")
+        channel = ProgressChannel()
+
+        def generate():
+            # Worker thread: no Tk calls here
+            try:
+                with self.timer.phase("load"):
+                    channel.finish(generated_records(rows, seed))
+            except Exception as e:
+                channel.finish(error=e)
+
+        threading.Thread(target=generate, daemon=True).start()
+        poll_channel(self.root, channel, lambda channel: None, lambda channel: self.finish_generate(channel, seed))
+
+    def finish_generate(self, channel, seed):
+        self.sort_running = False
+        if channel.error:
+            self.status.config(text="Failed")
+            messagebox.showerror("Error", str(channel.error))
+            return
+        self.data = channel.result
+        self.merge_times = {}
+        self.loaded_file = f"generated (seed {seed})"
+        self.load_seconds = self.timer.seconds("load")
+        self.file_label.config(text=f"Generated data: {len(self.data):,} rows, seed {seed}")
+        self.status.config(text=f"Generated {len(self.data):,} rows in {self.load_seconds:.2f}s")
+
+    def show_sort_progress(self, channel):
+        # Runs on the Tk thread at a fixed frame rate; the worker only writes channel.state
+        if self.stop_event.is_set():
+            return
+        if not self.pause_event.is_set():
+            self.status.config(text="Paused (time preserved)")
+            return
+        self.progress["value"] = channel.percent
+        self.status.config(
+            text=f"Processing... {channel.percent:.1f}% | Elapsed: {self.timer.elapsed:.2f}s"
+        )
+
+    def start_sort(self):
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+        if not self.data:
+            messagebox.showwarning("No Data", "Load a CSV file first.")
+            return
+        try:
+            rows = int(self.rows_var.get())
+        except ValueError:
+            messagebox.showwarning("Invalid Rows", "Rows must be a whole number.")
+            return
+        top_k = self.read_top_k() if self.topk_mode.get() else None
+        if top_k == 0:
+            return
+
+        self.clear_results()
+        self.stop_event.clear()
+        self.pause_event.set()
+
+        # Read Tk variables here; the worker thread must not touch Tk
+        # Only rows loaded so far are sorted if the file is still streaming in
+        self.last_run = {
+            "algorithm": self.algo_var.get(),
+            "column": self.col_var.get(),
+            "backend": self.backend_var.get(),
+            "rows": min(rows, len(self.data)),
+            "top_k": top_k,
+            "count_ops": self.count_ops.get() and not top_k
+        }
+        if top_k:
+            self.last_run.update(algorithm="Top K (heap)", backend="Thread")
+        elif self.last_run["count_ops"]:
+            self.last_run.update(backend="Thread (counted)")
+
+        self.timer = PhaseTimer()
+        self.sort_running = True
+
+        channel = ProgressChannel()
+        threading.Thread(target=self.run_sort, args=(channel, self.last_run), daemon=True).start()
+        poll_channel(self.root, channel, self.show_sort_progress, self.finish_sort)
+
+    def pause_sort(self):
+        # The timer stands still while paused, so pauses never count as run time
+        if self.pause_event.is_set():
+            self.pause_event.clear()
+            self.timer.pause()
+            self.status.config(text="Paused (time preserved)")
+        else:
+            self.timer.resume()
+            self.pause_event.set()
+
+    def stop_sort(self):
+        self.stop_event.set()
+        self.timer.resume()
+        self.pause_event.set()
+        self.status.config(text="Stopped")
+
+    def run_sort(self, channel, run):
+        # Worker thread: no Tk calls, results are handed back through the channel
+        try:
+            n = run["rows"]
+            timer = self.timer
+            data = self.data  # the table this run sorts, even if another is loaded meanwhile
+            op_counts = None
+            with timer.phase("prepare"):
+                keys, key_time, cached = self.key_cache.get(data, run["column"])
+                subset = keys[:n]
+
+            if run["top_k"]:
+                # Only the first K positions, selected with a bounded heap
+                with timer.phase("sort"):
+                    order = top_k_positions(subset, run["top_k"])
+                channel.report(n, n)
+            elif run["count_ops"]:
+                # Same sort on instrumented inputs, always on this thread
+                with timer.phase("sort"):
+                    order, counts = count_operations(
+                        run["algorithm"], subset, channel.report, self.pause_event, self.stop_event
+                    )
+                counts.key_evaluations = 0 if cached else len(keys)
+                op_counts = counts
+            else:
+                # Sort the first n row positions by key; the backend times the
+                # algorithm where it runs, without paused spans
+                order, sort_time = BACKENDS[run["backend"]].run(
+                    run["algorithm"],
+                    subset,
+                    channel.report,
+                    self.pause_event,
+                    self.stop_event
+                )
+                timer.add("sort", round(sort_time * NS))
+            if order is None:
+                channel.finish()
+                return
+
+            # Linear-time check of order, completeness and stability (Top K: distinct positions)
+            with timer.phase("verify"):
+                verification = verify_order(subset, order, complete=not run["top_k"])
+            with timer.phase("gather"):
+                self.sorted_result = data.take(order)
+            channel.finish({
+                "key_time": key_time, "key_cached": cached, "op_counts": op_counts, "verification": verification
+            })
+        except Exception as e:
+            channel.finish(error=e)
+
+    def finish_sort(self, channel):
+        self.sort_running = False
+        if channel.error:
+            self.status.config(text="Failed")
+            messagebox.showerror("Sort Error", str(channel.error))
+            return
+        if channel.result is None:
+            self.status.config(text="Stopped")
+            return
+
+        run = self.last_run
+        key_note = f"{channel.result['key_time']:.4f}s" + (" (cached)" if channel.result["key_cached"] else "")
+
+        self.progress["value"] = 100
+        with self.timer.phase("render"):
+            self.results.set_rows(self.sorted_result)
+        self.timer.stop()
+        total_time = self.timer.elapsed
+        verification = channel.result["verification"]
+        run.update(total_seconds=total_time, phases=self.timer.as_dict(), verification=verification.as_dict())
+        verified = f"Verified: {verification.summary()}" if verification.passed else f"VERIFICATION FAILED: {verification.summary()}"
+
+        sort_time = self.timer.seconds("sort")
+        if run["top_k"]:
+            self.status.config(
+                text=f"Completed | Top {len(self.sorted_result):,} of {run['rows']:,} by {run['column']} | "
+                     f"Total Time: {total_time:.4f}s | {self.timer.summary()} | Key Build: {key_note} | {verified}"
+            )
+            if not verification.passed:
+                messagebox.showerror("Verification Failed", verification.summary())
+            return
+
+        counts = channel.result["op_counts"]
+        if counts is not None:
+            # Counting slows the sort down, so its time is not a speedup baseline
+            run["op_counts"] = counts.as_dict()
+            note = counts.summary()
+        else:
+            note = self.speedup_note(run, sort_time)
+        self.status.config(
+            text=f"Completed ({run['backend']}) | Total Time: {total_time:.4f}s | "
+                 f"{self.timer.summary()} | Key Build: {key_note}"
+                 + (f" | {note}" if note else "") + f" | {verified}"
+        )
+
+        messagebox.showinfo(
+            "Sorting Complete",
+            f"{run['algorithm']} completed.\n\n"
+            f"Records processed: {run['rows']:,}\n"
+            f"Key build time: {key_note}\n"
+            f"Sort time ({run['backend']} backend): {sort_time:.4f} seconds\n"
+            f"Total execution time: {total_time:.4f} seconds (pauses excluded)\n"
+            f"Phases: {self.timer.summary()}\n"
+            f"{verified}"
+            + (f"\n{note}" if note else "")
+        )
+
+    def read_top_k(self):
+        """K from the Top K entry, or 0 (after a warning) if it is not a positive number."""
+        try:
+            k = int(self.topk_var.get())
+        except ValueError:
+            k = 0
+        if k <= 0:
+            messagebox.showwarning("Invalid K", "Top K must be a positive whole number.")
+        return max(k, 0)
+
+    # ---------- TOP K FROM FILE ----------
+    def top_k_from_file(self):
+        """Stream a CSV and keep only its first K rows by the selected column."""
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+        k = self.read_top_k()
+        if not k:
+            return
+        path = filedialog.askopenfilename(title="CSV to scan", filetypes=[("CSV Files", "*.csv")])
+        if not path:
+            return
+
+        self.clear_results()
+        self.stop_event.clear()
+        self.pause_event.set()
+        job = {"path": path, "column": self.col_var.get(), "k": k}
+        self.timer = PhaseTimer()
+        self.sort_running = True
+
+        channel = ProgressChannel()
+        threading.Thread(target=self.run_top_k_file, args=(channel, job), daemon=True).start()
+        poll_channel(
+            self.root, channel, self.show_sort_progress,
+            lambda channel: self.finish_top_k_file(channel, job)
+        )
+
+    def run_top_k_file(self, channel, job):
+        # Worker thread: no Tk calls here
+        try:
+            with self.timer.phase("scan"):
+                result = top_k_csv(
+                    job["path"], job["column"], job["k"],
+                    progress=channel.report, pause_event=self.pause_event, stop_event=self.stop_event
+                )
+            if result is not None:
+                self.sorted_result, job["scanned"] = result
+            channel.finish(result)
+        except Exception as e:
+            channel.finish(error=e)
+
+    def finish_top_k_file(self, channel, job):
+        self.sort_running = False
+        if channel.error:
+            self.status.config(text="Failed")
+            messagebox.showerror("Top K Error", str(channel.error))
+            return
+        if channel.result is None:
+            self.status.config(text="Stopped")
+            return
+
+        self.progress["value"] = 100
+        with self.timer.phase("render"):
+            self.results.set_rows(self.sorted_result)
+        self.timer.stop()
+        total_time = self.timer.elapsed
+        self.last_run = {
+            "algorithm": "Top K (streamed)", "column": job["column"], "backend": "Thread",
+            "rows": job["scanned"], "top_k": job["k"],
+            "total_seconds": total_time, "phases": self.timer.as_dict()
+        }
+        self.status.config(
+            text=f"Completed | Top {len(self.sorted_result):,} of {job['scanned']:,} rows by {job['column']} "
+                 f"from {os.path.basename(job['path'])} | Total Time: {total_time:.4f}s | {self.timer.summary()}"
+        )
+
+    def speedup_note(self, run, sort_time):
+        """Remember Merge Sort times; compare Parallel Merge Sort against them."""
+        baseline_key = (run["column"], run["rows"])
+        if run["algorithm"] == "Merge Sort":
+            self.merge_times[baseline_key] = sort_time
+            return ""
+        if run["algorithm"] != "Parallel Merge Sort":
+            return ""
+        workers = len(chunk_bounds(run["rows"]))
+        baseline = self.merge_times.get(baseline_key)
+        if baseline is None or sort_time <= 0:
+            return f"{workers} workers (run Merge Sort for speedup)"
+        return f"Speedup vs Merge Sort: {baseline / sort_time:.2f}x ({workers} workers)"
+
+    # ---------- CLEAR ----------
+    def clear_results(self):
+        self.results.clear()
+        self.progress["value"] = 0
+        self.status.config(text="Ready")
+        self.sorted_result = RecordTable()
+
+    # ---------- EXTERNAL SORT ----------
+    def external_sort(self):
+        """Sort a CSV file to a new file in bounded memory, without loading it."""
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+        src = filedialog.askopenfilename(title="CSV to sort", filetypes=[("CSV Files", "*.csv")])
+        if not src:
+            return
+        dst = filedialog.asksaveasfilename(
+            title="Save sorted CSV as", defaultextension=".csv", filetypes=[("CSV Files", "*.csv")]
+        )
+        if not dst:
+            return
+        if os.path.abspath(src) == os.path.abspath(dst):
+            messagebox.showwarning("External Sort", "Choose a different output file.")
+            return
+        memory_mb = simpledialog.askinteger(
+            "External Sort", "Memory budget per run (MB):",
+            initialvalue=DEFAULT_MEMORY_MB, minvalue=1, parent=self.root
+        )
+        if memory_mb is None:
+            return
+
+        self.clear_results()
+        self.stop_event.clear()
+        self.pause_event.set()
+        job = {
+            "src": src, "dst": dst, "memory_mb": memory_mb,
+            "column": self.col_var.get(), "algorithm": self.algo_var.get()
+        }
+        self.external_phase = "split"
+        self.timer = PhaseTimer()
+        self.sort_running = True
+
+        channel = ProgressChannel()
+        threading.Thread(target=self.run_external_sort, args=(channel, job), daemon=True).start()
+        poll_channel(
+            self.root, channel, self.show_external_progress,
+            lambda channel: self.finish_external_sort(channel, job)
+        )
+
+    def run_external_sort(self, channel, job):
+        # Worker thread: no Tk calls here
+        timer = self.timer
+        phase_start = [timer.now_ns()]
+
+        def end_phase():
+            now = timer.now_ns()
+            timer.add(self.external_phase, now - phase_start[0])
+            phase_start[0] = now
+
+        def report(phase, done, total):
+            if phase != self.external_phase:
+                end_phase()
+            self.external_phase = phase
+            channel.report(done, total)
+
+        try:
+            stats = external_sort_records(
+                job["src"], job["dst"], job["column"], job["algorithm"], job["memory_mb"],
+                report, self.pause_event, self.stop_event
+            )
+            end_phase()
+            channel.finish(stats)
+        except Exception as e:
+            channel.finish(error=e)
+
+    def show_external_progress(self, channel):
+        if self.stop_event.is_set():
+            return
+        if not self.pause_event.is_set():
+            self.status.config(text="Paused (time preserved)")
+            return
+        merging = self.external_phase == "merge"
+        elapsed = self.timer.elapsed
+        # Splitting fills the first half of the bar, merging the second
+        self.progress["value"] = channel.percent / 2 + (50 if merging else 0)
+        phase = "Merging runs" if merging else "Splitting into sorted runs"
+        self.status.config(
+            text=f"External sort: {phase}... {channel.percent:.1f}% | Elapsed: {elapsed:.2f}s"
+        )
+
+    def finish_external_sort(self, channel, job):
+        self.sort_running = False
+        if channel.error:
+            self.status.config(text="Failed")
+            messagebox.showerror("External Sort Error", str(channel.error))
+            return
+        if channel.result is None:
+            self.status.config(text="Stopped")
+            return
+
+        self.timer.stop()
+        total_time = self.timer.elapsed
+        stats = channel.result
+        self.progress["value"] = 100
+        self.status.config(
+            text=f"External sort completed | {stats['rows']:,} rows in {stats['runs']} run(s) | "
+                 f"Total Time: {total_time:.4f}s | {self.timer.summary()}"
+        )
+        messagebox.showinfo(
+            "External Sort Complete",
+            f"Sorted {stats['rows']:,} rows by {job['column']} ({stats['algorithm']} runs).\n\n"
+            f"Runs: {stats['runs']} of up to {job['memory_mb']} MB\n"
+            f"Total execution time: {total_time:.4f} seconds\n\n"
+            f"Saved to {job['dst']}"
+        )
+
+    # ---------- SCALING SWEEP ----------
+    def scaling_sweep(self):
+        """Time the selected algorithm on growing prefixes of the data and fit t(n) = a·n^b."""
+        if not self.data:
+            messagebox.showwarning("No Data", "Load a CSV file first.")
+            return
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+
+        self.stop_event.clear()
+        self.pause_event.set()
+        n = len(self.data)
+        job = {
+            "algorithm": self.algo_var.get(), "column": self.col_var.get(),
+            "backend": self.backend_var.get(),
+            "sizes": scaling.geometric_sizes(min(scaling.DEFAULT_START, n), n)
+        }
+        self.timer = PhaseTimer()
+        self.sort_running = True
+
+        channel = ProgressChannel()
+        threading.Thread(target=self.run_scaling_sweep, args=(channel, job), daemon=True).start()
+        poll_channel(
+            self.root, channel, lambda channel: self.show_sweep_progress(channel, job),
+            lambda channel: self.finish_scaling_sweep(channel, job)
+        )
+
+    def run_scaling_sweep(self, channel, job):
+        # Worker thread: no Tk calls here
+        def time_size(n):
+            order, seconds = BACKENDS[job["backend"]].run(
+                job["algorithm"], keys[:n], lambda done, total: None, self.pause_event, self.stop_event
+            )
+            return None if order is None else seconds
+
+        def point_done(n, seconds):
+            job["last"] = (n, seconds)
+            channel.report(job["sizes"].index(n) + 1, len(job["sizes"]))
+
+        try:
+            keys, _, _ = self.key_cache.get(self.data, job["column"])
+            with self.timer.phase("sweep"):
+                points = scaling.sweep(time_size, job["sizes"], on_point=point_done)
+            channel.finish(points)
+        except Exception as e:
+            channel.finish(error=e)
+
+    def show_sweep_progress(self, channel, job):
+        if self.stop_event.is_set():
+            return
+        if not self.pause_event.is_set():
+            self.status.config(text="Paused (time preserved)")
+            return
+        current, total = channel.state
+        self.progress["value"] = channel.percent
+        last = f" | Last: n = {job['last'][0]:,} in {job['last'][1]:.4f}s" if "last" in job else ""
+        self.status.config(
+            text=f"Scaling sweep... size {current} of {total}{last} | Elapsed: {self.timer.elapsed:.2f}s"
+        )
+
+    def finish_scaling_sweep(self, channel, job):
+        self.sort_running = False
+        if channel.error:
+            self.status.config(text="Failed")
+            messagebox.showerror("Scaling Sweep Error", str(channel.error))
+            return
+        if channel.result is None:
+            self.status.config(text="Stopped")
+            return
+
+        points = channel.result
+        self.progress["value"] = 100
+        label = f"{job['algorithm']} by {job['column']} ({job['backend']})"
+        try:
+            fit = scaling.PowerLawFit(points)
+        except ValueError as e:
+            self.status.config(text=f"Scaling sweep completed | {label} | No fit: {e}")
+            return
+
+        predictions = "\n".join(
+            f"  n = {n:>13,}: {scaling.format_duration(fit.predict(n))}" for n in scaling.DEFAULT_TARGETS
+        )
+        measured = "\n".join(f"  n = {n:>13,}: {seconds:.4f}s" for n, seconds in points)
+        self.status.config(
+            text=f"Scaling sweep completed | {label} | {fit.describe()} | "
+                 f"Predicted for 1M rows: {scaling.format_duration(fit.predict(1_000_000))}"
+        )
+        messagebox.showinfo(
+            "Scaling Sweep Complete",
+            f"{label}\n\nMeasured:\n{measured}\n\nFit: {fit.describe()}\n\nPredicted:\n{predictions}"
+        )
+
+        path = filedialog.asksaveasfilename(
+            title="Save curve data (Cancel to skip)", defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv"), ("JSON Files", "*.json")]
+        )
+        if path:
+            scaling.write_curves(path, {job["algorithm"]: points}, {job["algorithm"]: fit}, scaling.DEFAULT_TARGETS)
+
+    # ---------- EXPORT ----------
+    def export_results(self):
+        if not self.sorted_result:
+            messagebox.showwarning("No Data", "Nothing to export yet.")
+            return
+        if self.sort_running:
+            messagebox.showwarning("Busy", "Wait for the current sort to finish.")
+            return
+
+        path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=FILETYPES)
+        if not path:
+            return
+
+        phases = dict(self.last_run.get("phases", {}))
+        if self.load_seconds is not None:
+            phases = {"load": {"wall_s": round(self.load_seconds, 6), "cpu_s": None}, **phases}
+        # Written once (sidecar or file header), not repeated on every row
+        meta = {
+            "algorithm": self.last_run["algorithm"],
+            "column": self.last_run["column"],
+            "backend": self.last_run["backend"],
+            "records_processed": self.last_run["rows"],
+            "top_k": self.last_run.get("top_k"),
+            "operation_counts": self.last_run.get("op_counts"),
+            "verification": self.last_run.get("verification"),
+            "execution_seconds": round(self.last_run.get("total_seconds", 0.0), 4),
+            "phases": phases,
+            "source_file": self.loaded_file,
+            "exported_at": datetime.now().isoformat(timespec="seconds")
+        }
+
+        self.stop_event.clear()
+        self.pause_event.set()
+        self.sort_running = True
+        self.timer = PhaseTimer()
+        channel = ProgressChannel()
+        threading.Thread(target=self.run_export, args=(channel, path, meta), daemon=True).start()
+        poll_channel(
+            self.root, channel, self.show_export_progress,
+            lambda channel: self.finish_export(channel, path)
+        )
+
+    def run_export(self, channel, path, meta):
+        # Worker thread: no Tk calls here
+        try:
+            with self.timer.phase("export"):
+                meta_path = export_results(
+                    self.sorted_result, path, meta, progress=channel.report, stop_event=self.stop_event
+                )
+            channel.finish(meta_path)
+        except Exception as e:
+            channel.finish(error=e)
+
+    def show_export_progress(self, channel):
+        if self.stop_event.is_set():
+            return
+        current, total = channel.state
+        self.progress["value"] = channel.percent
+        self.status.config(text=f"Exporting... {current:,} / {total:,} rows | Elapsed: {self.timer.elapsed:.2f}s")
+
+    def finish_export(self, channel, path):
+        self.sort_running = False
+        self.progress["value"] = 100
+        if channel.error:
+            self.status.config(text="Export failed")
+            messagebox.showerror("Export Error", str(channel.error))
+            return
+        if channel.result is None:
+            self.status.config(text="Export stopped")
+            return
+
+        self.status.config(
+            text=f"Exported {len(self.sorted_result):,} rows ({export_format(path)}) in {self.timer.seconds('export'):.4f}s"
+        )
+        details = "" if channel.result == path else f"\nRun details: {os.path.basename(channel.result)}"
+        messagebox.showinfo("Exported", f"Results exported successfully to {os.path.basename(path)}.{details}")
+
+
+# ===================== RUN =====================
+def main():
+    root = tk.Tk()
+    SortingBenchmarkGUI(root)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Progress reporting between sort workers and the Tk UI.
+
+Workers never touch Tk. They call ProgressChannel.report(), which only
+stores a (current, total) tuple. A single attribute assignment is atomic
+under the GIL, so no lock or queue is needed. The UI polls the channel
+from root.after at a fixed frame rate, so the cost of redrawing is
+bounded by the frame rate rather than by how often the algorithm reports.
+"""
+import time
+
+FRAME_MS = 33  # ~30 UI updates per second
+
+
+class ProgressChannel:
+    """Single-writer progress state for one background job."""
+
+    def __init__(self):
+        self.state = (0, 0)
+        self.done = False
+        self.result = None
+        self.error = None
+        self.started = time.perf_counter()
+
+    def report(self, current, total):
+        """Progress callback for SortingAlgorithms; safe to call very often."""
+        self.state = (current, total)
+
+    def finish(self, result=None, error=None):
+        """Called once by the worker; result/error are set before done."""
+        self.result = result
+        self.error = error
+        self.done = True
+
+    @property
+    def percent(self):
+        current, total = self.state
+        return 100.0 * current / total if total else 0.0
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+def poll_channel(root, channel, on_update, on_done, interval_ms=FRAME_MS):
+    """
+    Drive on_update(channel) from the Tk event loop every interval_ms until
+    the worker finishes, then call on_done(channel) once, on the Tk thread.
+    """
+    def tick():
+        if channel.done:
+            on_done(channel)
+            return
+        on_update(channel)
+        root.after(interval_ms, tick)
+
+    root.after(interval_ms, tick)
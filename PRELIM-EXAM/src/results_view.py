@@ -0,0 +1,132 @@
+"""
+Paged (virtualized) view of a sorted result.
+
+A ttk.Treeview slows down badly with hundreds of thousands of items, so
+only one page of rows ever exists as Tk items. Scrolling, paging and
+jump-to-rank just refill those items from the result table, which costs
+the same for 10 rows as for 10 million. The scrollbar is driven by hand
+to reflect the position in the whole result.
+"""
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+COLUMNS = ("Rank", "ID", "First Name", "Last Name")
+WHEEL_ROWS = 3  # rows scrolled per mouse wheel step
+
+
+class ResultsView:
+    """Rank/ID/name table over any sliceable sequence of Records."""
+
+    def __init__(self, parent, page_size=10):
+        self.page_size = page_size
+        self.rows = []
+        self.first = 0  # index of the top visible row
+
+        self.frame = ttk.Frame(parent)
+
+        table = ttk.Frame(self.frame)
+        table.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(table, columns=COLUMNS, show="headings", height=page_size)
+        for col in COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, anchor="center", width=150)
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.on_scroll)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self.on_wheel)
+
+        nav = ttk.Frame(self.frame)
+        nav.pack(fill="x", pady=(6, 0))
+        ttk.Button(nav, text="⏮", width=3, command=lambda: self.scroll_to(0)).pack(side="left")
+        ttk.Button(nav, text="◀ Prev", command=lambda: self.scroll_by(-self.page_size)).pack(side="left", padx=4)
+        ttk.Button(nav, text="Next ▶", command=lambda: self.scroll_by(self.page_size)).pack(side="left", padx=4)
+        ttk.Button(nav, text="⏭", width=3, command=lambda: self.scroll_to(len(self.rows))).pack(side="left")
+        self.position = ttk.Label(nav, text="No results")
+        self.position.pack(side="left", padx=12)
+
+        ttk.Button(nav, text="Go", command=self.jump_to_rank).pack(side="right")
+        self.rank_var = tk.StringVar()
+        rank_entry = ttk.Entry(nav, textvariable=self.rank_var, width=10)
+        rank_entry.pack(side="right", padx=4)
+        rank_entry.bind("<Return>", lambda event: self.jump_to_rank())
+        ttk.Label(nav, text="Go to rank:").pack(side="right")
+
+        self.render()
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_rows(self, rows):
+        """Show a new result from the top; rows is only read a page at a time."""
+        self.rows = rows
+        self.first = 0
+        self.render()
+
+    def clear(self):
+        self.set_rows([])
+
+    # ---------- NAVIGATION ----------
+    def scroll_to(self, first):
+        last_page = max(0, len(self.rows) - self.page_size)
+        first = min(max(0, first), last_page)
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def scroll_by(self, delta):
+        self.scroll_to(self.first + delta)
+
+    def on_scroll(self, action, amount, unit=None):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * len(self.rows)))
+        elif action == "scroll":
+            step = self.page_size if unit == "pages" else 1
+            self.scroll_by(int(amount) * step)
+
+    def on_wheel(self, event):
+        # Windows/macOS report a signed delta, X11 reports buttons 4 and 5
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_by(-WHEEL_ROWS)
+        else:
+            self.scroll_by(WHEEL_ROWS)
+        return "break"
+
+    def jump_to_rank(self):
+        try:
+            rank = int(self.rank_var.get())
+        except ValueError:
+            rank = 0
+        if not 1 <= rank <= len(self.rows):
+            messagebox.showwarning("Invalid Rank", f"Enter a rank between 1 and {len(self.rows):,}.")
+            return
+        self.scroll_to(rank - 1)
+        # Highlight the requested row, wherever it landed on the page
+        items = self.tree.get_children()
+        self.tree.selection_set(items[rank - 1 - self.first])
+
+    # ---------- DRAWING ----------
+    def render(self):
+        page = self.rows[self.first:self.first + self.page_size]
+        items = self.tree.get_children()
+        if len(items) > len(page):
+            self.tree.delete(*items[len(page):])
+
+        # Reuse the existing items; only their values change while scrolling
+        for offset, r in enumerate(page):
+            values = (self.first + offset + 1, r.id, r.first_name, r.last_name)
+            if offset < len(items):
+                self.tree.item(items[offset], values=values)
+            else:
+                self.tree.insert("", "end", values=values)
+        self.tree.selection_set(())
+
+        total = len(self.rows)
+        if total:
+            self.scrollbar.set(self.first / total, (self.first + len(page)) / total)
+            self.position.config(text=f"Rows {self.first + 1:,}–{self.first + len(page):,} of {total:,}")
+        else:
+            self.scrollbar.set(0, 1)
+            self.position.config(text="No results")
@@ -1,364 +1,645 @@
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-import csv, time, threading
+import csv, heapq, io, os, sys, threading, time
+from array import array
 from dataclasses import dataclass
-from typing import List
+
+# Shared helpers live in sortlab/ at the repository root
+sys.path.insert(0, os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))
+from sortlab.cache import default_cache
+from sortlab.external import DEFAULT_MEMORY_MB, external_sort
+from sortlab.generate import DEFAULT_SEED, cached_records
+from sortlab.instrument import run_counted
+from sortlab.parallel import chunk_bounds, kway_merge, sort_chunks
+from sortlab import kernels, radix
 
 
 # ===================== DATA MODEL =====================
 @dataclass
 class Record:
+    __slots__ = ("id", "first_name", "last_name")
     id: int
     first_name: str
     last_name: str
 
 
+class StringPool:
+    """Dictionary encoding for a string column: each distinct value is stored once."""
+
+    def __init__(self):
+        self.values = []   # code -> interned string
+        self.codes = {}    # string -> code
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            value = sys.intern(value)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+
+class RecordTable:
+    """
+    Column-oriented store for Records.
+
+    IDs are kept in an array('q') and each name column as an array('I') of
+    codes into a StringPool, so a row costs 16 bytes plus its share of the
+    distinct names instead of a full object. Indexing or iterating yields
+    Record rows built on demand; slicing and take() return new tables that
+    share the string pools.
+
+    To sort a table, run an algorithm on its row positions with the key
+    column from key_column(), then gather the rows with take(order).
+    """
+
+    def __init__(self, ids=None, first_codes=None, last_codes=None, first_pool=None, last_pool=None):
+        self.ids = ids if ids is not None else array("q")
+        self.first_codes = first_codes if first_codes is not None else array("I")
+        self.last_codes = last_codes if last_codes is not None else array("I")
+        self.first_pool = first_pool if first_pool is not None else StringPool()
+        self.last_pool = last_pool if last_pool is not None else StringPool()
+
+    # Columns are appended IDs last, so len() only counts complete rows.
+    def append(self, id, first_name, last_name):
+        self.first_codes.append(self.first_pool.encode(first_name))
+        self.last_codes.append(self.last_pool.encode(last_name))
+        self.ids.append(id)
+
+    def extend(self, rows):
+        """Append (id, first_name, last_name) tuples."""
+        ids, first_codes, last_codes = self.ids, self.first_codes, self.last_codes
+        encode_first, encode_last = self.first_pool.encode, self.last_pool.encode
+        for id, first_name, last_name in rows:
+            first_codes.append(encode_first(first_name))
+            last_codes.append(encode_last(last_name))
+            ids.append(id)
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ---------- Binary form (see sortlab.columnar) ----------
+    def to_columns(self):
+        """Returns (columns, strings) for write_columns / DatasetCache.store."""
+        n = len(self)
+        columns = {"ids": self.ids[:n], "first_codes": self.first_codes[:n], "last_codes": self.last_codes[:n]}
+        strings = {"first_names": list(self.first_pool.values), "last_names": list(self.last_pool.values)}
+        return columns, strings
+
+    def load_columns(self, columns, strings):
+        """Replace the contents with columns read back from to_columns()."""
+        first_pool, last_pool = StringPool(), StringPool()
+        for pool, values in ((first_pool, strings["first_names"]), (last_pool, strings["last_names"])):
+            pool.values = list(map(sys.intern, values))
+            pool.codes = {value: code for code, value in enumerate(pool.values)}
+        self.first_pool, self.last_pool = first_pool, last_pool
+        self.first_codes = columns["first_codes"]
+        self.last_codes = columns["last_codes"]
+        self.ids = columns["ids"]  # last, so len() never counts rows without names
+        return self
+
+    def _with_columns(self, ids, first_codes, last_codes):
+        return RecordTable(ids, first_codes, last_codes, self.first_pool, self.last_pool)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._with_columns(self.ids[index], self.first_codes[index], self.last_codes[index])
+        return Record(
+            self.ids[index],
+            self.first_pool.values[self.first_codes[index]],
+            self.last_pool.values[self.last_codes[index]]
+        )
+
+    def __iter__(self):
+        for row in self.rows():
+            yield Record(*row)
+
+    def rows(self):
+        """Yields (id, first_name, last_name) tuples without building Records."""
+        first_names, last_names = self.first_pool.values, self.last_pool.values
+        for id, first, last in zip(self.ids, self.first_codes, self.last_codes):
+            yield id, first_names[first], last_names[last]
+
+    def take(self, order):
+        """New table holding the rows at the given positions, in that order."""
+        ids, first_codes, last_codes = self.ids, self.first_codes, self.last_codes
+        return self._with_columns(
+            array("q", [ids[i] for i in order]),
+            array("I", [first_codes[i] for i in order]),
+            array("I", [last_codes[i] for i in order])
+        )
+
+    def key_column(self, column, start=0):
+        """
+        Sort keys for rows start.., matching KEY_FUNCS[column] on the Records.
+        Names are lowercased once per distinct value, not once per row.
+
+        Safe to call while another thread is appending rows: only rows
+        already counted by len() are included.
+        """
+        n = len(self)
+        if column == "ID":
+            return self.ids[start:n].tolist()
+        if column == "FirstName":
+            pool, codes = self.first_pool, self.first_codes[start:n]
+        elif column == "LastName":
+            pool, codes = self.last_pool, self.last_codes[start:n]
+        else:
+            raise KeyError(column)
+        # Codes are snapshotted before the pool, so every code is in range
+        lowered = [value.lower() for value in pool.values]
+        return list(map(lowered.__getitem__, codes))
+
+
+# ===================== KEY EXTRACTION =====================
+KEY_FUNCS = {
+    "ID": lambda r: r.id,
+    "FirstName": lambda r: r.first_name.lower(),
+    "LastName": lambda r: r.last_name.lower()
+}
+
+
+def key_column(data, key):
+    """
+    Decorate step: a fresh list of sort keys aligned with data.
+
+    key is either a function applied once per item, or a key column that
+    was already built (e.g. by KeyCache), which is just copied.
+    """
+    if callable(key):
+        return list(map(key, data))
+    return list(key)
+
+
+def rank_keys(keys):
+    """
+    Replace each key by its rank among the distinct keys. Ranks sort in the
+    same order, with the same ties, as the original keys, but are small ints.
+    """
+    ranks = {key: rank for rank, key in enumerate(sorted(set(keys)))}
+    return list(map(ranks.__getitem__, keys))
+
+
+def integer_keys(keys):
+    """keys if they are all ints, else their ranks (as the process backend uses)."""
+    if all(isinstance(k, int) for k in keys):
+        return keys
+    return rank_keys(keys)
+
+
+class KeyCache:
+    """
+    Builds each (dataset, column) key column once and reuses it across runs.
+    If the dataset has grown since (e.g. it is still loading), only the keys
+    for the new rows are built and appended.
+    """
+
+    def __init__(self):
+        self._data = None
+        self._columns = {}
+
+    def get(self, data, column):
+        """
+        Returns:
+            Tuple of (keys, build time in seconds, whether it was cached)
+        """
+        if data is not self._data:
+            self._data = data
+            self._columns = {}
+        keys, build_time = self._columns.get(column, ([], 0.0))
+        if keys and len(keys) == len(data):
+            return keys, build_time, True
+
+        start = time.perf_counter()
+        if isinstance(data, RecordTable):
+            keys = keys + data.key_column(column, len(keys))
+        else:
+            keys = keys + key_column(data[len(keys):], KEY_FUNCS[column])
+        build_time = time.perf_counter() - start
+        self._columns[column] = (keys, build_time)
+        return keys, build_time, False
+
+
 # ===================== SORTING ALGORITHMS =====================
+# Every algorithm takes key as a function or a prebuilt key column, decorates
+# once, then compares plain keys and moves each record in step with its key.
 class SortingAlgorithms:
 
+    # The comparison sorts below are the shared sortlab kernels, specialized
+    # for ascending order on a precomputed key column
     @staticmethod
     def bubble_sort(data, key, progress, pause_event, stop_event):
-        arr = data.copy()
-        n = len(arr)
-        for i in range(n):
-            if stop_event.is_set():
-                return None
-            pause_event.wait()
-            for j in range(0, n - i - 1):
-                if key(arr[j]) > key(arr[j + 1]):
-                    arr[j], arr[j + 1] = arr[j + 1], arr[j]
-            progress(i + 1, n)
-        return arr
+        return run_kernel(kernels.classic_bubble_sort_ascending_keyed, data, key, progress, pause_event, stop_event)
+
+    @staticmethod
+    def early_exit_bubble_sort(data, key, progress, pause_event, stop_event):
+        return run_kernel(kernels.bubble_sort_ascending_keyed, data, key, progress, pause_event, stop_event)
+
+    @staticmethod
+    def cocktail_shaker_sort(data, key, progress, pause_event, stop_event):
+        return run_kernel(kernels.cocktail_shaker_sort_ascending_keyed, data, key, progress, pause_event, stop_event)
 
     @staticmethod
     def insertion_sort(data, key, progress, pause_event, stop_event):
-        arr = data.copy()
-        n = len(arr)
-        for i in range(1, n):
-            if stop_event.is_set():
-                return None
-            pause_event.wait()
-            cur = arr[i]
-            j = i - 1
-            while j >= 0 and key(arr[j]) > key(cur):
-                arr[j + 1] = arr[j]
-                j -= 1
-            arr[j + 1] = cur
-            progress(i + 1, n)
-        return arr
+        return run_kernel(kernels.insertion_sort_ascending_keyed, data, key, progress, pause_event, stop_event)
+
+    @staticmethod
+    def binary_insertion_sort(data, key, progress, pause_event, stop_event):
+        return run_kernel(kernels.binary_insertion_sort_ascending_keyed, data, key, progress, pause_event, stop_event)
+
+    @staticmethod
+    def ciura_shell_sort(data, key, progress, pause_event, stop_event):
+        return run_kernel(kernels.shell_sort_ciura_ascending_keyed, data, key, progress, pause_event, stop_event)
+
+    @staticmethod
+    def sedgewick_shell_sort(data, key, progress, pause_event, stop_event):
+        return run_kernel(kernels.shell_sort_sedgewick_ascending_keyed, data, key, progress, pause_event, stop_event)
 
     @staticmethod
     def merge_sort(data, key, progress, pause_event, stop_event):
-        total = len(data)
-        completed = [0]  # Use list to allow modification in nested function
-        update_interval = max(1, total // 100)  # Update progress bar 100 times
-        
-        def merge(left, right):
-            result = []
-            while left and right:
-                pause_event.wait()
-                if stop_event.is_set():
-                    return []
-                if key(left[0]) <= key(right[0]):
-                    result.append(left.pop(0))
-                else:
-                    result.append(right.pop(0))
-            result.extend(left)
-            result.extend(right)
-            return result
+        return run_kernel(kernels.merge_sort_ascending_keyed, data, key, progress, pause_event, stop_event)
 
-        def sort(arr):
+    @staticmethod
+    def parallel_merge_sort(data, key, progress, pause_event, stop_event):
+        # One contiguous chunk per core is merge sorted in a process pool,
+        # then the sorted runs are combined with a heap-based k-way merge.
+        keys = key_column(data, key)
+        n = len(keys)
+        bounds = chunk_bounds(n)
+        if len(bounds) == 1:
+            return SortingAlgorithms.merge_sort(data, keys, progress, pause_event, stop_event)
+
+        # Progress: n units for sorting the chunks, n more for the merge.
+        # Pause/stop apply between chunks and during the merge.
+        total = 2 * n
+        sorted_so_far = [0]
+
+        def chunk_done(index, run):
+            sorted_so_far[0] += len(run)
+            progress(sorted_so_far[0], total)
             pause_event.wait()
-            if stop_event.is_set():
-                return []
-            if len(arr) <= 1:
-                completed[0] += len(arr)
-                if completed[0] % update_interval == 0:
-                    progress(completed[0], total)
-                return arr
-            mid = len(arr) // 2
-            left_sorted = sort(arr[:mid])
-            right_sorted = sort(arr[mid:])
-            merged = merge(left_sorted, right_sorted)
-            
-            # Update progress after merge
-            if len(merged) > 1:
-                if completed[0] % update_interval == 0:
-                    progress(completed[0], total)
-            
-            return merged
-
-        result = sort(data.copy())
+            return not stop_event.is_set()
+
+        runs = sort_chunks(merge_sort_chunk, [(start, keys[start:end]) for start, end in bounds], chunk_done)
+        if runs is None:
+            return None
+
+        result = []
+        append = result.append
+        update_interval = max(1, n // 100)
+        for count, position in enumerate(kway_merge(runs, key=keys.__getitem__), 1):
+            append(data[position])
+            if count % update_interval == 0:
+                progress(n + count, total)
+                pause_event.wait()
+                if stop_event.is_set():
+                    return None
         progress(total, total)
         return result
 
+    @staticmethod
+    def radix_sort(data, key, progress, pause_event, stop_event):
+        # Stable LSD radix sort; digit width follows the key range. Name
+        # columns are sorted by their ranks, since radix needs integer keys.
+        keys = integer_keys(key_column(data, key))
+        return radix.radix_sort(data, keys, progress=step_reporter(progress, pause_event, stop_event))
 
-# ===================== GUI =====================
-class SortingBenchmarkGUI:
-
-    def __init__(self, root):
-        self.root = root
-        self.root.title("Sorting Algorithm Stress Test")
-        self.root.geometry("1000x760")
-
-        self.data: List[Record] = []
-        self.sorted_result: List[Record] = []
-        self.loaded_file = None
-
-        self.pause_event = threading.Event()
-        self.pause_event.set()
-        self.stop_event = threading.Event()
-
-        self.start_time = None
-        self.end_time = None
-
-        self.setup_style()
-        self.build_ui()
-
-    # ---------- STYLE ----------
-    def setup_style(self):
-        style = ttk.Style()
-        style.theme_use("clam")
-
-        BG = "#f7f9fc"
-        FG = "#1f2933"
-        ACCENT = "#2563eb"
-        BORDER = "#d1d5db"
-
-        self.root.configure(bg=BG)
-
-        style.configure(".", background=BG, foreground=FG, font=("Segoe UI", 10))
-        style.configure("Title.TLabel", font=("Segoe UI Semibold", 17), foreground=ACCENT)
-        style.configure("TButton", padding=(12, 6), background=ACCENT, foreground="white")
-        style.map("TButton", background=[("active", "#1d4ed8")])
-        style.configure("TProgressbar", thickness=12, troughcolor=BORDER, background=ACCENT)
-
-    # ---------- UI ----------
-    def build_ui(self):
-        container = ttk.Frame(self.root, padding=20)
-        container.pack(expand=True, fill="both")
-
-        ttk.Label(
-            container,
-            text="Sorting Algorithm Stress Test – Benchmarking Tool",
-            style="Title.TLabel"
-        ).pack(pady=(0, 20))
-
-        # Top controls
-        controls = ttk.Frame(container)
-        controls.pack()
-
-        ttk.Button(controls, text="Load CSV", command=self.load_csv).grid(row=0, column=0, padx=6)
-
-        ttk.Label(controls, text="Rows:").grid(row=0, column=1)
-        self.rows_var = tk.StringVar(value="1000")
-        ttk.Entry(controls, textvariable=self.rows_var, width=8).grid(row=0, column=2)
-
-        ttk.Label(controls, text="Column:").grid(row=0, column=3)
-        self.col_var = tk.StringVar(value="ID")
-        ttk.Combobox(
-            controls,
-            textvariable=self.col_var,
-            values=["ID", "FirstName", "LastName"],
-            state="readonly",
-            width=12
-        ).grid(row=0, column=4)
-
-        ttk.Label(controls, text="Algorithm:").grid(row=0, column=5)
-        self.algo_var = tk.StringVar(value="Merge Sort")
-        ttk.Combobox(
-            controls,
-            textvariable=self.algo_var,
-            values=["Bubble Sort", "Insertion Sort", "Merge Sort"],
-            state="readonly",
-            width=14
-        ).grid(row=0, column=6)
-
-        # Action buttons
-        action_buttons = ttk.Frame(container)
-        action_buttons.pack(pady=12)
-
-        ttk.Button(action_buttons, text="▶ Start", command=self.start_sort).grid(row=0, column=0, padx=6)
-        ttk.Button(action_buttons, text="⏸ Pause", command=self.pause_sort).grid(row=0, column=1, padx=6)
-        ttk.Button(action_buttons, text="⏹ Stop", command=self.stop_sort).grid(row=0, column=2, padx=6)
-
-        self.progress = ttk.Progressbar(container, mode="determinate")
-        self.progress.pack(fill="x", pady=(10, 5))
-
-        self.status = ttk.Label(container, text="Ready")
-        self.status.pack(anchor="w")
-
-        self.file_label = ttk.Label(container, text="No file loaded", foreground="#6b7280")
-        self.file_label.pack(anchor="w", pady=(2, 0))
-
-        # Table
-        self.tree = ttk.Treeview(
-            container,
-            columns=("Rank", "ID", "First Name", "Last Name"),
-            show="headings",
-            height=10
-        )
-
-        for col in ("Rank", "ID", "First Name", "Last Name"):
-            self.tree.heading(col, text=col)
-            self.tree.column(col, anchor="center", width=150)
-
-        self.tree.pack(fill="both", expand=True, pady=15)
-
-        # Bottom buttons
-        bottom_buttons = ttk.Frame(container)
-        bottom_buttons.pack(pady=5)
-
-        ttk.Button(bottom_buttons, text="🧹 Clear Results", command=self.clear_results).grid(row=0, column=0, padx=8)
-        ttk.Button(bottom_buttons, text="⬇ Export CSV", command=self.export_csv).grid(row=0, column=1, padx=8)
-
-    # ---------- LOGIC ----------
-    def load_csv(self):
-        path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
-        if not path:
-            return
-        try:
-            with open(path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                self.data = [
-                    Record(int(r["ID"]), r["FirstName"], r["LastName"])
-                    for r in reader
-                ]
-            import os
-            self.loaded_file = os.path.basename(path)
-            self.file_label.config(text=f"Loaded file: {self.loaded_file}")
-            messagebox.showinfo("Loaded", f"{len(self.data):,} records loaded from:\n{self.loaded_file}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-
-    def key_func(self):
-        return {
-            "ID": lambda r: r.id,
-            "FirstName": lambda r: r.first_name.lower(),
-            "LastName": lambda r: r.last_name.lower()
-        }[self.col_var.get()]
-
-    def update_progress(self, current, total):
-        elapsed = time.time() - self.start_time
-        percent = (current / total) * 100
-        self.progress["value"] = percent
-        self.status.config(
-            text=f"Processing... {percent:.1f}% | Elapsed: {elapsed:.2f}s"
-        )
-        self.root.update_idletasks()
-
-    def start_sort(self):
-        if not self.data:
-            messagebox.showwarning("No Data", "Load a CSV file first.")
-            return
-
-        self.clear_results()
-        self.stop_event.clear()
-        self.pause_event.set()
-
-        self.start_time = time.time()
-        self.end_time = None
+    @staticmethod
+    def counting_sort(data, key, progress, pause_event, stop_event):
+        # Stable counting sort; very wide key ranges (e.g. raw IDs) fall back
+        # to radix sort, see sortlab/radix.py
+        keys = integer_keys(key_column(data, key))
+        return radix.counting_sort(data, keys, progress=step_reporter(progress, pause_event, stop_event))
 
-        threading.Thread(target=self.run_sort, daemon=True).start()
+    @staticmethod
+    def intro_sort(data, key, progress, pause_event, stop_event):
+        # Quicksort with a median-of-three pivot and three-way (Dutch flag)
+        # partitioning, so a run of equal names is finished in one pass.
+        # Ranges that recurse too deep are heapsorted and small ones are
+        # insertion sorted. Sorts in place with an O(log n) range stack.
+        arr = data.copy()
+        keys = key_column(data, key)
+        n = len(arr)
+        update_interval = max(1, n // 100)
+        next_update = update_interval
+        placed = 0  # items known to be in their final position
+
+        stack = [(0, n, 2 * n.bit_length())]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= INTRO_SMALL_RANGE:
+                insertion_sort_range(keys, arr, lo, hi)
+                placed += hi - lo
+            elif depth == 0:
+                heap_sort_range(keys, arr, lo, hi)
+                placed += hi - lo
+            else:
+                a, b, c = keys[lo], keys[(lo + hi) // 2], keys[hi - 1]
+                if a > b:
+                    a, b = b, a
+                pivot = a if c < a else (c if c < b else b)
+
+                # keys[lo:lt] < pivot, keys[lt:i] == pivot, keys[gt:hi] > pivot
+                lt, i, gt = lo, lo, hi
+                while i < gt:
+                    k = keys[i]
+                    if k < pivot:
+                        keys[i], keys[lt] = keys[lt], k
+                        arr[i], arr[lt] = arr[lt], arr[i]
+                        lt += 1
+                        i += 1
+                    elif k > pivot:
+                        gt -= 1
+                        keys[i], keys[gt] = keys[gt], k
+                        arr[i], arr[gt] = arr[gt], arr[i]
+                    else:
+                        i += 1
+                placed += gt - lt
+
+                # Smaller side on top, so the stack stays O(log n) deep
+                if lt - lo < hi - gt:
+                    stack.append((gt, hi, depth - 1))
+                    stack.append((lo, lt, depth - 1))
+                else:
+                    stack.append((lo, lt, depth - 1))
+                    stack.append((gt, hi, depth - 1))
 
-    def pause_sort(self):
-        if self.pause_event.is_set():
-            self.pause_event.clear()
-            self.status.config(text="Paused (time preserved)")
-        else:
-            self.pause_event.set()
-
-    def stop_sort(self):
-        self.stop_event.set()
-        self.pause_event.set()
-        self.status.config(text="Stopped")
-
-    def run_sort(self):
-        n = min(int(self.rows_var.get()), len(self.data))
-        subset = self.data[:n]
-
-        algo_map = {
-            "Bubble Sort": SortingAlgorithms.bubble_sort,
-            "Insertion Sort": SortingAlgorithms.insertion_sort,
-            "Merge Sort": SortingAlgorithms.merge_sort
-        }
-
-        self.sorted_result = algo_map[self.algo_var.get()](
-            subset,
-            self.key_func(),
-            self.update_progress,
-            self.pause_event,
-            self.stop_event
-        )
+            if placed >= next_update:
+                next_update = placed + update_interval
+                progress(placed, n)
+                pause_event.wait()
+                if stop_event.is_set():
+                    return None
 
-        if self.sorted_result is None:
-            self.sorted_result = []  # Reset to empty list instead of leaving as None
-            return
+        progress(n, n)
+        return arr
 
-        self.end_time = time.time()
-        total_time = self.end_time - self.start_time
+    @staticmethod
+    def heap_sort(data, key, progress, pause_event, stop_event):
+        # In place: build a max-heap, then repeatedly move its root behind it
+        arr = data.copy()
+        keys = key_column(data, key)
+        n = len(arr)
+        for root in range(n // 2 - 1, -1, -1):
+            sift_down(keys, arr, 0, root, n)
+
+        update_interval = max(1, n // 100)
+        for end in range(n - 1, 0, -1):
+            keys[0], keys[end] = keys[end], keys[0]
+            arr[0], arr[end] = arr[end], arr[0]
+            sift_down(keys, arr, 0, 0, end)
+            if (n - end) % update_interval == 0:
+                progress(n - end, n)
+                pause_event.wait()
+                if stop_event.is_set():
+                    return None
 
-        for i, r in enumerate(self.sorted_result[:10], 1):
-            self.tree.insert("", "end", values=(i, r.id, r.first_name, r.last_name))
+        progress(n, n)
+        return arr
 
-        self.status.config(text=f"Completed | Total Time: {total_time:.4f}s")
 
-        messagebox.showinfo(
-            "Sorting Complete",
-            f"{self.algo_var.get()} completed.\n\n"
-            f"Records processed: {n:,}\n"
-            f"Total execution time: {total_time:.4f} seconds"
-        )
+INTRO_SMALL_RANGE = 16  # intro_sort insertion sorts ranges this small
+
+
+def insertion_sort_range(keys, arr, lo, hi):
+    """Insertion sort keys[lo:hi], moving arr in tandem."""
+    for i in range(lo + 1, hi):
+        cur, cur_key = arr[i], keys[i]
+        j = i - 1
+        while j >= lo and keys[j] > cur_key:
+            arr[j + 1] = arr[j]
+            keys[j + 1] = keys[j]
+            j -= 1
+        arr[j + 1] = cur
+        keys[j + 1] = cur_key
+
+
+def sift_down(keys, arr, lo, root, end):
+    """Restore the max-heap property below root; the heap is keys[lo:end]."""
+    root_key, root_item = keys[root], arr[root]
+    child = 2 * root - lo + 1
+    while child < end:
+        if child + 1 < end and keys[child] < keys[child + 1]:
+            child += 1
+        if not root_key < keys[child]:
+            break
+        keys[root], arr[root] = keys[child], arr[child]
+        root = child
+        child = 2 * root - lo + 1
+    keys[root], arr[root] = root_key, root_item
+
+
+def heap_sort_range(keys, arr, lo, hi):
+    """Heapsort keys[lo:hi] in place, moving arr in tandem."""
+    for root in range(lo + (hi - lo) // 2 - 1, lo - 1, -1):
+        sift_down(keys, arr, lo, root, hi)
+    for end in range(hi - 1, lo, -1):
+        keys[lo], keys[end] = keys[end], keys[lo]
+        arr[lo], arr[end] = arr[end], arr[lo]
+        sift_down(keys, arr, lo, lo, end)
+
+
+def step_reporter(progress, pause_event, stop_event):
+    """progress callback for sortlab engines: reports, honours pause, False once stopped."""
+    def step(done, total):
+        progress(done, total)
+        pause_event.wait()
+        return not stop_event.is_set()
+    return step
+
+
+def run_kernel(kernel, data, key, progress, pause_event, stop_event):
+    """Sort a copy of data with a keyed sortlab kernel, reporting through step_reporter."""
+    return kernel(key_column(data, key), data.copy(), step_reporter(progress, pause_event, stop_event))
+
+
+_RUNNING = threading.Event()
+_RUNNING.set()
+_NEVER_STOPPED = threading.Event()
+
+
+def merge_sort_chunk(chunk):
+    """Process-pool task: merge sort one (start, keys) chunk into global positions."""
+    start, keys = chunk
+    positions = list(range(start, start + len(keys)))
+    return SortingAlgorithms.merge_sort(positions, keys, lambda done, total: None, _RUNNING, _NEVER_STOPPED)
+
+
+# ===================== REGISTRY =====================
+ALGORITHMS = {
+    "Bubble Sort": SortingAlgorithms.bubble_sort,
+    "Early Exit Bubble Sort": SortingAlgorithms.early_exit_bubble_sort,
+    "Cocktail Shaker Sort": SortingAlgorithms.cocktail_shaker_sort,
+    "Insertion Sort": SortingAlgorithms.insertion_sort,
+    "Binary Insertion Sort": SortingAlgorithms.binary_insertion_sort,
+    "Ciura Shell Sort": SortingAlgorithms.ciura_shell_sort,
+    "Sedgewick Shell Sort": SortingAlgorithms.sedgewick_shell_sort,
+    "Merge Sort": SortingAlgorithms.merge_sort,
+    "Parallel Merge Sort": SortingAlgorithms.parallel_merge_sort,
+    "Radix Sort": SortingAlgorithms.radix_sort,
+    "Counting Sort": SortingAlgorithms.counting_sort,
+    "Intro Sort": SortingAlgorithms.intro_sort,
+    "Heap Sort": SortingAlgorithms.heap_sort
+}
+
+
+# ===================== OPERATION COUNTS =====================
+def count_operations(algorithm, keys, progress, pause_event=_RUNNING, stop_event=_NEVER_STOPPED):
+    """
+    Sort positions 0..n-1 by keys on instrumented inputs, on this thread.
+
+    Returns:
+        Tuple of (sorted positions or None if stopped, sortlab OpCounts)
+    """
+    def sort(data, counted_keys):
+        return ALGORITHMS[algorithm](data, counted_keys, progress, pause_event, stop_event)
+
+    order, counts = run_counted(sort, range(len(keys)), keys)
+    return (None if order is None else list(order)), counts
+
+
+# ===================== DATA LOADING =====================
+CSV_COLUMNS = ("ID", "FirstName", "LastName")
+
+
+def csv_column_indexes(header):
+    """Positions of the ID, FirstName and LastName columns in a header row."""
+    missing = [name for name in CSV_COLUMNS if name not in header]
+    if missing:
+        raise ValueError(f"CSV is missing column(s): {', '.join(missing)}")
+    return tuple(header.index(name) for name in CSV_COLUMNS)
+
+
+def load_records(path, cache=default_cache) -> RecordTable:
+    """Parse a dataset CSV, or map it back from the parsed-dataset cache."""
+    cached = cache.load(path, "records")
+    if cached:
+        columns, strings, _ = cached
+        return RecordTable().load_columns(columns, strings)
+
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        id_col, first_col, last_col = csv_column_indexes(next(reader, []))
+        table = RecordTable()
+        table.extend((int(r[id_col]), r[first_col], r[last_col]) for r in reader if r)
+    cache.store(path, "records", *table.to_columns())
+    return table
+
+
+def generated_records(n, seed=DEFAULT_SEED, cache=default_cache) -> RecordTable:
+    """n seeded rows shaped like generated_data.csv (see sortlab.generate), cached by parameters."""
+    return RecordTable().load_columns(*cached_records(n, seed, cache))
+
+
+# ===================== TOP K =====================
+def top_k_positions(keys, k):
+    """
+    Positions of the k smallest keys, in order (ties keep input order).
+    A bounded heap: O(n log k) time and O(k) memory, no full sort.
+    """
+    return heapq.nsmallest(k, range(len(keys)), key=keys.__getitem__)
+
+
+def top_k_csv(path, column, k, chunk_bytes=1 << 20, progress=None, pause_event=None, stop_event=None):
+    """
+    The first k rows of a dataset CSV by column, read as a stream.
+
+    Only the k best rows so far plus one chunk of the file are in memory at
+    a time, so the file is never loaded whole or fully sorted. Ties keep
+    file order. progress(bytes_read, total_bytes) is called per chunk.
+
+    Returns:
+        Tuple of (RecordTable of up to k rows, rows scanned), or None if stopped
+    """
+    index = CSV_COLUMNS.index(column)
+    row_key = (lambda r: r[0]) if column == "ID" else (lambda r: r[index].lower())
+    total = os.path.getsize(path)
+    best = []
+    scanned = 0
+
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8-sig")]), [])
+        id_col, first_col, last_col = csv_column_indexes(header)
+        while True:
+            lines = f.readlines(chunk_bytes)
+            if not lines:
+                break
+            reader = csv.reader(io.StringIO(b"".join(lines).decode("utf-8"), newline=""))
+            rows = [(int(r[id_col]), r[first_col], r[last_col]) for r in reader if r]
+            scanned += len(rows)
+            # Earlier rows come first, so ties keep file order
+            best = heapq.nsmallest(k, best + rows, key=row_key)
+            if progress:
+                progress(f.tell(), total)
+            if pause_event is not None:
+                pause_event.wait()
+            if stop_event is not None and stop_event.is_set():
+                return None
 
-    # ---------- CLEAR ----------
-    def clear_results(self):
-        self.tree.delete(*self.tree.get_children())
-        self.progress["value"] = 0
-        self.status.config(text="Ready")
-        # Fix: Check if sorted_result is not None before clearing
-        if self.sorted_result is not None:
-            self.sorted_result.clear()
-
-    # ---------- EXPORT ----------
-    def export_csv(self):
-        if not self.sorted_result:
-            messagebox.showwarning("No Data", "Nothing to export yet.")
-            return
-
-        path = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV Files", "*.csv")]
-        )
-        if not path:
-            return
-
-        total_time = self.end_time - self.start_time if self.end_time else 0
-
-        try:
-            with open(path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    "Rank", "ID", "First Name", "Last Name",
-                    "Algorithm", "Sorted Column",
-                    "Records Processed", "Execution Time (seconds)"
-                ])
-
-                for i, r in enumerate(self.sorted_result, 1):
-                    writer.writerow([
-                        i, r.id, r.first_name, r.last_name,
-                        self.algo_var.get(),
-                        self.col_var.get(),
-                        len(self.sorted_result),
-                        f"{total_time:.4f}"
-                    ])
-
-            messagebox.showinfo("Exported", "Results exported successfully.")
-        except Exception as e:
-            messagebox.showerror("Export Error", str(e))
+    table = RecordTable()
+    table.extend(best)
+    return table, scanned
+
+
+# ===================== EXTERNAL SORT =====================
+# Runs are large (a memory budget's worth of rows) and must keep ties in
+# input order for the merge to stay stable, so only stable O(n log n) or
+# linear sorts are used for them; radix/counting only for integer keys.
+EXTERNAL_RUN_ALGORITHMS = ("Merge Sort", "Parallel Merge Sort")
+EXTERNAL_RUN_INTEGER_ALGORITHMS = ("Radix Sort", "Counting Sort")
+
+
+def external_run_algorithm(algorithm, column):
+    """The algorithm external sort runs use: algorithm if it suits, otherwise Merge Sort."""
+    if algorithm in EXTERNAL_RUN_ALGORITHMS:
+        return algorithm
+    if algorithm in EXTERNAL_RUN_INTEGER_ALGORITHMS and column == "ID":
+        return algorithm
+    return "Merge Sort"
+
+
+def external_sort_records(src, dst, column, algorithm="Merge Sort", memory_mb=DEFAULT_MEMORY_MB,
+                          progress=None, pause_event=None, stop_event=None):
+    """
+    Sort a dataset CSV by column into dst without loading the whole file.
+
+    The file is split into sorted runs of about memory_mb each, which are
+    then merged straight into dst; see sortlab/external.py. Runs are sorted
+    with ALGORITHMS[algorithm] if external_run_algorithm() allows it, and
+    with Merge Sort otherwise. dst keeps the input's header and row format.
+    progress(phase, done, total) is called with phase "split" or "merge".
+
+    Returns:
+        Dict with "rows", "runs" and the run "algorithm", or None if stopped
+    """
+    algorithm = external_run_algorithm(algorithm, column)
+    with open(src, encoding="utf-8-sig", newline="") as f:
+        index = csv_column_indexes(next(csv.reader(f), []))[CSV_COLUMNS.index(column)]
+    if pause_event is None:
+        pause_event = threading.Event()
+        pause_event.set()
+    if stop_event is None:
+        stop_event = threading.Event()
+
+    def line_key(line):
+        # Same keys as KEY_FUNCS; only quoted rows need the csv module
+        text = line.decode("utf-8").rstrip("\r\n")
+        value = (next(csv.reader([text])) if '"' in text else text.split(","))[index]
+        return int(value) if column == "ID" else value.lower()
+
+    def sort_run(lines, keys):
+        return ALGORITHMS[algorithm](lines, keys, lambda done, total: None, pause_event, stop_event)
+
+    stats = external_sort(src, dst, line_key, header=True, memory_mb=memory_mb,
+                          sort_run=sort_run, progress=progress,
+                          pause_event=pause_event, stop_event=stop_event)
+    return None if stats is None else dict(stats, algorithm=algorithm)
 
 
 # ===================== RUN =====================
 if __name__ == "__main__":
-    root = tk.Tk()
-    SortingBenchmarkGUI(root)
-    root.mainloop()
\ No newline at end of file
+    # Any arguments mean a headless run; tkinter is only imported for the GUI.
+    if len(sys.argv) > 1:
+        from benchmark import main
+        sys.exit(main())
+    from gui import main
+    main()
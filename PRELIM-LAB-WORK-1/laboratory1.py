@@ -1,54 +1,72 @@
-import time
 import random
 import os
+import sys
 
-def bubble_sort(arr):
-    """
-    Sorts an array using the bubble sort algorithm (ascending order).
-    
-    Args:
-        arr: List of comparable elements to sort
-        
-    Returns:
-        Tuple of (sorted list, time taken in seconds)
-    """
-    start_time = time.time()
-    n = len(arr)
-    
-    # Traverse through all array elements
-    for i in range(n):
-        # Flag to optimize by detecting if array is already sorted
-        swapped = False
-        
-        # Last i elements are already in place
-        for j in range(0, n - i - 1):
-            # Swap if the element found is greater than the next element
-            if arr[j] > arr[j + 1]:
-                arr[j], arr[j + 1] = arr[j + 1], arr[j]
-                swapped = True
-        
-        # If no swaps occurred, array is sorted
-        if not swapped:
-            break
-    
-    end_time = time.time()
-    time_taken = end_time - start_time
-    
-    return arr, time_taken
+# Shared helpers live in sortlab/ at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from sortlab.external import DEFAULT_MEMORY_MB, print_progress, sort_int_file
+from sortlab.generate import DISTRIBUTIONS, cached_ints
+from sortlab.intio import load_ints, save_ints
+from sortlab import kernels
+from sortlab.timing import measure
+from sortlab.verify import verify_sorted
+from sortlab.vectorized import HAVE_NUMPY, IntDataset, as_dataset
 
-def generate_random_dataset(size=10000, min_val=1, max_val=100000):
+# Bubble sort and the adaptive variants offered by option 4; each does
+# less work the closer the input is to sorted (try a nearly-sorted dataset)
+VARIANTS = [
+    ("Bubble Sort", kernels.bubble_sort_ascending),
+    ("Classic Bubble Sort (no early exit)", kernels.classic_bubble_sort_ascending),
+    ("Cocktail Shaker Sort", kernels.cocktail_shaker_sort_ascending),
+    ("Binary Insertion Sort", kernels.binary_insertion_sort_ascending),
+    ("Shell Sort (Ciura gaps)", kernels.shell_sort_ciura_ascending),
+    ("Shell Sort (Sedgewick gaps)", kernels.shell_sort_sedgewick_ascending)
+]
+
+def generate_random_dataset(size=10000, min_val=1, max_val=100000, distribution="uniform", seed=None):
     """
-    Generate a random dataset of integers.
+    Generate a reproducible dataset of integers.
     
     Args:
         size: Number of elements to generate (default: 10000)
         min_val: Minimum value for random integers
         max_val: Maximum value for random integers
+        distribution: Input shape from sortlab.generate.DISTRIBUTIONS
+                      (uniform, sorted, reversed, nearly-sorted, ...)
+        seed: Random seed; the same seed and parameters give the same data
+              (default: a fresh random seed)
         
     Returns:
-        List of random integers
+        Tuple of (list of integers, seed used)
     """
-    return [random.randint(min_val, max_val) for _ in range(size)]
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    return cached_ints(distribution, size, seed, min_val, max_val), seed
+
+def choose_distribution():
+    """Ask for an input shape; Enter picks uniform"""
+    names = list(DISTRIBUTIONS)
+    print("Input distributions:")
+    for i, name in enumerate(names, 1):
+        print(f"  {i}. {name}")
+    choice = input(f"Choose distribution (1-{len(names)}, default 1): ").strip()
+    if choice.isdigit() and 1 <= int(choice) <= len(names):
+        return names[int(choice) - 1]
+    if choice:
+        print("⚠ Invalid choice, using uniform")
+    return "uniform"
+
+def choose_variant():
+    """Ask for a sort variant; Enter picks Bubble Sort"""
+    print("Sort variants:")
+    for i, (name, _) in enumerate(VARIANTS, 1):
+        print(f"  {i}. {name}")
+    choice = input(f"Choose variant (1-{len(VARIANTS)}, default 1): ").strip()
+    if choice.isdigit() and 1 <= int(choice) <= len(VARIANTS):
+        return VARIANTS[int(choice) - 1]
+    if choice:
+        print("⚠ Invalid choice, using Bubble Sort")
+    return VARIANTS[0]
 
 def find_data_file():
     """Search for data.txt in common locations"""
@@ -85,7 +103,7 @@ def find_data_file():
 
 def load_dataset_from_file(filename):
     """
-    Load dataset from a text file (one number per line).
+    Load dataset from a text file (one number per line) or a binary .i64 file.
     
     Args:
         filename: Path to the data file
@@ -94,13 +112,14 @@ def load_dataset_from_file(filename):
         List of integers or None if file not found
     """
     try:
-        with open(filename, 'r') as file:
-            data = []
-            for line in file:
-                line = line.strip()
-                if line:
-                    data.append(int(line))
-        return data
+        if HAVE_NUMPY:
+            # One vectorized parse (or cache/binary read) instead of a loop per line
+            try:
+                return IntDataset.from_file(filename).tolist()
+            except OverflowError:
+                pass  # values beyond int64: the pure-Python loader below
+        # Bulk parse (or cache/binary read), see sortlab/intio.py
+        return load_ints(filename)
     except FileNotFoundError:
         print(f"Error: {filename} not found!")
         return None
@@ -110,51 +129,91 @@ def load_dataset_from_file(filename):
 
 def save_dataset_to_file(data, filename):
     """
-    Save dataset to a text file (one number per line).
+    Save dataset to a text file (one number per line), or to a compact
+    binary file if the name ends in .i64.
     
     Args:
         data: List of integers
         filename: Path to save the file
     """
-    with open(filename, 'w') as file:
-        for num in data:
-            file.write(f"{num}\n")
+    try:
+        save_ints(filename, data)
+    except (OSError, OverflowError) as e:
+        print(f"❌ Could not save {filename} - {e}")
+        return
     print(f"✓ Dataset saved to {filename}")
 
+def external_sort_data_file():
+    """
+    Sort a data file that may be too large for memory (external merge sort).
+    
+    The file is read in runs that fit the memory budget; each run is sorted
+    and spilled to a temporary file, and the runs are merged into the output
+    file. Runs are sorted with Python's built-in sort, since Bubble Sort
+    would take hours on runs of this size.
+    """
+    src = input("\nEnter the input file path (e.g., PRELIM-LAB-WORK-1/data.txt): ").strip()
+    if not os.path.isfile(src):
+        print(f"❌ Error: {src} not found!")
+        return
+    dst = input("Enter the output file path (e.g., sorted_output.txt): ").strip()
+    if not dst or os.path.abspath(dst) == os.path.abspath(src):
+        print("❌ Please enter an output file different from the input file.")
+        return
+    memory = input(f"Enter memory budget in MB (default {DEFAULT_MEMORY_MB}): ").strip()
+    try:
+        memory_mb = int(memory) if memory else DEFAULT_MEMORY_MB
+    except ValueError:
+        print("❌ Invalid input! Please enter a whole number.")
+        return
+    
+    print(f"\nExternal sort of {src} (ascending)...")
+    try:
+        stats, elapsed_time, cpu_time = measure(
+            lambda: sort_int_file(src, dst, memory_mb=memory_mb, progress=print_progress)
+        )
+    except ValueError as e:
+        print(f"\nError: Invalid data in file - {e}")
+        return
+    
+    print(f"✓ Sorted {stats['rows']} integers in {stats['runs']} run(s)")
+    print(f"Time spent: {elapsed_time:.6f} seconds ({elapsed_time * 1000:.3f} ms), CPU time: {cpu_time:.6f} seconds")
+    print(f"✓ Sorted data saved to {dst}")
+
 def verify_sorting(original, sorted_arr):
     """
-    Verify that the array is correctly sorted.
+    Verify that the array is correctly sorted, in linear time.
+    
+    One pass checks ascending order; a multiset fingerprint of each array
+    checks that no element was lost, duplicated or changed. Nothing is
+    re-sorted or copied. With NumPy installed both arrays are converted
+    once and checked in vectorized passes instead.
     
     Args:
         original: Original array
         sorted_arr: Sorted array
         
     Returns:
-        Boolean indicating if sorting is correct
+        Verification (see sortlab.verify); .passed is True if sorting is correct
     """
-    # Check if all elements are present
-    if sorted(original) != sorted_arr:
-        return False
-    
-    # Check if array is in ascending order
-    for i in range(len(sorted_arr) - 1):
-        if sorted_arr[i] > sorted_arr[i + 1]:
-            return False
-    
-    return True
+    dataset = as_dataset(original)
+    if dataset is not None:
+        return dataset.verify(sorted_arr)
+    return verify_sorted(original, sorted_arr)
 
 def display_menu():
     """Display menu options"""
     print("\n" + "=" * 70)
     print("LABORATORY 1: BUBBLE SORT - 10,000 INTEGERS")
     print("=" * 70)
-    print("1. Generate new random dataset (10,000 integers)")
+    print("1. Generate new dataset (seeded; uniform, sorted, reversed, ...)")
     print("2. Auto-search and load data.txt")
     print("3. Load dataset from custom file path")
-    print("4. Run Bubble Sort on current dataset")
+    print("4. Run Bubble Sort (or an adaptive variant) on current dataset")
     print("5. View dataset statistics")
     print("6. Save current dataset to file")
-    print("7. Exit")
+    print("7. External sort a large data file")
+    print("8. Exit")
     print("=" * 70)
 
 def display_statistics(data):
@@ -163,26 +222,36 @@ def display_statistics(data):
     print("DATASET STATISTICS")
     print("=" * 70)
     print(f"Size: {len(data)} elements")
-    print(f"Minimum value: {min(data)}")
-    print(f"Maximum value: {max(data)}")
+    dataset = as_dataset(data)
+    if dataset is not None:
+        stats = dataset.statistics()
+        print(f"Minimum value: {stats['min']}")
+        print(f"Maximum value: {stats['max']}")
+        print(f"Mean: {stats['mean']:.2f}, Median: {stats['median']:.1f}, Std dev: {stats['stdev']:.2f}")
+        print(f"Distinct values: {stats['unique']}")
+    else:
+        print(f"Minimum value: {min(data)}")
+        print(f"Maximum value: {max(data)}")
     print(f"First 20 elements: {data[:20]}")
     print(f"Last 20 elements: {data[-20:]}")
     print("=" * 70)
 
-def display_sorting_results(original, sorted_arr, time_taken):
+def display_sorting_results(original, sorted_arr, time_taken, cpu_time=None, algorithm_name="Bubble Sort"):
     """Display the results of sorting"""
     print("\n" + "=" * 70)
-    print("BUBBLE SORT RESULTS")
+    print(f"{algorithm_name.upper()} RESULTS")
     print("=" * 70)
     
     # Verify correctness
-    is_correct = verify_sorting(original, sorted_arr)
+    verification = verify_sorting(original, sorted_arr)
     
     print(f"\nArray size: {len(sorted_arr)} elements")
     print(f"\nExecution time: {time_taken:.6f} seconds")
     print(f"Execution time: {time_taken * 1000:.3f} milliseconds")
+    if cpu_time is not None:
+        print(f"CPU time: {cpu_time:.6f} seconds")
     
-    print(f"\nSorting verification: {'✓ PASSED' if is_correct else '✗ FAILED'}")
+    print(f"\nSorting verification: {'✓ PASSED' if verification.passed else '✗ FAILED'} ({verification.summary()})")
     
     print(f"\nSorted array (first 50 elements):")
     print(sorted_arr[:50])
@@ -224,7 +293,7 @@ def main():
         else:
             print("\nNo dataset loaded")
         
-        choice = input("\nEnter your choice (1-7): ").strip()
+        choice = input("\nEnter your choice (1-8): ").strip()
         
         if choice == '1':
             # Generate random dataset
@@ -238,9 +307,13 @@ def main():
             max_val = input("Enter maximum value (default 100000): ").strip()
             max_val = int(max_val) if max_val else 100000
             
-            dataset = generate_random_dataset(size, min_val, max_val)
-            print(f"✓ Generated {len(dataset)} random integers")
-            print(f"Range: {min_val} to {max_val}")
+            distribution = choose_distribution()
+            seed = input("Enter seed (blank for a random seed): ").strip()
+            seed = int(seed) if seed else None
+            
+            dataset, seed = generate_random_dataset(size, min_val, max_val, distribution, seed)
+            print(f"✓ Generated {len(dataset)} {distribution} integers (seed {seed})")
+            print(f"Range: {min(dataset, default=min_val)} to {max(dataset, default=max_val)}")
             
         elif choice == '2':
             # Auto-search for data.txt
@@ -278,14 +351,17 @@ def main():
             if dataset is None:
                 print("\n❌ No dataset loaded! Please generate or load a dataset first.")
             else:
-                print(f"\nRunning Bubble Sort on {len(dataset)} elements...")
+                name, sort = choose_variant()
+                print(f"\nRunning {name} on {len(dataset)} elements...")
                 print("Please wait, this may take a moment...")
                 
                 # Make a copy to preserve original
                 original = dataset.copy()
-                sorted_arr, time_taken = bubble_sort(dataset.copy())
+                sorted_arr = dataset.copy()
+                # perf_counter_ns wall time and process CPU time of the kernel call only
+                _, time_taken, cpu_time = measure(sort, sorted_arr)
                 
-                display_sorting_results(original, sorted_arr, time_taken)
+                display_sorting_results(original, sorted_arr, time_taken, cpu_time, name)
                 
                 # Ask if user wants to save sorted result
                 save_sorted = input("\nSave sorted array to file? (y/n): ").strip().lower()
@@ -305,10 +381,14 @@ def main():
             if dataset is None:
                 print("\n❌ No dataset loaded! Please generate or load a dataset first.")
             else:
-                filename = input("\nEnter filename to save (e.g., my_dataset.txt): ").strip()
+                filename = input("\nEnter filename to save (e.g., my_dataset.txt, or my_dataset.i64 for binary): ").strip()
                 save_dataset_to_file(dataset, filename)
         
         elif choice == '7':
+            # Sort a file without loading it into memory
+            external_sort_data_file()
+        
+        elif choice == '8':
             # Exit
             print("\n" + "=" * 70)
             print("Thank you for using the Bubble Sort Program!")
@@ -316,9 +396,9 @@ def main():
             break
         
         else:
-            print("\n❌ Invalid choice! Please enter a number between 1 and 7.")
+            print("\n❌ Invalid choice! Please enter a number between 1 and 8.")
         
-        if choice in ['1', '2', '3', '4', '5', '6']:
+        if choice in ['1', '2', '3', '4', '5', '6', '7']:
             input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
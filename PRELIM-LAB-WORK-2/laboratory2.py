@@ -1,77 +1,118 @@
-import time
 import os
+import random
+import sys
+
+# Shared helpers live in sortlab/ at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from sortlab.external import DEFAULT_MEMORY_MB, print_progress, sort_int_file
+from sortlab.generate import DISTRIBUTIONS, cached_ints
+from sortlab.intio import load_ints, save_ints
+from sortlab.instrument import counting_keys, run_counted
+from sortlab.timing import measure
+from sortlab.trials import DEFAULT_REPEATS, DEFAULT_WARMUP, run_trials
+from sortlab.verify import verify_sorted
+from sortlab.vectorized import HAVE_NUMPY, SORT_KINDS, IntDataset, as_dataset, sorter
+from sortlab import scaling
+from sortlab.parallel import chunk_bounds, parallel_sort
+from sortlab import kernels, radix
 
 def bubble_sort_descending(arr):
     """
     Sorts an array in descending order using bubble sort algorithm.
     Time Complexity: O(n²)
+    Stops early once a pass makes no swaps.
     """
-    n = len(arr)
-    arr_copy = arr.copy()
-    
-    for i in range(n):
-        swapped = False
-        for j in range(0, n - i - 1):
-            if arr_copy[j] < arr_copy[j + 1]:
-                arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
-                swapped = True
-        if not swapped:
-            break
-    
-    return arr_copy
+    return kernels.bubble_sort_descending(arr.copy())
+
+def cocktail_shaker_sort_descending(arr):
+    """
+    Sorts an array in descending order using cocktail shaker sort.
+    Time Complexity: O(n²), O(n) when nearly sorted
+    Bubble sort passes alternate direction and shrink both ends to the
+    last swap, so out-of-place values move back in a single pass.
+    """
+    return kernels.cocktail_shaker_sort_descending(arr.copy())
 
 def insertion_sort_descending(arr):
     """
     Sorts an array in descending order using insertion sort algorithm.
     Time Complexity: O(n²)
     """
-    arr_copy = arr.copy()
-    
-    for i in range(1, len(arr_copy)):
-        key = arr_copy[i]
-        j = i - 1
-        while j >= 0 and arr_copy[j] < key:
-            arr_copy[j + 1] = arr_copy[j]
-            j -= 1
-        arr_copy[j + 1] = key
-    
-    return arr_copy
+    return kernels.insertion_sort_descending(arr.copy())
+
+def binary_insertion_sort_descending(arr):
+    """
+    Sorts an array in descending order using binary insertion sort.
+    Time Complexity: O(n log n) comparisons, O(n²) moves
+    Elements already in place are skipped; the others are placed with a
+    binary search and shifted as one block by slice assignment.
+    """
+    return kernels.binary_insertion_sort_descending(arr.copy())
+
+def shell_sort_ciura_descending(arr):
+    """
+    Sorts an array in descending order using Shell sort with Ciura's gaps.
+    Time Complexity: about O(n^1.3) in practice; not stable
+    """
+    return kernels.shell_sort_ciura_descending(arr.copy())
+
+def shell_sort_sedgewick_descending(arr):
+    """
+    Sorts an array in descending order using Shell sort with Sedgewick's gaps.
+    Time Complexity: O(n^4/3) worst case; not stable
+    """
+    return kernels.shell_sort_sedgewick_descending(arr.copy())
 
 def merge_sort_descending(arr):
     """
     Sorts an array in descending order using merge sort algorithm.
     Time Complexity: O(n log n)
+    Bottom-up: runs are merged back and forth between two preallocated
+    buffers with index cursors instead of slicing at every level.
     """
-    if len(arr) <= 1:
-        return arr.copy()
-    
-    def merge(left, right):
-        result = []
-        i = j = 0
-        
-        while i < len(left) and j < len(right):
-            if left[i] >= right[j]:
-                result.append(left[i])
-                i += 1
-            else:
-                result.append(right[j])
-                j += 1
-        
-        result.extend(left[i:])
-        result.extend(right[j:])
-        return result
-    
-    def merge_sort_helper(arr):
-        if len(arr) <= 1:
-            return arr
-        
-        mid = len(arr) // 2
-        left = merge_sort_helper(arr[:mid])
-        right = merge_sort_helper(arr[mid:])
-        
-        return merge(left, right)
-    
-    return merge_sort_helper(arr.copy())
+    return kernels.merge_sort_descending(arr.copy())
+
+def parallel_merge_sort_descending(arr):
+    """
+    Sorts an array in descending order using merge sort on every CPU core.
+    Time Complexity: O(n log n)
+    Each core merge sorts one chunk in a worker process, then the sorted
+    chunks are combined with a k-way heap merge.
+    """
+    return parallel_sort(arr, merge_sort_descending, reverse=True)
+
+def counting_sort_descending(arr):
+    """
+    Sorts an array of integers in descending order using counting sort.
+    Time Complexity: O(n + k), k = max - min
+    Counts every value, then writes each value count times from the largest
+    down; very wide value ranges fall back to radix sort.
+    """
+    return radix.counting_sort(arr, arr, reverse=True)
+
+def radix_sort_descending(arr):
+    """
+    Sorts an array of integers in descending order using LSD radix sort.
+    Time Complexity: O(d·n), d = number of digits
+    The digit width is picked from the value range, so data.txt (1..9999)
+    is sorted in a single pass.
+    """
+    return radix.radix_sort(arr, arr, reverse=True)
+
+# Menu order; options after these are Compare, Scaling Sweep,
+# Load New Dataset, External Sort and Exit
+ALGORITHMS = [
+    ("Bubble Sort", bubble_sort_descending),
+    ("Cocktail Shaker Sort", cocktail_shaker_sort_descending),
+    ("Insertion Sort", insertion_sort_descending),
+    ("Binary Insertion Sort", binary_insertion_sort_descending),
+    ("Shell Sort (Ciura)", shell_sort_ciura_descending),
+    ("Shell Sort (Sedgewick)", shell_sort_sedgewick_descending),
+    ("Merge Sort", merge_sort_descending),
+    ("Parallel Merge Sort", parallel_merge_sort_descending),
+    ("Counting Sort", counting_sort_descending),
+    ("Radix Sort", radix_sort_descending)
+]
 
 def find_data_file():
     """Search for data.txt in common locations"""
@@ -108,15 +149,16 @@ def find_data_file():
     return None
 
 def load_data_from_file(filename='data.txt'):
-    """Load data from text file"""
+    """Load data from a text file (one number per line) or a binary .i64 file"""
     try:
-        with open(filename, 'r') as file:
-            data = []
-            for line in file:
-                line = line.strip()
-                if line:
-                    data.append(int(line))
-        return data
+        if HAVE_NUMPY:
+            # One vectorized parse (or cache/binary read) instead of a loop per line
+            try:
+                return IntDataset.from_file(filename).tolist()
+            except OverflowError:
+                pass  # values beyond int64: the pure-Python loader below
+        # Bulk parse (or cache/binary read), see sortlab/intio.py
+        return load_ints(filename)
     except FileNotFoundError:
         print(f"Error: {filename} file not found!")
         return None
@@ -124,6 +166,19 @@ def load_data_from_file(filename='data.txt'):
         print(f"Error: Invalid data in file - {e}")
         return None
 
+def save_current_dataset(data):
+    """Save the current dataset as text, or as compact binary if the name ends in .i64"""
+    filename = input("\nEnter filename to save (e.g., my_dataset.txt, or my_dataset.i64 for binary): ").strip()
+    if not filename:
+        print("❌ No filename given!")
+        return
+    try:
+        _, elapsed_time, _ = measure(save_ints, filename, data)
+    except (OSError, OverflowError) as e:
+        print(f"❌ Could not save {filename} - {e}")
+        return
+    print(f"✓ Saved {len(data)} numbers to {filename} in {elapsed_time * 1000:.1f} ms")
+
 def load_custom_dataset():
     """Load custom dataset from user input"""
     print("\n" + "=" * 60)
@@ -132,7 +187,7 @@ def load_custom_dataset():
     print("Choose input method:")
     print("1. Enter numbers manually (comma-separated)")
     print("2. Load from a custom file (enter full path)")
-    print("3. Generate random numbers")
+    print("3. Generate numbers (seeded; uniform, sorted, reversed, ...)")
     print("=" * 60)
     
     choice = input("\nEnter your choice (1-3): ").strip()
@@ -172,9 +227,7 @@ def load_from_custom_file():
     return data
 
 def generate_random_data():
-    """Generate random dataset"""
-    import random
-    
+    """Generate a seeded dataset of a chosen shape"""
     try:
         size = int(input("\nEnter the number of elements to generate: ").strip())
         if size <= 0:
@@ -188,14 +241,60 @@ def generate_random_data():
             print("❌ Minimum value must be less than maximum value!")
             return None
         
-        data = [random.randint(min_val, max_val) for _ in range(size)]
-        print(f"✓ Successfully generated {len(data)} random numbers")
+        names = list(DISTRIBUTIONS)
+        print("Input distributions: " + ", ".join(f"{i}. {name}" for i, name in enumerate(names, 1)))
+        shape = read_int(f"Choose distribution (1-{len(names)})", 1, minimum=1)
+        distribution = names[min(shape, len(names)) - 1]
+        seed = read_int("Seed (same seed, same data)", random.randrange(2 ** 32))
+        
+        data = cached_ints(distribution, size, seed, min_val, max_val)
+        print(f"✓ Successfully generated {len(data)} {distribution} numbers (seed {seed})")
         return data
     except ValueError:
         print("❌ Invalid input! Please enter valid integers.")
         return None
 
-def display_results(sorted_data, elapsed_time, algorithm_name):
+def external_sort_data_file():
+    """
+    Sort a data file that may be too large for memory, in descending order.
+    The file is read in runs that fit the memory budget; each run is sorted
+    with Merge Sort and spilled to a temporary file, and the runs are merged
+    into the output file.
+    """
+    src = input("\nEnter the input file path (e.g., PRELIM-LAB-WORK-2/data.txt): ").strip()
+    if not os.path.isfile(src):
+        print(f"❌ Error: {src} file not found!")
+        return
+    dst = input("Enter the output file path (e.g., sorted_output.txt): ").strip()
+    if not dst or os.path.abspath(dst) == os.path.abspath(src):
+        print("❌ Please enter an output file different from the input file.")
+        return
+    memory = input(f"Enter memory budget in MB (default {DEFAULT_MEMORY_MB}): ").strip()
+    try:
+        memory_mb = int(memory) if memory else DEFAULT_MEMORY_MB
+    except ValueError:
+        print("❌ Invalid input! Please enter a whole number.")
+        return
+    
+    def sort_run(lines, keys):
+        # One integer per line, so the sorted lines can be rebuilt from the keys
+        return [b"%d\n" % value for value in merge_sort_descending(keys)]
+    
+    print(f"\nExternal sort of {src} (descending)...")
+    try:
+        stats, elapsed_time, cpu_time = measure(
+            lambda: sort_int_file(src, dst, reverse=True, memory_mb=memory_mb,
+                                  sort_run=sort_run, progress=print_progress)
+        )
+    except ValueError as e:
+        print(f"\nError: Invalid data in file - {e}")
+        return
+    
+    print(f"✓ Sorted {stats['rows']} numbers in {stats['runs']} run(s)")
+    print(f"Time spent: {elapsed_time:.6f} seconds ({elapsed_time * 1000:.3f} ms), CPU time: {cpu_time:.6f} seconds")
+    print(f"✓ Sorted data saved to {dst}")
+
+def display_results(sorted_data, elapsed_time, algorithm_name, cpu_time=None, verification=None):
     """Display sorting results"""
     print("\n" + "=" * 60)
     print(f"Algorithm: {algorithm_name}")
@@ -205,74 +304,212 @@ def display_results(sorted_data, elapsed_time, algorithm_name):
     print("\n" + "=" * 60)
     print(f"Time spent: {elapsed_time:.6f} seconds")
     print(f"Time spent: {elapsed_time * 1000:.3f} milliseconds")
+    if cpu_time is not None:
+        print(f"CPU time:   {cpu_time:.6f} seconds")
     print("=" * 60)
     print(f"\nVerification:")
     print(f"Array size: {len(sorted_data)}")
     print(f"Maximum value: {sorted_data[0]}")
     print(f"Minimum value: {sorted_data[-1]}")
+    if verification is not None:
+        print(f"Sorting verification: {'✓ PASSED' if verification.passed else '❌ FAILED'} ({verification.summary()})")
     print("=" * 60)
 
 def perform_sort(data, sort_function, algorithm_name):
     """Execute sorting and measure time"""
     print(f"\nExecuting {algorithm_name}...")
     
-    start_time = time.time()
-    sorted_data = sort_function(data)
-    end_time = time.time()
-    
-    elapsed_time = end_time - start_time
-    display_results(sorted_data, elapsed_time, algorithm_name)
+    # perf_counter_ns wall time and process CPU time of the sort call only
+    sorted_data, elapsed_time, cpu_time = measure(sort_function, data)
+    # Outside the timing: vectorized with NumPy, else linear-time (order + multiset fingerprint)
+    dataset = as_dataset(data)
+    verification = (dataset.verify(sorted_data, descending=True) if dataset is not None
+                    else verify_sorted(data, sorted_data, descending=True))
+    display_results(sorted_data, elapsed_time, algorithm_name, cpu_time, verification)
 
 def display_menu():
     """Display menu options"""
     print("\n" + "=" * 60)
     print("SORTING ALGORITHMS - DESCENDING ORDER")
     print("=" * 60)
-    print("1. Bubble Sort")
-    print("2. Insertion Sort")
-    print("3. Merge Sort")
-    print("4. Compare All Algorithms")
-    print("5. Load New Dataset")
-    print("6. Exit")
+    for number, (name, _) in enumerate(ALGORITHMS, 1):
+        print(f"{number}. {name}")
+    print(f"{len(ALGORITHMS) + 1}. Compare All Algorithms")
+    print(f"{len(ALGORITHMS) + 2}. Scaling Sweep (fit and extrapolate)")
+    print(f"{len(ALGORITHMS) + 3}. Load New Dataset")
+    print(f"{len(ALGORITHMS) + 4}. Save Current Dataset (text or .i64 binary)")
+    print(f"{len(ALGORITHMS) + 5}. External Sort a Large File")
+    print(f"{len(ALGORITHMS) + 6}. Exit")
     print("=" * 60)
 
+def read_int(prompt, default, minimum=0):
+    """Whole number from input(); Enter or invalid input gives the default."""
+    value = input(f"{prompt} (default {default}): ").strip()
+    if not value:
+        return default
+    try:
+        return max(minimum, int(value))
+    except ValueError:
+        print(f"❌ Invalid input! Using {default}.")
+        return default
+
 def compare_all_algorithms(data):
-    """Compare execution time of all sorting algorithms"""
+    """
+    Compare all sorting algorithms over repeated trials.
+    Every algorithm gets warmup runs, then N timed runs on fresh copies of
+    the data (optionally with the garbage collector off); outliers are
+    rejected and the median, mean, p95, stdev and 95% CI are reported.
+    """
     print("\n" + "=" * 60)
     print("COMPARING ALL SORTING ALGORITHMS")
     print("=" * 60)
     
-    algorithms = [
-        ("Bubble Sort", bubble_sort_descending),
-        ("Insertion Sort", insertion_sort_descending),
-        ("Merge Sort", merge_sort_descending)
-    ]
+    repeats = read_int("Timed repetitions per algorithm", DEFAULT_REPEATS, minimum=1)
+    warmup = read_int("Warmup runs per algorithm", DEFAULT_WARMUP)
+    disable_gc = input("Disable garbage collection while timing? (y/n, default y): ").strip().lower() != 'n'
+    # Counting runs every algorithm once more on instrumented values,
+    # so the timed runs are not slowed down by it
+    count_ops = input("Also count comparisons and moves? (y/n): ").strip().lower() == 'y'
+    
+    stats = {}
+    counts = {}
+    # Converted once, outside the timing: verification and the NumPy baselines
+    dataset = as_dataset(data)
+    
+    for name, func in ALGORITHMS:
+        print(f"\nExecuting {name} ({warmup} warmup + {repeats} timed runs)...")
+        sorted_data, stats[name] = run_trials(func, data, repeats, warmup, disable_gc)
+        result = stats[name]
+        print(f"  ✓ Median {result.median * 1000:.3f} ms, CPU {result.cpu_median * 1000:.3f} ms"
+              + (f" ({len(result.rejected)} outlier{'s' if len(result.rejected) != 1 else ''} rejected)"
+                 if result.rejected else ""))
+        verification = (dataset.verify(sorted_data, descending=True) if dataset is not None
+                        else verify_sorted(data, sorted_data, descending=True))
+        if not verification.passed:
+            print(f"  ❌ Verification failed: {verification.summary()}")
+        if count_ops:
+            _, counts[name] = run_counted(lambda values, keys: func(values), counting_keys(data))
+            print(f"  ✓ {counts[name].summary()}")
+    
+    # Compiled reference points on the same values
+    baselines = {}
+    if dataset is not None:
+        for kind in SORT_KINDS:
+            name = f"np.sort ({kind})"
+            print(f"\nExecuting {name} (NumPy baseline)...")
+            _, baselines[name] = run_trials(sorter(kind, descending=True), dataset.values, repeats, warmup, disable_gc)
+            print(f"  ✓ Median {baselines[name].median * 1000:.3f} ms")
+    
+    width = 128 if count_ops else 96
+    print("\n" + "=" * width)
+    print(f"PERFORMANCE COMPARISON ({repeats} runs each, times in ms"
+          + (", GC disabled" if disable_gc else "") + ")")
+    print("=" * width)
+    print(f"{'Algorithm':<22} {'Median':>10} {'Mean':>10} {'p95':>10} {'Stdev':>10} {'95% CI':>21} {'CPU':>10}"
+          + (f"{'Comparisons':>16} {'Moves':>16}" if count_ops else ""))
+    print("-" * width)
     
-    results = []
+    def print_row(name, result):
+        ci = f"{result.ci[0] * 1000:.3f}–{result.ci[1] * 1000:.3f}"
+        print(f"{name:<22} {result.median * 1000:>10.3f} {result.mean * 1000:>10.3f} {result.p95 * 1000:>10.3f} "
+              f"{result.stdev * 1000:>10.3f} {ci:>21} {result.cpu_median * 1000:>10.3f}"
+              + (f"{counts[name].comparisons:>16,} {counts[name].moves:>16,}" if name in counts else ""))
     
-    for name, func in algorithms:
-        print(f"\nExecuting {name}...")
-        start_time = time.time()
-        sorted_data = func(data)
-        end_time = time.time()
-        elapsed_time = end_time - start_time
-        results.append((name, elapsed_time))
-        print(f"  ✓ Completed in {elapsed_time:.6f} seconds ({elapsed_time * 1000:.3f} ms)")
+    for name, result in stats.items():
+        print_row(name, result)
+    if baselines:
+        print("-" * width)
+        for name, result in baselines.items():
+            print_row(name, result)
     
+    print("=" * width)
+    
+    # Rank by median; a lead is only real if the confidence intervals don't overlap
+    ranking = sorted(stats, key=lambda name: stats[name].median)
+    fastest, runner_up = ranking[0], ranking[1]
+    print(f"\nFastest Algorithm: {fastest} (median {stats[fastest].median:.6f} seconds)")
+    if stats[fastest].overlaps(stats[runner_up]):
+        print(f"  ⚠ Not a significant lead over {runner_up}: their 95% confidence intervals overlap")
+    else:
+        print(f"  ✓ Significantly faster than {runner_up} (95% confidence intervals do not overlap)")
+    
+    if stats["Parallel Merge Sort"].median > 0:
+        workers = len(chunk_bounds(len(data)))
+        print(f"Parallel speedup vs Merge Sort (medians): "
+              f"{stats['Merge Sort'].median / stats['Parallel Merge Sort'].median:.2f}x "
+              f"({workers} worker{'s' if workers != 1 else ''})")
+    if baselines:
+        best = min(baselines, key=lambda name: baselines[name].median)
+        if baselines[best].median > 0:
+            print(f"Fastest NumPy baseline: {best}, {stats[fastest].median / baselines[best].median:.1f}x "
+                  f"faster than {fastest}")
+    else:
+        print("NumPy baselines skipped (NumPy is not installed)" if not HAVE_NUMPY
+              else "NumPy baselines skipped (values beyond int64)")
+    print("=" * width)
+
+def scaling_sweep(data):
+    """
+    Time every algorithm over a geometric series of sizes and fit t(n) = a·n^b.
+    Inputs of each size are drawn (with replacement) from the current
+    dataset, so they have its value range and duplicates. Slow algorithms
+    stop early; the fit extrapolates the time for target sizes.
+    """
     print("\n" + "=" * 60)
-    print("PERFORMANCE COMPARISON")
+    print("SCALING SWEEP")
     print("=" * 60)
-    print(f"{'Algorithm':<20} {'Time (seconds)':<20} {'Time (ms)':<15}")
-    print("-" * 60)
     
-    for name, elapsed_time in results:
-        print(f"{name:<20} {elapsed_time:<20.6f} {elapsed_time * 1000:<15.3f}")
+    start = read_int("Smallest size", scaling.DEFAULT_START, minimum=2)
+    stop = read_int("Largest size", scaling.DEFAULT_STOP, minimum=start)
+    max_seconds = read_int("Stop an algorithm once one size takes over N seconds", int(scaling.DEFAULT_MAX_SECONDS), minimum=1)
+    targets = input("Sizes to predict, space separated (default 1000000 10000000 100000000): ").split()
+    try:
+        targets = [int(t) for t in targets] or list(scaling.DEFAULT_TARGETS)
+    except ValueError:
+        print("❌ Invalid sizes! Using the defaults.")
+        targets = list(scaling.DEFAULT_TARGETS)
     
-    print("=" * 60)
+    sizes = scaling.geometric_sizes(start, stop)
+    samples = {}
     
-    fastest = min(results, key=lambda x: x[1])
-    print(f"\nFastest Algorithm: {fastest[0]} ({fastest[1]:.6f} seconds)")
-    print("=" * 60)
+    def sample(n):
+        if n not in samples:
+            samples[n] = random.choices(data, k=n)
+        return samples[n]
+    
+    curves, fits = {}, {}
+    for name, func in ALGORITHMS:
+        print(f"\n{name}:")
+        # Median of 3 runs per size, each on a fresh copy
+        curves[name] = scaling.sweep(
+            lambda n: run_trials(func, sample(n), repeats=3, warmup=0)[1].median,
+            sizes, max_seconds,
+            on_point=lambda n, seconds: print(f"  n = {n:>10,}  {seconds:.6f} s")
+        )
+        try:
+            fits[name] = scaling.PowerLawFit(curves[name])
+            print(f"  ✓ {fits[name].describe()}")
+        except ValueError as e:
+            print(f"  ❌ No fit: {e}")
+    
+    width = 48 + 14 * len(targets)
+    print("\n" + "=" * width)
+    print("EMPIRICAL COMPLEXITY (t = a · n^b) AND PREDICTED TIMES")
+    print("=" * width)
+    print(f"{'Algorithm':<22} {'b':>6} {'a':>10} {'R²':>6}" + "".join(f"{f'n={t:,}':>14}" for t in targets))
+    print("-" * width)
+    for name, fit in fits.items():
+        print(f"{name:<22} {fit.exponent:>6.2f} {fit.constant:>10.2e} {fit.r_squared:>6.3f}"
+              + "".join(f"{scaling.format_duration(fit.predict(t)):>14}" for t in targets))
+    print("=" * width)
+    
+    path = input("\nExport curve data to (.csv or .json, Enter to skip): ").strip()
+    if path:
+        try:
+            scaling.write_curves(path, curves, fits, targets)
+            print(f"✓ Curve data saved to {path}")
+        except OSError as e:
+            print(f"❌ Error saving file: {e}")
 
 def choose_data_source():
     """Choose initial data source"""
@@ -325,19 +562,25 @@ def main():
         print(f"First 10 elements: {data[:10]}")
         print(f"Last 10 elements: {data[-10:]}")
     
+    compare_choice = str(len(ALGORITHMS) + 1)
+    sweep_choice = str(len(ALGORITHMS) + 2)
+    load_choice = str(len(ALGORITHMS) + 3)
+    save_choice = str(len(ALGORITHMS) + 4)
+    external_choice = str(len(ALGORITHMS) + 5)
+    exit_choice = str(len(ALGORITHMS) + 6)
+    
     while True:
         display_menu()
-        choice = input("\nEnter your choice (1-6): ").strip()
+        choice = input(f"\nEnter your choice (1-{exit_choice}): ").strip()
         
-        if choice == '1':
-            perform_sort(data, bubble_sort_descending, "Bubble Sort")
-        elif choice == '2':
-            perform_sort(data, insertion_sort_descending, "Insertion Sort")
-        elif choice == '3':
-            perform_sort(data, merge_sort_descending, "Merge Sort")
-        elif choice == '4':
+        if choice.isdigit() and 1 <= int(choice) <= len(ALGORITHMS):
+            name, func = ALGORITHMS[int(choice) - 1]
+            perform_sort(data, func, name)
+        elif choice == compare_choice:
             compare_all_algorithms(data)
-        elif choice == '5':
+        elif choice == sweep_choice:
+            scaling_sweep(data)
+        elif choice == load_choice:
             new_data = load_custom_dataset()
             if new_data:
                 data = new_data
@@ -349,15 +592,19 @@ def main():
                     print(f"Last 10 elements: {data[-10:]}")
             else:
                 print("\n❌ Failed to load new dataset. Keeping current data.")
-        elif choice == '6':
+        elif choice == save_choice:
+            save_current_dataset(data)
+        elif choice == external_choice:
+            external_sort_data_file()
+        elif choice == exit_choice:
             print("\n" + "=" * 60)
             print("Thank you for using the Sorting Algorithms Program!")
             print("=" * 60)
             break
         else:
-            print("\n❌ Invalid choice! Please enter a number between 1 and 6.")
+            print(f"\n❌ Invalid choice! Please enter a number between 1 and {exit_choice}.")
         
-        if choice in ['1', '2', '3', '4', '5']:
+        if choice.isdigit() and 1 <= int(choice) < int(exit_choice):
             input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
@@ -0,0 +1,6 @@
+"""
+Shared helpers for the sorting lab programs.
+
+The lab scripts and the Prelim Exam benchmark add the repository root to
+sys.path and import from here, so each helper is written once.
+"""
@@ -0,0 +1,144 @@
+"""
+On-disk cache of parsed datasets.
+
+Parsing a text dataset is far slower than reading back its columns in
+binary, so parsed datasets are saved as columnar files (see columnar.py)
+in a cache directory. Entries are keyed on the source's absolute path,
+size and modification time: editing the source changes the key, and the
+stale entry is removed the next time that source is stored. Generated
+datasets have no source file and are keyed on their parameters instead. The directory
+is kept under a size limit by evicting the least recently used entries.
+
+The directory defaults to ~/.cache/sortlab and can be changed with the
+SORTLAB_CACHE_DIR environment variable; SORTLAB_CACHE=0 disables caching.
+"""
+import hashlib, json, os
+from array import array
+
+from sortlab.columnar import read_columns, write_columns
+
+FORMAT_VERSION = 1
+DEFAULT_DIR = os.environ.get("SORTLAB_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "sortlab")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+SUFFIX = ".slc"
+
+
+class DatasetCache:
+
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES, enabled=None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = os.environ.get("SORTLAB_CACHE", "1") != "0" if enabled is None else enabled
+
+    def _source_prefix(self, path, kind):
+        digest = hashlib.sha1(f"{os.path.abspath(path)}|{kind}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def entry_path(self, path, kind):
+        """Cache file for the current version of path (raises OSError if path is missing)."""
+        st = os.stat(path)
+        version = hashlib.sha1(f"{st.st_size}|{st.st_mtime_ns}|{FORMAT_VERSION}".encode("utf-8"))
+        name = f"{self._source_prefix(path, kind)}-{version.hexdigest()[:16]}{SUFFIX}"
+        return os.path.join(self.directory, name)
+
+    def generated_entry_path(self, params):
+        """Cache file for a generated dataset, keyed on its JSON-serializable parameters."""
+        key = json.dumps(params, sort_keys=True)
+        digest = hashlib.sha1(f"generated|{key}|{FORMAT_VERSION}".encode("utf-8"))
+        return os.path.join(self.directory, f"gen-{digest.hexdigest()[:32]}{SUFFIX}")
+
+    def load(self, path, kind):
+        """
+        Returns:
+            (columns, strings, meta) from read_columns, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        return self._read(self.entry_path(path, kind))
+
+    def load_generated(self, params):
+        """(columns, strings, meta) stored for these generator parameters, or None."""
+        if not self.enabled:
+            return None
+        return self._read(self.generated_entry_path(params))
+
+    def _read(self, entry):
+        try:
+            result = read_columns(entry)
+            os.utime(entry)  # mark as recently used
+            return result
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store(self, path, kind, columns, strings=None, meta=None):
+        """Save a parsed dataset; cache failures never affect the caller."""
+        if not self.enabled:
+            return
+        try:
+            entry = self.entry_path(path, kind)
+            os.makedirs(self.directory, exist_ok=True)
+            self._remove_stale(path, kind, keep=entry)
+            write_columns(entry, columns, strings, meta)
+            self.evict()
+        except OSError:
+            pass
+
+    def store_generated(self, params, columns, strings=None):
+        """Save a generated dataset under its parameters (stored with it as metadata)."""
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_columns(self.generated_entry_path(params), columns, strings, {"params": params})
+            self.evict()
+        except OSError:
+            pass
+
+    def _remove_stale(self, path, kind, keep):
+        prefix = self._source_prefix(path, kind) + "-"
+        for name in os.listdir(self.directory):
+            full = os.path.join(self.directory, name)
+            if name.startswith(prefix) and full != keep:
+                os.remove(full)
+
+    def entries(self):
+        """(path, size, last used) for every cache file, oldest first."""
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for name in os.listdir(self.directory):
+            if name.endswith(SUFFIX):
+                full = os.path.join(self.directory, name)
+                st = os.stat(full)
+                found.append((full, st.st_size, st.st_mtime))
+        return sorted(found, key=lambda e: e[2])
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for full, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(full)
+            total -= size
+
+    def clear(self):
+        for full, _, _ in self.entries():
+            os.remove(full)
+
+    # ---------- Integer datasets ----------
+    def load_ints(self, path):
+        """Cached list of ints for a one-number-per-line file, or None."""
+        hit = self.load(path, "ints")
+        return hit[0]["values"].tolist() if hit else None
+
+    def store_ints(self, path, values):
+        try:
+            column = array("q", values)
+        except OverflowError:
+            return  # wider than 64 bits, keep parsing from text
+        self.store(path, "ints", {"values": column})
+
+
+default_cache = DatasetCache()
@@ -0,0 +1,144 @@
+"""
+Compact binary columnar file format.
+
+A file holds named typed arrays (and optionally string lists) plus a small
+JSON metadata dict:
+
+    MAGIC (8 bytes) | header length (uint64 LE) | header JSON | column blocks
+
+Every block starts on an 8-byte boundary and is stored little-endian, so a
+reader can map the file and copy each column straight into an array with
+no per-element Python work.
+"""
+import json, mmap, os, struct, sys
+from array import array
+
+MAGIC = b"SLCOL1\0\0"
+ALIGN = 8
+
+
+def _padding(offset):
+    return -offset % ALIGN
+
+
+def encode_strings(values):
+    """List of str -> (utf-8 bytes as array('B'), array('q') of end offsets)."""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = array("q")
+    end = 0
+    for item in encoded:
+        end += len(item)
+        offsets.append(end)
+    return array("B", b"".join(encoded)), offsets
+
+
+def decode_strings(data, offsets):
+    raw = bytes(data)
+    values = []
+    start = 0
+    for end in offsets:
+        values.append(raw[start:end].decode("utf-8"))
+        start = end
+    return values
+
+
+def write_columns(path, columns, strings=None, meta=None):
+    """
+    Write a columnar file atomically (temp file + rename).
+
+    Args:
+        path: Destination file
+        columns: Dict of name -> array
+        strings: Optional dict of name -> list of str
+        meta: Optional JSON-serializable dict stored in the header
+    """
+    blocks = dict(columns)
+    for name, values in (strings or {}).items():
+        blocks[name + ".data"], blocks[name + ".offsets"] = encode_strings(values)
+
+    entries = []
+    offset = 0
+    for name, arr in blocks.items():
+        entries.append({"name": name, "typecode": arr.typecode, "offset": offset, "count": len(arr)})
+        offset += len(arr) * arr.itemsize
+        offset += _padding(offset)
+
+    header = json.dumps({
+        "columns": entries,
+        "strings": sorted(strings or {}),
+        "meta": meta or {}
+    }).encode("utf-8")
+    data_start = len(MAGIC) + 8 + len(header)
+    data_start += _padding(data_start)
+
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            f.write(b"\0" * (data_start - f.tell()))
+            for entry, arr in zip(entries, blocks.values()):
+                if sys.byteorder == "big":
+                    arr = array(arr.typecode, arr)
+                    arr.byteswap()
+                arr.tofile(f)
+                f.write(b"\0" * _padding(f.tell() - data_start))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_columns(path, copy=True):
+    """
+    Map a columnar file back in.
+
+    Args:
+        path: File written by write_columns
+        copy: If True, columns are arrays copied out of the mapping in one
+              block each. If False, they are read-only memoryviews over the
+              mapping itself (zero-copy; little-endian hosts only).
+
+    Returns:
+        Tuple of (columns dict, strings dict, meta dict)
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < len(MAGIC) + 8:
+            raise ValueError(f"{path} is not a columnar file")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mm)
+    try:
+        if view[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a columnar file")
+        (header_len,) = struct.unpack_from("<Q", view, len(MAGIC))
+        header_start = len(MAGIC) + 8
+        header = json.loads(bytes(view[header_start:header_start + header_len]))
+        data_start = header_start + header_len
+        data_start += _padding(data_start)
+
+        blocks = {}
+        for entry in header["columns"]:
+            itemsize = array(entry["typecode"]).itemsize
+            start = data_start + entry["offset"]
+            block = view[start:start + entry["count"] * itemsize]
+            if copy or sys.byteorder == "big":
+                arr = array(entry["typecode"])
+                arr.frombytes(block)
+                block.release()
+                if sys.byteorder == "big":
+                    arr.byteswap()
+                blocks[entry["name"]] = arr
+            else:
+                blocks[entry["name"]] = block.cast(entry["typecode"])
+    finally:
+        if copy:
+            view.release()
+            mm.close()
+
+    strings = {}
+    for name in header["strings"]:
+        strings[name] = decode_strings(blocks.pop(name + ".data"), blocks.pop(name + ".offsets"))
+    return blocks, strings, header["meta"]
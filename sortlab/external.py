@@ -0,0 +1,161 @@
+"""
+External (out-of-core) merge sort for line-based files larger than memory.
+
+Phase 1 ("split"): the input is read line by line until the memory budget
+is used up; that run is sorted in memory and spilled to a temporary file.
+Phase 2 ("merge"): the sorted run files are merged with a heap
+(heapq.merge) and streamed straight into the output file. Only the
+current run, or one read buffer per run file, is ever held in memory.
+
+Lines are handled as raw bytes and written out unchanged, so the output
+has the same format as the input. The sort is stable: runs keep input
+order for equal keys, and the merge takes ties from earlier runs first.
+"""
+import heapq, os, tempfile
+
+DEFAULT_MEMORY_MB = 64
+ROW_OVERHEAD = 120  # approx. bytes per buffered line beyond its text (bytes object, key, list slots)
+WRITE_BATCH = 10_000  # lines per write (and per merge progress update)
+MIN_READ_BUFFER = 64 * 1024
+
+
+def default_sort_run(lines, keys, reverse=False):
+    order = sorted(range(len(lines)), key=keys.__getitem__, reverse=reverse)
+    return [lines[i] for i in order]
+
+
+def external_sort(src, dst, line_key, reverse=False, header=False, memory_mb=DEFAULT_MEMORY_MB,
+                  sort_run=None, temp_dir=None, progress=None, pause_event=None, stop_event=None):
+    """
+    Sort the lines of src into dst while holding about memory_mb in memory.
+
+    Args:
+        src: Input file, one item per line (blank lines are dropped)
+        dst: Output file; written to a temp file and renamed, so it is never
+             left half-written
+        line_key: Function from one line (bytes, newline included) to its sort key
+        reverse: Sort in descending order
+        header: If True, the first line is copied to dst unsorted
+        memory_mb: Approximate memory budget for one in-memory run
+        sort_run: Optional sort_run(lines, keys) -> sorted lines (in the
+                  direction given by reverse), or None to stop. Defaults to
+                  the built-in sort
+        temp_dir: Where run files go (default: dst's directory, so runs land
+                  on disk rather than in a RAM-backed /tmp)
+        progress: Optional progress(phase, done, total), phase "split" or
+                  "merge", measured in bytes
+        pause_event: Optional threading.Event; while cleared, the sort waits
+                     at its next progress update
+        stop_event: Optional threading.Event; once set, the sort stops
+
+    Returns:
+        Dict with "rows" and "runs", or None if stopped
+    """
+    if sort_run is None:
+        sort_run = lambda lines, keys: default_sort_run(lines, keys, reverse)
+    temp_dir = temp_dir or os.path.dirname(os.path.abspath(dst))
+    budget = max(1, int(memory_mb * 2**20))
+    total = os.path.getsize(src)
+    report = progress or (lambda phase, done, out_of: None)
+
+    def stopped():
+        if pause_event is not None:
+            pause_event.wait()
+        return stop_event is not None and stop_event.is_set()
+
+    runs = []
+    rows = 0
+    tmp_path = f"{dst}.tmp{os.getpid()}"
+    try:
+        with open(src, "rb") as f:
+            first_line = f.readline() if header else b""
+            if first_line and not first_line.endswith(b"\n"):
+                first_line += b"\n"
+
+            # Phase 1: sorted runs; a file that fits in one run skips phase 2
+            lines, used = [], 0
+            for line in f:
+                if not line.strip():
+                    continue
+                if not line.endswith(b"\n"):
+                    line += b"\n"
+                lines.append(line)
+                used += len(line) + ROW_OVERHEAD
+                if used >= budget:
+                    sorted_lines = sort_run(lines, [line_key(item) for item in lines])
+                    if sorted_lines is None:
+                        return None
+                    runs.append(spill_run(sorted_lines, temp_dir))
+                    rows += len(lines)
+                    lines, used = [], 0
+                    report("split", f.tell(), total)
+                    if stopped():
+                        return None
+
+            sorted_lines = sort_run(lines, [line_key(item) for item in lines])
+            if sorted_lines is None or stopped():
+                return None
+            rows += len(lines)
+            report("split", total, total)
+
+        with open(tmp_path, "wb") as out:
+            out.write(first_line)
+            if not runs:
+                out.writelines(sorted_lines)
+                report("merge", total, total)
+            else:
+                runs.append(spill_run(sorted_lines, temp_dir))
+                del lines, sorted_lines
+                if not merge_runs(runs, out, line_key, reverse, budget, report, stopped):
+                    return None
+        os.replace(tmp_path, dst)
+        return {"rows": rows, "runs": max(1, len(runs))}
+    finally:
+        for path in runs + [tmp_path]:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def spill_run(lines, temp_dir):
+    fd, path = tempfile.mkstemp(suffix=".run", prefix="sortlab-", dir=temp_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.writelines(lines)
+    return path
+
+
+def merge_runs(runs, out, line_key, reverse, budget, report, stopped):
+    """Phase 2: heap-merge the run files into out; False if stopped."""
+    total = sum(os.path.getsize(path) for path in runs)
+    buffer_size = max(MIN_READ_BUFFER, budget // len(runs))
+    files = [open(path, "rb", buffering=buffer_size) for path in runs]
+    try:
+        written = 0
+        batch = []
+        for line in heapq.merge(*files, key=line_key, reverse=reverse):
+            batch.append(line)
+            if len(batch) == WRITE_BATCH:
+                out.writelines(batch)
+                written += sum(map(len, batch))
+                batch.clear()
+                if written < total:
+                    report("merge", written, total)
+                if stopped():
+                    return False
+        out.writelines(batch)
+        report("merge", total, total)
+        return True
+    finally:
+        for f in files:
+            f.close()
+
+
+def sort_int_file(src, dst, reverse=False, **options):
+    """External sort of a data.txt-style file (one integer per line)."""
+    return external_sort(src, dst, int, reverse=reverse, **options)
+
+
+def print_progress(phase, done, total):
+    """Console progress callback for external_sort."""
+    percent = 100.0 * done / total if total else 100.0
+    label = "Splitting into sorted runs" if phase == "split" else "Merging runs"
+    print(f"\r  {label:<28} {percent:6.1f}%", end="\n" if done >= total else "", flush=True)
@@ -0,0 +1,250 @@
+"""
+Seeded, reproducible input generators.
+
+Sorting algorithms behave very differently on different input shapes:
+bubble and insertion sort finish in one pass on sorted input, a naive
+quicksort degrades on sorted or few-unique input, merge sort barely
+cares. generate_ints() builds integer inputs of a named shape:
+
+    uniform        independent values in [lo, hi]
+    sorted         uniform values, ascending
+    reversed       uniform values, descending
+    nearly-sorted  ascending, then `swaps` random pairs exchanged (default 1% of n)
+    few-unique     only `unique` distinct values (default 10)
+    sawtooth       repeated ascending ramps of `period` values (default sqrt(n))
+    organ-pipe     ascending to hi, then descending back
+    zigzag         the data.txt pattern: a descending run from hi and an
+                   ascending run from lo, randomly interleaved (hi=None
+                   makes the runs meet in the middle, as in data.txt;
+                   runs longer than the range wrap around inside it)
+
+generate_records() builds ID/FirstName/LastName rows shaped like
+generated_data.csv, as the (columns, strings) pair RecordTable.load_columns
+takes.
+
+Every call draws from its own random.Random(seed), so the same parameters
+always give the same data, on any machine and in any order of calls. The
+generators use C-level helpers (choices, sample, sort, list repetition)
+rather than per-element randint loops, which keeps a million integers or
+records to a second or two. cached_ints() / cached_records() additionally
+keep the result in the dataset cache, keyed on the parameters.
+"""
+import math, random
+from array import array
+
+from sortlab.cache import default_cache
+
+DEFAULT_SEED = 42
+DEFAULT_LOW = 1
+DEFAULT_HIGH = 100_000
+GENERATOR_VERSION = 2  # bump whenever a generator's output for given parameters changes
+ID_RANGE = (1_000_000, 10_000_000)  # 7-digit IDs, as in generated_data.csv
+
+FIRST_NAMES = [
+    "James", "John", "Robert", "Michael", "Mary", "William", "David", "Richard", "Joseph", "Linda",
+    "Patricia", "Barbara", "Elizabeth", "Jennifer", "Charles", "Thomas", "Susan", "Margaret", "Dorothy",
+    "Daniel", "Paul", "Mark", "Donald", "George", "Kenneth", "Steven", "Edward", "Brian", "Ronald",
+    "Anthony", "Kevin", "Jason", "Matthew", "Gary", "Timothy", "Jose", "Larry", "Jeffrey", "Frank",
+    "Nancy", "Karen", "Betty", "Helen", "Sandra", "Donna", "Carol", "Ruth", "Sharon", "Michelle",
+    "Laura", "Sarah", "Kimberly", "Deborah", "Jessica", "Shirley", "Cynthia", "Angela", "Melissa",
+    "Brenda", "Amy", "Anna", "Rebecca", "Virginia", "Kathleen", "Pamela", "Martha", "Debra", "Amanda",
+    "Stephanie", "Carolyn", "Christine", "Marie", "Janet", "Catherine", "Frances", "Ann", "Joyce",
+    "Diane", "Alice", "Julie", "Heather", "Teresa", "Doris", "Gloria", "Evelyn", "Jean", "Cheryl",
+    "Mildred", "Katherine", "Joan", "Ashley", "Judith", "Rose", "Janice", "Kelly", "Nicole", "Judy",
+    "Christina", "Kathy", "Theresa", "Beverly", "Denise", "Tammy", "Irene", "Jane", "Lori", "Rachel",
+    "Marilyn", "Andrea", "Kathryn", "Louise", "Sara", "Anne", "Jacqueline", "Wanda", "Bonnie", "Julia",
+    "Ruby", "Lois", "Tina", "Phyllis", "Norma", "Paula", "Diana", "Annie", "Lillian", "Emily", "Robin",
+    "Peggy", "Crystal", "Gladys", "Rita", "Dawn", "Connie", "Florence", "Tracy", "Edna", "Tiffany",
+    "Carmen", "Rosa", "Cindy", "Grace", "Wendy", "Victoria", "Edith", "Kim", "Sherry", "Sylvia",
+    "Josephine", "Thelma", "Shannon", "Sheila", "Ethel", "Ellen", "Elaine", "Marjorie", "Carrie",
+    "Bruce", "Austin", "Peter", "Henry", "Carl", "Arthur", "Ryan", "Roger", "Joe", "Juan", "Jack",
+    "Albert", "Jonathan", "Justin", "Terry", "Gerald", "Keith", "Samuel", "Willie", "Ralph", "Lawrence",
+    "Nicholas", "Roy", "Benjamin", "Bruno", "Adam", "Harry", "Fred", "Wayne", "Billy", "Steve", "Louis",
+    "Jeremy", "Aaron", "Randy", "Howard", "Eugene", "Carlos", "Russell", "Bobby", "Victor", "Martin",
+]
+
+# Last names are built from syllables, giving a few thousand distinct
+# names with plenty of shared prefixes, like the real dataset
+LAST_PREFIXES = [
+    "Ab", "Ad", "Al", "An", "Ar", "Bal", "Bar", "Ben", "Ber", "Blan", "Brow", "Cal", "Car", "Chan", "Clay",
+    "Col", "Crow", "Dal", "Dav", "Del", "Dick", "Don", "Ed", "El", "Fair", "Far", "Fer", "Flem", "Fran",
+    "Gal", "Gar", "Gil", "Gray", "Hal", "Har", "Hen", "Her", "Hol", "Jack", "Jen", "Kel", "Ken", "Kim",
+    "Lan", "Lar", "Lee", "Lin", "Mac", "Mar", "McAl", "Mel", "Mor", "Nel", "Nor", "Ol", "Os", "Par",
+    "Pay", "Pet", "Pres", "Ram", "Reev", "Rich", "Rob", "Ros", "Sal", "San", "Schul", "Shir", "Stan",
+    "Tal", "Ther", "Thom", "Trav", "Val", "Van", "Wal", "War", "Wil", "Wood", "Yan", "Zim",
+]
+LAST_SUFFIXES = [
+    "", "a", "an", "ard", "berg", "by", "den", "derson", "e", "el", "er", "ers", "es", "ett", "ford",
+    "ham", "ia", "in", "ings", "is", "kins", "ley", "lin", "man", "more", "ne", "o", "on", "ow", "s",
+    "sen", "ski", "son", "ston", "ter", "ton", "well", "y",
+]
+
+
+# ===== INTEGER SHAPES =====
+# Each takes (rng, n, lo, hi, **options) and returns a list of n ints.
+def uniform(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH):
+    return rng.choices(range(lo, hi + 1), k=n)
+
+
+def sorted_ints(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH):
+    values = uniform(rng, n, lo, hi)
+    values.sort()
+    return values
+
+
+def reversed_ints(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH):
+    values = uniform(rng, n, lo, hi)
+    values.sort(reverse=True)
+    return values
+
+
+def nearly_sorted(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH, swaps=None):
+    """Ascending with `swaps` random pairs exchanged (default: 1% of n, at least 1)."""
+    values = sorted_ints(rng, n, lo, hi)
+    if n > 1:
+        swaps = max(1, n // 100) if swaps is None else swaps
+        positions = rng.choices(range(n), k=2 * swaps)
+        for i, j in zip(positions[::2], positions[1::2]):
+            values[i], values[j] = values[j], values[i]
+    return values
+
+
+def few_unique(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH, unique=10):
+    pool = rng.sample(range(lo, hi + 1), min(unique, hi - lo + 1))
+    return rng.choices(pool, k=n)
+
+
+def _ramp(length, lo, hi):
+    """length values rising evenly from lo to hi."""
+    if length <= 1:
+        return [lo] * length
+    return [lo + (hi - lo) * i // (length - 1) for i in range(length)]
+
+
+def sawtooth(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH, period=None):
+    """Ascending ramps from lo to hi, each `period` long (default: sqrt(n))."""
+    period = max(2, math.isqrt(n)) if period is None else max(1, period)
+    tooth = _ramp(period, lo, hi)
+    return (tooth * (n // period + 1))[:n]
+
+
+def organ_pipe(rng, n, lo=DEFAULT_LOW, hi=DEFAULT_HIGH):
+    """Ascending from lo to hi over the first half, then back down."""
+    up = _ramp((n + 1) // 2, lo, hi)
+    return up + up[n // 2 - 1::-1] if n > 1 else up
+
+
+def zigzag(rng, n, lo=DEFAULT_LOW, hi=None):
+    """
+    A descending run from hi and an ascending run from lo, randomly
+    interleaved (default hi: lo + n - 1, so the runs meet in the middle).
+    When n is more than the range holds, the runs cross and wrap around
+    within [lo, hi], so no value ever falls outside it.
+    """
+    hi = lo + n - 1 if hi is None else hi
+    low, high = lo, hi
+    values = []
+    append = values.append
+    for take_high in rng.choices((True, False), k=n):
+        if take_high:
+            append(high)
+            high -= 1
+        else:
+            append(low)
+            low += 1
+    span = hi - lo + 1
+    if n > span:
+        values = [lo + (value - lo) % span for value in values]
+    return values
+
+
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "sorted": sorted_ints,
+    "reversed": reversed_ints,
+    "nearly-sorted": nearly_sorted,
+    "few-unique": few_unique,
+    "sawtooth": sawtooth,
+    "organ-pipe": organ_pipe,
+    "zigzag": zigzag,
+}
+
+
+def generate_ints(distribution, n, seed=DEFAULT_SEED, lo=DEFAULT_LOW, hi=DEFAULT_HIGH, **options):
+    """
+    n integers of the named shape (see DISTRIBUTIONS), reproducible from seed.
+
+    Args:
+        distribution: Key of DISTRIBUTIONS
+        n: Number of values
+        seed: Any int; the same parameters always give the same list
+        lo, hi: Value range (inclusive); zigzag ignores hi=None
+        options: Shape options (swaps, unique, period)
+
+    Raises:
+        KeyError: Unknown distribution
+        ValueError: lo > hi
+    """
+    if hi is not None and lo > hi:
+        raise ValueError("minimum value must not be greater than maximum value")
+    return DISTRIBUTIONS[distribution](random.Random(seed), n, lo, hi, **options)
+
+
+# ===== RECORDS =====
+def last_names():
+    return [prefix + suffix for prefix in LAST_PREFIXES for suffix in LAST_SUFFIXES]
+
+
+def generate_records(n, seed=DEFAULT_SEED):
+    """
+    n ID/FirstName/LastName rows like generated_data.csv: unique random
+    7-digit IDs in random order, first names from FIRST_NAMES and last
+    names from syllable combinations.
+
+    Returns:
+        (columns, strings) in the RecordTable.to_columns() layout
+    """
+    rng = random.Random(seed)
+    low, high = ID_RANGE
+    if n > high - low:
+        raise ValueError(f"at most {high - low:,} records have unique 7-digit IDs")
+    surnames = last_names()
+    columns = {
+        "ids": array("q", rng.sample(range(low, high), n)),
+        "first_codes": array("I", rng.choices(range(len(FIRST_NAMES)), k=n)),
+        "last_codes": array("I", rng.choices(range(len(surnames)), k=n)),
+    }
+    return columns, {"first_names": list(FIRST_NAMES), "last_names": surnames}
+
+
+# ===== CACHED =====
+def _params(kind, **params):
+    return dict(params, kind=kind, version=GENERATOR_VERSION)
+
+
+def cached_int_array(distribution, n, seed=DEFAULT_SEED, lo=DEFAULT_LOW, hi=DEFAULT_HIGH, cache=default_cache,
+                     **options):
+    """generate_ints() as an array('q'), read back from the dataset cache when generated before."""
+    params = _params("ints", distribution=distribution, n=n, seed=seed, lo=lo, hi=hi, **options)
+    hit = cache.load_generated(params)
+    if hit:
+        return hit[0]["values"]
+    values = array("q", generate_ints(distribution, n, seed, lo, hi, **options))
+    cache.store_generated(params, {"values": values})
+    return values
+
+
+def cached_ints(distribution, n, seed=DEFAULT_SEED, lo=DEFAULT_LOW, hi=DEFAULT_HIGH, cache=default_cache, **options):
+    """generate_ints(), read back from the dataset cache when these parameters were generated before."""
+    return cached_int_array(distribution, n, seed, lo, hi, cache, **options).tolist()
+
+
+def cached_records(n, seed=DEFAULT_SEED, cache=default_cache):
+    """generate_records(), read back from the dataset cache when generated before."""
+    params = _params("records", n=n, seed=seed)
+    hit = cache.load_generated(params)
+    if hit:
+        return hit[0], hit[1]
+    columns, strings = generate_records(n, seed)
+    cache.store_generated(params, columns, strings)
+    return columns, strings
@@ -0,0 +1,147 @@
+"""
+Optional operation counters for sorting algorithms.
+
+The algorithms themselves are not changed and check no flags: a counted run
+just passes in instrumented inputs, so normal runs pay nothing.
+
+- Keys are wrapped in int/float/str subclasses whose comparisons count
+  toward `comparisons`. They hash, print and do arithmetic like the originals.
+- The data list is a CountingList: item/slice writes, append, extend and
+  insert count toward `moves`. Copies and slices of it are CountingLists
+  too, so scratch buffers made from the input are counted; each of those
+  copies counts as one allocation.
+- `key_evaluations` counts calls to a key function wrapped by counting_key().
+- `peak_bytes` is the peak memory traced by tracemalloc during the run.
+
+Not counted: work done in other processes (process backend, parallel chunk
+sorts), and the radix and counting sorts' placements, which go through
+bucket lists and a fresh output list rather than the input list.
+Counting costs a Python call per operation, so time counted runs separately.
+"""
+import tracemalloc
+
+FIELDS = ("comparisons", "moves", "key_evaluations", "allocations", "peak_bytes")
+
+
+class OpCounts:
+    __slots__ = FIELDS
+
+    def __init__(self):
+        for field in FIELDS:
+            setattr(self, field, 0)
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def summary(self):
+        return (f"Comparisons: {self.comparisons:,} | Moves: {self.moves:,} | "
+                f"Key evals: {self.key_evaluations:,} | Allocations: {self.allocations:,} "
+                f"({self.peak_bytes / 1024:,.0f} KB peak)")
+
+
+_active = OpCounts()  # the counts that wrapped keys and lists report to
+
+
+def _counting_type(base):
+    def compare(name):
+        method = getattr(base, name)
+
+        def counted(self, other):
+            _active.comparisons += 1
+            return method(self, other)
+        return counted
+
+    namespace = {name: compare(name) for name in ("__lt__", "__le__", "__gt__", "__ge__", "__eq__", "__ne__")}
+    namespace["__hash__"] = base.__hash__
+    namespace["__slots__"] = ()
+    return type("Counting" + base.__name__.capitalize(), (base,), namespace)
+
+
+CountingInt = _counting_type(int)
+CountingFloat = _counting_type(float)
+CountingStr = _counting_type(str)
+COUNTING_TYPES = {int: CountingInt, float: CountingFloat, str: CountingStr}
+
+
+def counting_keys(keys):
+    """Copy of keys whose comparisons are counted (int, float and str keys)."""
+    return [COUNTING_TYPES.get(type(k), lambda value: value)(k) for k in keys]
+
+
+def counting_key(func):
+    """Wrap a key function so each call counts as a key evaluation."""
+    def key(item):
+        _active.key_evaluations += 1
+        return func(item)
+    return key
+
+
+class CountingList(list):
+    """list whose element writes count as moves; copies and slices stay counted."""
+    __slots__ = ()
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            _active.moves += len(value)
+        else:
+            _active.moves += 1
+        list.__setitem__(self, index, value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            _active.allocations += 1
+            return CountingList(list.__getitem__(self, index))
+        return list.__getitem__(self, index)
+
+    def copy(self):
+        _active.allocations += 1
+        return CountingList(self)
+
+    def append(self, value):
+        _active.moves += 1
+        list.append(self, value)
+
+    def extend(self, values):
+        values = list(values)
+        _active.moves += len(values)
+        list.extend(self, values)
+
+    def insert(self, index, value):
+        _active.moves += 1
+        list.insert(self, index, value)
+
+
+def run_counted(sort, data, keys=None):
+    """
+    Run sort(data, keys) on instrumented inputs and count its operations.
+
+    Args:
+        sort: Function taking (data, keys) and returning the sorted list
+        data: Items to sort; passed in as a CountingList
+        keys: Optional key column; passed in with counted comparisons
+
+    Returns:
+        Tuple of (sort result, OpCounts)
+    """
+    global _active
+    counts = _active = OpCounts()
+    data = CountingList(data)
+    if keys is not None:
+        keys = counting_keys(keys)
+
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    else:
+        tracemalloc.start()
+        baseline = 0
+    try:
+        result = sort(data, keys)
+        counts.peak_bytes = max(0, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+        _active = OpCounts()
+    return result, counts
@@ -0,0 +1,116 @@
+"""
+Bulk I/O for integer datasets.
+
+Two file formats are supported:
+
+- text: one integer per line, as in data.txt. It is parsed in bulk (one
+  read, one split, int() mapped over the tokens in C) instead of a
+  strip()/int() call per line in Python, and written in large joined
+  chunks instead of one write() per number;
+- binary (.i64): an 8-byte magic followed by little-endian signed 64-bit
+  integers. Loading maps the file with mmap and copies it into an
+  array('q') with frombytes, with no per-element Python work at all; a
+  few million numbers load in tens of milliseconds.
+
+load_ints() and save_ints() pick the format, from the file's magic when
+loading and from the extension when saving. Text loads go through the
+dataset cache, so a text file is only parsed once.
+"""
+import mmap, os, sys
+from array import array
+from itertools import islice
+
+from sortlab.cache import default_cache
+
+MAGIC = b"SLI64\x00\x01\n"  # format name, version 1
+BINARY_SUFFIX = ".i64"
+WRITE_CHUNK = 1 << 16  # numbers joined per write() when saving text
+BUFFER_BYTES = 1 << 20
+
+
+def is_binary(path):
+    """True if path starts with the binary format's magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def read_binary(path):
+    """
+    Load a binary (.i64) dataset into an array('q').
+
+    Raises:
+        ValueError: Not a binary dataset, or a truncated one
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < len(MAGIC) or f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a binary integer dataset")
+        if (size - len(MAGIC)) % 8:
+            raise ValueError(f"{path} is truncated")
+        values = array("q")
+        if size > len(MAGIC):
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view, view[len(MAGIC):] as body:
+                    values.frombytes(body)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def write_binary(path, values):
+    """Save ints as a binary (.i64) dataset (raises OverflowError beyond 64 bits)."""
+    column = values if isinstance(values, array) and values.typecode == "q" else array("q", values)
+    if sys.byteorder == "big":
+        column = array("q", column)
+        column.byteswap()
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        column.tofile(f)
+
+
+def read_text(path):
+    """
+    Parse a whitespace-separated (normally one per line) integer file in bulk.
+
+    Raises:
+        ValueError: A token is not an integer
+    """
+    with open(path, "rb") as f:
+        return list(map(int, f.read().split()))
+
+
+def write_text(path, values):
+    """Save ints one per line, joined and written WRITE_CHUNK numbers at a time."""
+    iterator = iter(values)
+    with open(path, "w", encoding="ascii", buffering=BUFFER_BYTES) as f:
+        while True:
+            chunk = list(islice(iterator, WRITE_CHUNK))
+            if not chunk:
+                break
+            f.write("\n".join(map(str, chunk)))
+            f.write("\n")
+
+
+def load_ints(path, cache=default_cache):
+    """
+    Load an integer dataset in either format as a list.
+
+    Raises:
+        OSError: The file cannot be read
+        ValueError: Invalid data
+    """
+    if is_binary(path):
+        return read_binary(path).tolist()
+    values = cache.load_ints(path)
+    if values is None:
+        values = read_text(path)
+        cache.store_ints(path, values)
+    return values
+
+
+def save_ints(path, values):
+    """Save as binary if path ends in .i64, otherwise as text."""
+    if path.lower().endswith(BINARY_SUFFIX):
+        write_binary(path, values)
+    else:
+        write_text(path, values)
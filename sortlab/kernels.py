@@ -0,0 +1,348 @@
+"""
+Shared comparison-sort kernels, specialized per order and key layout.
+
+The lab programs and the exam benchmark all need the same comparison
+sorts, ascending or descending, either on plain values or on a
+precomputed key column with the items moving in tandem. A single
+general implementation would pay for that on every comparison (a
+comparator call, a `reverse` test, a key lookup through a function).
+Instead each kernel is written once as a source template and compiled
+into one function per variant:
+
+    order   ascending (ties keep input order) or descending
+    keys    identity: sort(items) compares the items themselves
+            keyed:    sort(keys, items) compares keys[i] and moves
+                      keys and items together
+
+so every inner loop is a plain `a > b` or `a < b` on local lists. Look
+them up by name (bubble_sort_descending, merge_sort_ascending_keyed, ...)
+or with kernel().
+
+Besides merge sort, the kernels are the quadratic-class sorts and their
+adaptive variants, which do less work the closer the input is to sorted:
+
+    classic_bubble_sort    always n passes
+    bubble_sort            stops after the first pass without a swap
+    cocktail_shaker_sort   alternates forward and backward passes and
+                           shrinks both ends to the last swap, so small
+                           values near the end move back in one pass
+    insertion_sort         shifts one element at a time
+    binary_insertion_sort  skips elements already in place, finds the
+                           insertion point with a binary search (bisect
+                           in C when ascending) and shifts the block
+                           with one slice assignment
+    shell_sort_ciura,      insertion sort over shrinking gaps, with
+    shell_sort_sedgewick   Ciura's or Sedgewick's sequence (not stable)
+
+All other kernels are stable.
+
+Kernels work on the lists they are given (copy first to keep the input):
+merge sort returns a sorted list that may be its scratch buffer, so use
+the return value; the others sort in place and return items.
+
+progress(done, total), if given, is called after every pass (bubble,
+cocktail shaker), element (insertion) or block of work (the others); if
+it returns False the sort stops and returns None.
+"""
+import re
+from bisect import bisect_right
+
+PROGRESS_STEPS = 100  # block kernels report about this many times (per pass)
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701)  # extended by x2.25 beyond 701
+
+
+
+# ===== GAP SEQUENCES =====
+# Each returns the gaps below n, largest first and ending in 1
+def ciura_gaps(n):
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] * 9 // 4 < n:
+        gaps.append(gaps[-1] * 9 // 4)
+    return [gap for gap in reversed(gaps) if gap < n]
+
+
+def sedgewick_gaps(n):
+    """Sedgewick (1986): 1, 8, 23, 77, 281, ... = 4**k + 3 * 2**(k - 1) + 1."""
+    gaps, k = [1], 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return [gap for gap in reversed(gaps) if gap < n]
+
+
+GAP_SEQUENCES = {"ciura": ciura_gaps, "sedgewick": sedgewick_gaps}
+
+
+# ===== TEMPLATES =====
+# Template lines tagged "#: tag" are only kept in variants with that tag
+# (the order, "ascending" or "descending", is always one of the tags).
+# Templates are written for the keyed variant; identity variants drop the
+# payload lines and sort the items as their own keys.
+_BUBBLE = """
+def {name}({params}, progress=None):
+    n = len(keys)
+    for i in range(n):
+        swapped = False  #: early-exit
+        for j in range(n - i - 1):
+            if keys[j] {after} keys[j + 1]:
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                items[j], items[j + 1] = items[j + 1], items[j]  #: payload
+                swapped = True  #: early-exit
+        if not swapped:  #: early-exit
+            if progress is not None:  #: early-exit
+                progress(n, n)  #: early-exit
+            break  #: early-exit
+        if progress is not None and progress(i + 1, n) is False:
+            return None
+    return items
+"""
+
+_INSERTION = """
+def {name}({params}, progress=None):
+    n = len(keys)
+    for i in range(1, n):
+        cur_key = keys[i]
+        cur = items[i]  #: payload
+        j = i - 1
+        while j >= 0 and keys[j] {after} cur_key:
+            keys[j + 1] = keys[j]
+            items[j + 1] = items[j]  #: payload
+            j -= 1
+        keys[j + 1] = cur_key
+        items[j + 1] = cur  #: payload
+        if progress is not None and progress(i + 1, n) is False:
+            return None
+    return items
+"""
+
+# Bottom-up: sorted runs of width 1, 2, 4, ... are merged back and forth
+# between two buffers with index cursors, never slicing at every level.
+# The scratch buffers are copies rather than [None] * n so they stay the
+# same kind of list as the input (instrument.CountingList included).
+_MERGE = """
+def {name}({params}, progress=None):
+    n = len(keys)
+    src = items  #: payload
+    ksrc = keys
+    if n <= 1:
+        if progress is not None:
+            progress(n, n)
+        return items
+    dst = src.copy()  #: payload
+    kdst = ksrc.copy()
+
+    total = (n - 1).bit_length() * n  # one unit per element per pass
+    interval = max(1, total // PROGRESS_STEPS)
+    done = 0
+    next_update = interval
+
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid >= hi:
+                dst[lo:hi] = src[lo:hi]  #: payload
+                kdst[lo:hi] = ksrc[lo:hi]
+                continue
+
+            i, j, k = lo, mid, lo
+            ki, kj = ksrc[i], ksrc[j]
+            while True:
+                if kj {before} ki:  # strict, so ties keep the left run first
+                    dst[k] = src[j]  #: payload
+                    kdst[k] = kj
+                    k += 1
+                    j += 1
+                    if j == hi:
+                        dst[k:hi] = src[i:mid]  #: payload
+                        kdst[k:hi] = ksrc[i:mid]
+                        break
+                    kj = ksrc[j]
+                else:
+                    dst[k] = src[i]  #: payload
+                    kdst[k] = ki
+                    k += 1
+                    i += 1
+                    if i == mid:
+                        dst[k:hi] = src[j:hi]  #: payload
+                        kdst[k:hi] = ksrc[j:hi]
+                        break
+                    ki = ksrc[i]
+
+            done += hi - lo
+            if done >= next_update and progress is not None:
+                next_update = done + interval
+                if progress(done, total) is False:
+                    return None
+
+        src, dst = dst, src  #: payload
+        ksrc, kdst = kdst, ksrc
+        width *= 2
+
+    if progress is not None:
+        progress(total, total)
+    return src
+"""
+
+_COCKTAIL = """
+def {name}({params}, progress=None):
+    n = len(keys)
+    lo, hi = 0, n - 1
+    while lo < hi:
+        last = lo
+        for j in range(lo, hi):
+            if keys[j] {after} keys[j + 1]:
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                items[j], items[j + 1] = items[j + 1], items[j]  #: payload
+                last = j
+        hi = last  # everything after the last swap is in place
+        for j in range(hi - 1, lo - 1, -1):
+            if keys[j] {after} keys[j + 1]:
+                keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                items[j], items[j + 1] = items[j + 1], items[j]  #: payload
+                last = j + 1
+        lo = last  # and everything before it on the way back
+        if progress is not None and progress(n - (hi - lo), n) is False:
+            return None
+    return items
+"""
+
+_BINARY_INSERTION = """
+def {name}({params}, progress=None):
+    n = len(keys)
+    block = max(1, n // PROGRESS_STEPS)
+    for start in range(1, n, block):
+        for i in range(start, min(start + block, n)):
+            cur_key = keys[i]
+            if keys[i - 1] {after} cur_key:
+                pos = bisect_right(keys, cur_key, 0, i - 1)  #: ascending
+                lo, hi = 0, i - 1  #: descending
+                while lo < hi:  #: descending
+                    mid = (lo + hi) // 2  #: descending
+                    if cur_key > keys[mid]:  #: descending
+                        hi = mid  #: descending
+                    else:  #: descending
+                        lo = mid + 1  #: descending
+                pos = lo  #: descending
+                keys[pos + 1:i + 1] = keys[pos:i]
+                keys[pos] = cur_key
+                cur = items[i]  #: payload
+                items[pos + 1:i + 1] = items[pos:i]  #: payload
+                items[pos] = cur  #: payload
+        if progress is not None and progress(min(start + block, n), n) is False:
+            return None
+    return items
+"""
+
+_SHELL = """
+def {name}({params}, progress=None):
+    n = len(keys)
+    gaps = ciura_gaps(n)  #: ciura
+    gaps = sedgewick_gaps(n)  #: sedgewick
+    total = len(gaps) * n
+    block = max(1, n // PROGRESS_STEPS)
+    for g, gap in enumerate(gaps):
+        for start in range(gap, n, block):
+            for i in range(start, min(start + block, n)):
+                cur_key = keys[i]
+                if keys[i - gap] {after} cur_key:
+                    cur = items[i]  #: payload
+                    j = i
+                    while True:
+                        keys[j] = keys[j - gap]
+                        items[j] = items[j - gap]  #: payload
+                        j -= gap
+                        if j < gap or not keys[j - gap] {after} cur_key:
+                            break
+                    keys[j] = cur_key
+                    items[j] = cur  #: payload
+            if progress is not None and progress(g * n + min(start + block, n), total) is False:
+                return None
+    if progress is not None:
+        progress(total, total)
+    return items
+"""
+
+# name -> (template, tags, description)
+TEMPLATES = {
+    "classic_bubble_sort": (_BUBBLE, set(), "Bubble sort, always making all n passes; stable."),
+    "bubble_sort": (_BUBBLE, {"early-exit"}, "Bubble sort, stopping after the first pass without a swap; stable."),
+    "cocktail_shaker_sort": (_COCKTAIL, set(), "Cocktail shaker sort, shrinking both ends to the last swap; stable."),
+    "insertion_sort": (_INSERTION, set(), "Insertion sort; stable."),
+    "binary_insertion_sort": (
+        _BINARY_INSERTION, set(), "Binary insertion sort with slice-assignment block moves; stable."
+    ),
+    "shell_sort_ciura": (_SHELL, {"ciura"}, "Shell sort with Ciura's gap sequence; not stable."),
+    "shell_sort_sedgewick": (_SHELL, {"sedgewick"}, "Shell sort with Sedgewick's gap sequence; not stable."),
+    "merge_sort": (_MERGE, set(), "Bottom-up merge sort with two ping-pong buffers; stable."),
+}
+ORDERS = ("ascending", "descending")
+
+# Identity variants compare the items themselves: the key names become
+# the item names and the payload lines are dropped
+_IDENTITY_NAMES = {"keys": "items", "ksrc": "src", "kdst": "dst"}
+_TAG = re.compile(r"\s*#: ([\w-]+)$")
+
+KERNELS = {}  # (name, descending, keyed) -> function
+
+
+def render(template, name, tags, descending, keyed):
+    """Source of one variant of a template."""
+    lines = []
+    for line in template.strip("\n").splitlines():
+        tag = _TAG.search(line)
+        if tag:
+            if tag.group(1) not in tags and not (keyed and tag.group(1) == "payload"):
+                continue
+            line = line[:tag.start()]
+        lines.append(line)
+    source = "\n".join(lines).format(
+        name=name, params="keys, items" if keyed else "items",
+        after="<" if descending else ">", before=">" if descending else "<"
+    )
+    if not keyed:
+        source = re.sub(r"\b(keys|ksrc|kdst)\b", lambda m: _IDENTITY_NAMES[m.group(1)], source)
+    return source + "\n"
+
+
+def _compile(algorithm, descending, keyed):
+    template, tags, description = TEMPLATES[algorithm]
+    name = f"{algorithm}_{ORDERS[descending]}" + ("_keyed" if keyed else "")
+    namespace = {
+        "PROGRESS_STEPS": PROGRESS_STEPS, "bisect_right": bisect_right,
+        "ciura_gaps": ciura_gaps, "sedgewick_gaps": sedgewick_gaps
+    }
+    source = render(template, name, tags | {ORDERS[descending]}, descending, keyed)
+    exec(compile(source, f"<sortlab.kernels.{name}>", "exec"), namespace)
+    function = namespace[name]
+    function.__module__ = __name__
+    function.__doc__ = (
+        f"{description} {ORDERS[descending].capitalize()}; "
+        + ("sorts keys, moving items in tandem." if keyed else "compares the items themselves.")
+    )
+    return function
+
+
+def kernel(algorithm, descending=False, keyed=False):
+    """
+    The specialized variant of a kernel.
+
+    Args:
+        algorithm: Key of TEMPLATES
+        descending: Largest first instead of smallest first
+        keyed: Take (keys, items) instead of (items)
+
+    Raises:
+        KeyError: Unknown algorithm
+    """
+    return KERNELS[algorithm, bool(descending), bool(keyed)]
+
+
+for _algorithm in TEMPLATES:
+    for _descending in (False, True):
+        for _keyed in (False, True):
+            _function = _compile(_algorithm, _descending, _keyed)
+            KERNELS[_algorithm, _descending, _keyed] = _function
+            globals()[_function.__name__] = _function
+del _algorithm, _descending, _keyed, _function
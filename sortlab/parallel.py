@@ -0,0 +1,106 @@
+"""
+Parallel merge sort building blocks.
+
+The input is split into one contiguous chunk per worker, each chunk is
+sorted concurrently in a process pool with the program's own merge sort,
+and the sorted runs are combined with a heap-based k-way merge
+(heapq.merge). The merge takes ties from earlier chunks first, so the
+whole sort stays stable when the chunk sort is stable.
+
+Pools are created on first use and kept for later runs, so only the
+first parallel sort in a session pays for starting the worker processes.
+The worker count defaults to the CPU count and can be changed with the
+SORTLAB_WORKERS environment variable.
+"""
+import heapq, multiprocessing as mp, os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+MIN_CHUNK = 10_000  # smaller chunks cost more to ship to a worker than to sort
+
+_pools = {}
+
+
+def default_workers():
+    return int(os.environ.get("SORTLAB_WORKERS", 0)) or os.cpu_count() or 1
+
+
+def chunk_bounds(n, workers=None):
+    """(start, end) of each contiguous chunk; fewer chunks if n is small."""
+    workers = workers or default_workers()
+    parts = max(1, min(workers, n // MIN_CHUNK))
+    step, extra = divmod(n, parts)
+    bounds = []
+    start = 0
+    for i in range(parts):
+        end = start + step + (1 if i < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def get_pool(workers):
+    pool = _pools.get(workers)
+    if pool is None:
+        # spawn: safe to start from a process that runs threads (e.g. Tk)
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn"))
+        _pools[workers] = pool
+    return pool
+
+
+def shutdown_pools():
+    """Stop the cached worker pools (a multiprocessing child must do this before it exits)."""
+    while _pools:
+        _pools.popitem()[1].shutdown(cancel_futures=True)
+
+
+def sort_chunks(task, chunks, on_chunk=None):
+    """
+    Run task(chunk) for every chunk and return the results in chunk order.
+
+    A single chunk is sorted in this process. on_chunk(index, result) is
+    called as each chunk finishes; if it returns False, the remaining
+    chunks are abandoned and None is returned.
+    """
+    if len(chunks) == 1:
+        result = task(chunks[0])
+        if on_chunk and on_chunk(0, result) is False:
+            return None
+        return [result]
+
+    pool = get_pool(len(chunks))
+    futures = {pool.submit(task, chunk): i for i, chunk in enumerate(chunks)}
+    runs = [None] * len(chunks)
+    for future in as_completed(futures):
+        i = futures[future]
+        runs[i] = future.result()
+        if on_chunk and on_chunk(i, runs[i]) is False:
+            for other in futures:
+                other.cancel()
+            return None
+    return runs
+
+
+def kway_merge(runs, key=None, reverse=False):
+    """Lazily merge sorted runs with a heap; ties keep run order."""
+    if len(runs) == 1:
+        return iter(runs[0])
+    return heapq.merge(*runs, key=key, reverse=reverse)
+
+
+def parallel_sort(data, sort_chunk, workers=None, reverse=False):
+    """
+    Sort a list of plain values (e.g. ints) in parallel.
+
+    Args:
+        data: List to sort (not modified)
+        sort_chunk: Picklable module-level function that returns a sorted
+                    copy of a list, in the same direction as reverse
+        workers: Number of processes (default: default_workers())
+        reverse: True if sort_chunk sorts in descending order
+
+    Returns:
+        New sorted list
+    """
+    chunks = [data[start:end] for start, end in chunk_bounds(len(data), workers)]
+    runs = sort_chunks(sort_chunk, chunks)
+    return list(kway_merge(runs, reverse=reverse))
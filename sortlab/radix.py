@@ -0,0 +1,113 @@
+"""
+Non-comparison sorts for integer keys: counting sort and LSD radix sort.
+
+Both move items by their key (items and keys are parallel lists) and are
+stable in either direction, so records sorted by ID keep their input order
+for equal IDs. Keys may be negative; they are shifted by the minimum first.
+
+The radix sort picks its digit width from the key range: as few passes
+as possible, with at most about n buckets (and never more than
+2**MAX_DIGIT_BITS) per pass. Each pass distributes positions into bucket
+lists, which in Python is faster than a count + prefix-sum pass.
+
+progress(done, total), if given, is called after every block of work; if it
+returns False the sort stops and returns None.
+"""
+from itertools import chain
+
+MIN_DIGIT_BITS = 4
+MAX_DIGIT_BITS = 16
+COUNTING_MAX_SPAN = 1 << 20  # wider key ranges are radix sorted instead
+COUNTING_MIN_SPAN = 1 << 8  # ranges up to this are always counted, however few keys
+BLOCKS_PER_PASS = 20
+
+
+def key_offsets(keys):
+    """(keys shifted so the smallest is 0, largest shifted key)."""
+    if not keys:
+        return [], 0
+    lo, hi = min(keys), max(keys)
+    return ([k - lo for k in keys] if lo else list(keys)), hi - lo
+
+
+def digit_width(span, n):
+    """(bits per digit, number of passes) for shifted keys in 0..span."""
+    bits = span.bit_length()
+    if bits == 0:
+        return 0, 0
+    max_bits = max(MIN_DIGIT_BITS, min(MAX_DIGIT_BITS, n.bit_length()))
+    passes = -(-bits // max_bits)
+    return -(-bits // passes), passes
+
+
+def radix_sort(items, keys, reverse=False, progress=None):
+    """
+    Stable LSD radix sort of items by integer keys.
+
+    Returns:
+        New sorted list of items, or None if progress returned False
+    """
+    n = len(keys)
+    offsets, span = key_offsets(keys)
+    width, passes = digit_width(span, n)
+    mask = (1 << width) - 1
+    block = max(1, n // BLOCKS_PER_PASS)
+    total = passes * n
+
+    order = range(n)
+    for p in range(passes):
+        shift = p * width
+        buckets = [[] for _ in range(mask + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for start in range(0, n, block):
+            for i in order[start:start + block]:
+                appends[offsets[i] >> shift & mask](i)
+            if progress and progress(p * n + min(start + block, n), total) is False:
+                return None
+        # Reversing the bucket order on every pass gives a stable descending sort
+        if reverse:
+            buckets.reverse()
+        order = list(chain.from_iterable(buckets))
+
+    return [items[i] for i in order]
+
+
+def counting_sort(items, keys, reverse=False, progress=None):
+    """
+    Stable counting sort of items by integer keys.
+
+    Key ranges wider than the data itself (or than COUNTING_MAX_SPAN) would
+    need a count table larger than the input, so they are radix sorted;
+    ranges up to COUNTING_MIN_SPAN are counted even for a few keys.
+
+    Returns:
+        New sorted list of items, or None if progress returned False
+    """
+    n = len(keys)
+    offsets, span = key_offsets(keys)
+    if span >= min(COUNTING_MAX_SPAN, max(COUNTING_MIN_SPAN, n)):
+        return radix_sort(items, keys, reverse, progress)
+
+    counts = [0] * (span + 1)
+    for k in offsets:
+        counts[k] += 1
+    if progress and progress(n, 2 * n) is False:
+        return None
+
+    # First output slot of each key value
+    starts = [0] * (span + 1)
+    slot = 0
+    for value in (reversed(range(span + 1)) if reverse else range(span + 1)):
+        starts[value] = slot
+        slot += counts[value]
+
+    result = [None] * n
+    block = max(1, n // BLOCKS_PER_PASS)
+    for start in range(0, n, block):
+        for i in range(start, min(start + block, n)):
+            k = offsets[i]
+            result[starts[k]] = items[i]
+            starts[k] += 1
+        if progress and progress(n + min(start + block, n), 2 * n) is False:
+            return None
+    return result
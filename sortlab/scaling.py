@@ -0,0 +1,141 @@
+"""
+Input-size scaling sweeps and empirical complexity fits.
+
+A sweep times one algorithm over a geometric series of input sizes
+(1k, 2k, 4k, ...). The times are fitted with a power law
+
+    t(n) = a * n**b
+
+by least squares on log t = log a + b log n. The exponent b is the
+empirical complexity: about 2 for bubble/insertion sort, slightly above 1
+for n log n sorts, about 1 for radix/counting sort. The fit then
+extrapolates the time for sizes too large to run.
+
+Quadratic sorts would take hours at 1M rows, so a sweep stops early once
+a size takes longer than max_seconds, or once the fit so far predicts the
+next size would take much longer than that.
+"""
+import csv, json, math
+
+DEFAULT_START = 1_000
+DEFAULT_STOP = 1_000_000
+DEFAULT_FACTOR = 2
+DEFAULT_MAX_SECONDS = 2.0
+DEFAULT_TARGETS = (1_000_000, 10_000_000, 100_000_000)
+PREDICT_SLACK = 4  # skip the next size if it is predicted to take 4x max_seconds
+MIN_FIT_SECONDS = 1e-4  # shorter times are mostly timer and call overhead
+CURVE_FIELDS = ["algorithm", "n", "seconds"]
+
+
+def geometric_sizes(start=DEFAULT_START, stop=DEFAULT_STOP, factor=DEFAULT_FACTOR):
+    """start, start*factor, ... up to and including stop."""
+    sizes = []
+    n = start
+    while n < stop:
+        sizes.append(int(n))
+        n *= factor
+    sizes.append(int(stop))
+    return sizes
+
+
+class PowerLawFit:
+    """t(n) = constant * n**exponent, fitted on log-log scales."""
+
+    def __init__(self, points):
+        usable = [(n, t) for n, t in points if n > 0 and t >= MIN_FIT_SECONDS]
+        if len(usable) < 2:
+            usable = [(n, t) for n, t in points if n > 0 and t > 0]
+        if len(usable) < 2:
+            raise ValueError("need at least two timed sizes to fit")
+        xs = [math.log(n) for n, _ in usable]
+        ys = [math.log(t) for _, t in usable]
+        mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+        sxx = sum((x - mean_x) ** 2 for x in xs)
+        sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        if sxx == 0:
+            raise ValueError("need at least two different sizes to fit")
+        self.exponent = sxy / sxx
+        self.constant = math.exp(mean_y - self.exponent * mean_x)
+        ss_res = sum((y - (mean_y + self.exponent * (x - mean_x))) ** 2 for x, y in zip(xs, ys))
+        ss_tot = sum((y - mean_y) ** 2 for y in ys)
+        self.r_squared = 1 - ss_res / ss_tot if ss_tot else 1.0
+        self.points = len(usable)
+
+    def predict(self, n):
+        """Predicted seconds for n items."""
+        return self.constant * n ** self.exponent
+
+    def describe(self):
+        return f"t(n) ≈ {self.constant:.3e} · n^{self.exponent:.2f} (R² = {self.r_squared:.3f})"
+
+    def as_dict(self):
+        return {"exponent": self.exponent, "constant": self.constant,
+                "r_squared": self.r_squared, "points": self.points}
+
+
+def sweep(time_size, sizes, max_seconds=DEFAULT_MAX_SECONDS, on_point=None):
+    """
+    Time one algorithm over increasing sizes, stopping early when it gets slow.
+
+    Args:
+        time_size: time_size(n) -> seconds for n items, or None to abort
+        sizes: Increasing input sizes
+        max_seconds: Stop after a size takes longer than this, or when the
+                     fit predicts the next size takes PREDICT_SLACK times longer
+        on_point: Optional on_point(n, seconds) after each size
+
+    Returns:
+        List of (n, seconds), or None if time_size aborted
+    """
+    points = []
+    for n in sizes:
+        if len(points) >= 2:
+            try:
+                if PowerLawFit(points).predict(n) > max_seconds * PREDICT_SLACK:
+                    break
+            except ValueError:
+                pass
+        seconds = time_size(n)
+        if seconds is None:
+            return None
+        points.append((n, seconds))
+        if on_point:
+            on_point(n, seconds)
+        if seconds > max_seconds:
+            break
+    return points
+
+
+def format_duration(seconds):
+    """Human-readable duration for extrapolated times ('850 ms', '3.2 h')."""
+    for unit, size in (("d", 86400), ("h", 3600), ("min", 60), ("s", 1)):
+        if seconds >= size:
+            return f"{seconds / size:.1f} {unit}"
+    return f"{seconds * 1000:.1f} ms"
+
+
+def write_curves(path, curves, fits=None, targets=()):
+    """
+    Export sweep results.
+
+    .json gets {algorithm: {"points", "fit", "predictions"}}; any other
+    extension gets one CSV row per measured point (algorithm, n, seconds).
+    """
+    if path.lower().endswith(".json"):
+        data = {}
+        for algorithm, points in curves.items():
+            fit = (fits or {}).get(algorithm)
+            data[algorithm] = {
+                "points": [{"n": n, "seconds": t} for n, t in points],
+                "fit": fit.as_dict() if fit else None,
+                "predictions": {str(n): fit.predict(n) for n in targets} if fit else {}
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CURVE_FIELDS)
+        for algorithm, points in curves.items():
+            writer.writerows((algorithm, n, t) for n, t in points)
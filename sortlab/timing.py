@@ -0,0 +1,133 @@
+"""
+Pause-aware, high-resolution timing.
+
+Wall time comes from time.perf_counter_ns and CPU time from
+time.process_time_ns. Nothing here uses time.time(), whose resolution and
+clock adjustments make it unsuitable for benchmarks.
+
+- PhaseTimer measures a whole job and its named phases (load, prepare,
+  sort, render, export, ...). While the timer is paused its clock stands
+  still, so pauses are not counted in any phase or in the total.
+- PauseMeter wraps the pause event handed to an algorithm and adds up the
+  time spent blocked in wait(). Subtracting it gives the time the
+  algorithm actually ran, measured where it runs (thread or process).
+- measure() times a single call, for the console programs.
+"""
+import threading, time
+from contextlib import contextmanager
+
+NS = 1_000_000_000
+
+
+class PhaseTimer:
+    """Wall/CPU time of a job and its phases, excluding paused spans."""
+
+    def __init__(self):
+        self.phases = {}  # name -> [wall_ns, cpu_ns], in first-recorded order
+        self._lock = threading.Lock()
+        self._paused_ns = 0
+        self._paused_at = None
+        self._started = time.perf_counter_ns()
+        self._stopped = None
+
+    def now_ns(self):
+        """perf_counter_ns minus all paused time so far."""
+        with self._lock:
+            now = time.perf_counter_ns()
+            paused = self._paused_ns + (now - self._paused_at if self._paused_at is not None else 0)
+        return now - paused
+
+    def pause(self):
+        with self._lock:
+            if self._paused_at is None:
+                self._paused_at = time.perf_counter_ns()
+
+    def resume(self):
+        with self._lock:
+            if self._paused_at is not None:
+                self._paused_ns += time.perf_counter_ns() - self._paused_at
+                self._paused_at = None
+
+    @property
+    def paused(self):
+        return self._paused_at is not None
+
+    def stop(self):
+        """Freeze the total at this point."""
+        self._stopped = self.now_ns()
+
+    @property
+    def elapsed(self):
+        """Seconds since the timer was created, not counting pauses."""
+        end = self._stopped if self._stopped is not None else self.now_ns()
+        return (end - self._started) / NS
+
+    @contextmanager
+    def phase(self, name):
+        """Time the with-block as phase name (repeated phases add up)."""
+        wall, cpu = self.now_ns(), time.process_time_ns()
+        try:
+            yield
+        finally:
+            self.add(name, self.now_ns() - wall, time.process_time_ns() - cpu)
+
+    def add(self, name, wall_ns, cpu_ns=None):
+        """Record time measured elsewhere (e.g. by a backend) under name; CPU may be unknown."""
+        totals = self.phases.setdefault(name, [0, 0])
+        totals[0] += wall_ns
+        totals[1] = None if cpu_ns is None or totals[1] is None else totals[1] + cpu_ns
+
+    def seconds(self, name):
+        return self.phases[name][0] / NS if name in self.phases else 0.0
+
+    def cpu_seconds(self, name):
+        """CPU seconds of a phase, or None if it was measured elsewhere."""
+        cpu = self.phases[name][1] if name in self.phases else 0
+        return None if cpu is None else cpu / NS
+
+    def as_dict(self):
+        """{phase: {"wall_s": ..., "cpu_s": ...}} for JSON metadata."""
+        return {
+            name: {"wall_s": round(wall / NS, 6), "cpu_s": None if cpu is None else round(cpu / NS, 6)}
+            for name, (wall, cpu) in self.phases.items()
+        }
+
+    def summary(self):
+        """'Prepare: 0.0012s | Sort: 0.3456s | ...' in recorded order."""
+        return " | ".join(f"{name.capitalize()}: {wall / NS:.4f}s" for name, (wall, _) in self.phases.items())
+
+
+class PauseMeter:
+    """Stands in for a pause event and adds up the time spent waiting on it."""
+
+    def __init__(self, event):
+        self.event = event
+        self.paused_ns = 0
+
+    def wait(self, timeout=None):
+        if self.event.is_set():
+            return True
+        start = time.perf_counter_ns()
+        try:
+            return self.event.wait(timeout)
+        finally:
+            self.paused_ns += time.perf_counter_ns() - start
+
+    def running_seconds(self, start_ns):
+        """Seconds since perf_counter_ns() was start_ns, minus the time spent paused."""
+        return (time.perf_counter_ns() - start_ns - self.paused_ns) / NS
+
+    def __getattr__(self, name):
+        return getattr(self.event, name)
+
+
+def measure(func, *args):
+    """
+    Call func(*args) once and time it.
+
+    Returns:
+        Tuple of (result, wall seconds, CPU seconds)
+    """
+    wall, cpu = time.perf_counter_ns(), time.process_time_ns()
+    result = func(*args)
+    return result, (time.perf_counter_ns() - wall) / NS, (time.process_time_ns() - cpu) / NS
@@ -0,0 +1,129 @@
+"""
+Repeated-trial timing with summary statistics.
+
+A single timing is one noisy sample: caches, CPU frequency scaling, other
+processes and the garbage collector all move it around. run_trials() does
+what a careful benchmark does by hand:
+
+1. warmup runs, untimed, so imports, caches and allocator pools are warm;
+2. N timed repetitions, each on a fresh copy of the input (made before the
+   clock starts), optionally with the garbage collector disabled;
+3. outlier rejection with Tukey's fences (outside 1.5 x IQR of the
+   quartiles), which drops e.g. a run hit by a scheduler hiccup;
+4. median, mean, p95, sample standard deviation and a 95% confidence
+   interval of the mean (Student's t) over the kept samples.
+
+The median is the number to compare: unlike the mean it is not dragged
+around by a slow tail. Two algorithms whose confidence intervals overlap
+are not reliably different on this machine.
+"""
+import gc, math, statistics, time
+
+from sortlab.timing import NS
+
+DEFAULT_REPEATS = 5
+DEFAULT_WARMUP = 1
+TUKEY_K = 1.5
+MIN_SAMPLES_FOR_OUTLIERS = 4  # with fewer, quartiles say nothing useful
+
+# Two-sided 95% Student's t critical values by degrees of freedom;
+# past the table the normal value 1.96 is close enough
+T_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
+
+
+def t_critical(df):
+    return T_95[df - 1] if df <= len(T_95) else 1.96
+
+
+def percentile(sorted_samples, p):
+    """Nearest-rank percentile (0 < p <= 100) of already sorted samples."""
+    rank = max(1, math.ceil(p / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def reject_outliers(samples, k=TUKEY_K):
+    """(kept, rejected) samples by Tukey's fences; small samples are all kept."""
+    if len(samples) < MIN_SAMPLES_FOR_OUTLIERS:
+        return list(samples), []
+    q1, _, q3 = statistics.quantiles(samples, n=4)
+    low, high = q1 - k * (q3 - q1), q3 + k * (q3 - q1)
+    kept = [s for s in samples if low <= s <= high]
+    return kept, [s for s in samples if not low <= s <= high]
+
+
+class TrialStats:
+    """Summary of repeated timings, in seconds."""
+
+    def __init__(self, samples, outliers="iqr", cpu_samples=()):
+        self.samples = list(samples)
+        self.cpu_median = statistics.median(cpu_samples) if cpu_samples else None
+        kept, self.rejected = reject_outliers(samples) if outliers == "iqr" else (list(samples), [])
+        kept.sort()
+        self.kept = kept
+        self.n = len(kept)
+        self.median = statistics.median(kept)
+        self.mean = statistics.fmean(kept)
+        self.p95 = percentile(kept, 95)
+        self.stdev = statistics.stdev(kept) if self.n > 1 else 0.0
+        margin = t_critical(self.n - 1) * self.stdev / math.sqrt(self.n) if self.n > 1 else 0.0
+        self.ci = (self.mean - margin, self.mean + margin)
+
+    def overlaps(self, other):
+        """True if the two 95% confidence intervals overlap."""
+        return self.ci[0] <= other.ci[1] and other.ci[0] <= self.ci[1]
+
+    def as_dict(self):
+        return {
+            "median": self.median, "mean": self.mean, "p95": self.p95, "stdev": self.stdev,
+            "ci95": list(self.ci), "cpu_median": self.cpu_median,
+            "samples": self.samples, "rejected": len(self.rejected)
+        }
+
+
+def run_trials(func, data, repeats=DEFAULT_REPEATS, warmup=DEFAULT_WARMUP, disable_gc=True,
+               outliers="iqr"):
+    """
+    Time func(fresh copy of data) repeatedly.
+
+    Args:
+        func: Sort function taking a list
+        data: Input list; every run gets its own copy, so in-place sorts
+              never see already sorted data
+        repeats: Timed repetitions (at least 1)
+        warmup: Untimed runs before the timed ones
+        disable_gc: Turn the cyclic garbage collector off while timing (it
+                    is collected before each run and restored afterwards)
+        outliers: "iqr" to reject samples outside Tukey's fences, or None
+
+    Returns:
+        Tuple of (result of the last run, TrialStats); CPU time
+        (process_time_ns) is kept as TrialStats.cpu_median
+    """
+    for _ in range(warmup):
+        func(data.copy())
+
+    samples, cpu_samples = [], []
+    result = None
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(max(1, repeats)):
+            fresh = data.copy()
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            cpu = time.process_time_ns()
+            start = time.perf_counter_ns()
+            result = func(fresh)
+            seconds = (time.perf_counter_ns() - start) / NS
+            cpu_samples.append((time.process_time_ns() - cpu) / NS)
+            if gc_was_enabled:
+                gc.enable()
+            samples.append(seconds)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return result, TrialStats(samples, outliers, cpu_samples)
@@ -0,0 +1,162 @@
+"""
+Optional NumPy-backed integer datasets and np.sort baselines.
+
+Everything else in sortlab is standard-library only; this module is the
+one place NumPy is used, and only if it is installed. HAVE_NUMPY says
+whether it is, and callers keep their pure-Python path otherwise:
+
+    from sortlab.vectorized import HAVE_NUMPY, IntDataset
+
+IntDataset holds an int64 ndarray and does the preparation work of a
+benchmark without a Python-level loop per element:
+
+- from_file() parses a one-number-per-line file in one C call, or wraps
+  a binary (.i64) file or a dataset cache entry's column with
+  np.frombuffer (no per-element work);
+- verify() checks a sort result against the dataset like
+  sortlab.verify.verify_sorted, with one conversion of the result and
+  vectorized passes;
+- statistics() is a few vectorized passes.
+
+Values outside int64 raise OverflowError (IntDataset, from_file), or
+as_dataset() gives None for them, and callers take the pure-Python path.
+
+sorter(kind) gives np.sort with one of SORT_KINDS as a reference
+baseline: the speed of a compiled sort on the same data, the floor the
+pure-Python algorithms are measured against.
+"""
+import warnings
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from sortlab.cache import default_cache
+from sortlab.intio import is_binary, read_binary
+from sortlab.verify import Verification, first_disorder
+
+HAVE_NUMPY = np is not None
+SORT_KINDS = ("quicksort", "mergesort", "heapsort", "stable")
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def require_numpy():
+    if not HAVE_NUMPY:
+        raise ImportError("NumPy is not installed (pip install numpy)")
+
+
+class IntDataset:
+    """
+    A one-dimensional int64 dataset held in a NumPy array.
+
+    Raises:
+        OverflowError: A value does not fit in int64
+    """
+
+    def __init__(self, values):
+        require_numpy()
+        self.values = np.asarray(values, dtype=np.int64)
+        self._sorted = None
+
+    @classmethod
+    def from_file(cls, path, cache=default_cache):
+        """
+        Load a one-number-per-line file or a binary (.i64) dataset.
+
+        Raises:
+            OSError: The file cannot be read
+            ValueError: The file holds something other than integers
+            OverflowError: A value does not fit in int64
+        """
+        require_numpy()
+        if is_binary(path):
+            return cls(np.frombuffer(read_binary(path), dtype=np.int64))
+        hit = cache.load(path, "ints")
+        if hit:
+            return cls(np.frombuffer(hit[0]["values"], dtype=np.int64))
+        with open(path, "rb") as f:
+            text = f.read()
+        # fromstring stops at the first bad token with a DeprecationWarning;
+        # turn that into an error rather than silently loading a prefix
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                values = np.fromstring(text, dtype=np.int64, sep=" ") if text.strip() else np.empty(0, np.int64)
+            except DeprecationWarning as e:
+                raise ValueError(f"invalid data in {path}") from e
+        # ...and clamps values outside int64 to its maximum: parse those
+        # files exactly, which raises OverflowError if the value is real
+        if len(values) and (values.max() == INT64_MAX or values.min() == INT64_MIN):
+            values = list(map(int, text.split()))
+        dataset = cls(values)
+        cache.store(path, "ints", {"values": dataset.to_array()})
+        return dataset
+
+    def __len__(self):
+        return len(self.values)
+
+    def tolist(self):
+        """Plain Python ints, for the pure-Python algorithms."""
+        return self.values.tolist()
+
+    def to_array(self):
+        """array('q') copy for the dataset cache."""
+        column = array("q")
+        column.frombytes(self.values.astype("<i8", copy=False).tobytes())
+        return column
+
+    def verify(self, result, descending=False):
+        """
+        verify_sorted(self, result, descending) for a result (list, array
+        or IntDataset) of this dataset: order from one comparison of
+        neighbours, the elements from both sides sorted and compared.
+        """
+        try:
+            b = result.values if isinstance(result, IntDataset) else np.fromiter(result, np.int64, len(result))
+        except OverflowError:  # a value beyond int64 cannot be one of ours
+            return Verification(first_disorder(result, descending), False)
+        out_of_order = np.flatnonzero(b[:-1] < b[1:] if descending else b[:-1] > b[1:])
+        disorder_at = int(out_of_order[0]) if len(out_of_order) else None
+        if self._sorted is None:  # kept: one dataset is checked against every algorithm's result
+            self._sorted = np.sort(self.values)
+        same = len(b) == len(self.values) and bool(np.array_equal(np.sort(b), self._sorted))
+        return Verification(disorder_at, same)
+
+    def statistics(self):
+        a = self.values
+        if not len(a):
+            return {"size": 0}
+        return {
+            "size": len(a), "min": int(a.min()), "max": int(a.max()), "mean": float(a.mean()),
+            "median": float(np.median(a)), "stdev": float(a.std()), "unique": int(len(np.unique(a)))
+        }
+
+
+def as_dataset(values):
+    """
+    IntDataset(values), or None when NumPy is not installed or a value
+    does not fit in int64 (the caller keeps its pure-Python path).
+    """
+    if not HAVE_NUMPY:
+        return None
+    try:
+        return IntDataset(values)
+    except OverflowError:
+        return None
+
+
+def sorter(kind, descending=False):
+    """
+    np.sort(values, kind=kind) as a sort function over int64 arrays
+    (descending order is the ascending result reversed, a free view).
+    """
+    require_numpy()
+    if kind not in SORT_KINDS:
+        raise ValueError(f"unknown sort kind: {kind}")
+
+    def sort(values):
+        result = np.sort(values, kind=kind)
+        return result[::-1] if descending else result
+    return sort
@@ -0,0 +1,320 @@
+"""
+Linear-time verification of sort results.
+
+Re-sorting the input to compare with the output (sorted(original) ==
+result) costs O(n log n) time and a full copy of the data. The checks
+here each make one pass with O(1) extra memory (one byte per position
+when a permutation has to be checked item by item), so they also work on
+streams such as files read line by line:
+
+- order: every item compared with its successor;
+- same elements: both sides reduced to an order-independent multiset
+  fingerprint, the item count plus the sum of salted hashes of the items
+  mod 2**64 with a random salt per check. Different multisets collide
+  only if their salted hashes happen to sum to the same 64-bit value;
+- permutation: row positions returned by a sort are checked exactly,
+  never by fingerprint;
+- stability: for sorts that return row positions, equal keys must come
+  out in increasing position order.
+
+The passes are built from map/zip/compress so the per-item work runs in
+C, over blocks of BLOCK items: a sorted result's items are scattered in
+memory, and running each pass over one block at a time keeps them in
+cache from one pass to the next.
+
+CPython hashes an int n to n mod 2**61 - 1 (keeping the sign) and maps
+-1 to -2, so hash((salt, n)) alone would let -1 and -2, or n and
+n + 2**61 - 1, swap unnoticed. The int fingerprint therefore also carries
+the exact sum of abs(n): with one side inside +-(2**61 - 1), equal hashes
+leave only such swaps, and each of them changes that sum. Items other
+than ints are hashed by their repr, so values of different types that
+compare equal (1, 1.0) count as different there. str hashes differ
+between processes: fingerprint both sides in the same run.
+"""
+import operator, random, sys
+from itertools import compress, count, islice, repeat
+
+MASK = (1 << 64) - 1
+HASH_MODULUS = sys.hash_info.modulus  # ints smaller than this in size hash to themselves (but -1)
+BLOCK = 1 << 12  # items per block: a block's items stay in cache between passes
+
+
+def _blocks(items):
+    """items as consecutive lists of up to BLOCK items."""
+    iterator = iter(items)
+    block = list(islice(iterator, BLOCK))
+    while block:
+        yield block
+        block = list(islice(iterator, BLOCK))
+
+
+def _disorder(block, previous, start, out_of_order, descending):
+    """
+    first_disorder for block, which starts at index start and follows the
+    item in previous (an empty list for the first block).
+    """
+    # sorted() passes over an ordered block once, as a single run
+    if sorted(block, reverse=descending) == block and not (previous and out_of_order(previous[0], block[0])):
+        return None
+    run = previous + block
+    at = next(compress(count(), map(out_of_order, run, islice(run, 1, None))), None)
+    return None if at is None else start - len(previous) + at
+
+
+def first_disorder(items, descending=False):
+    """Index i of the first item out of order with item i + 1, or None if sorted."""
+    out_of_order = operator.lt if descending else operator.gt
+    start, previous = 0, []
+    for block in _blocks(items):
+        disorder_at = _disorder(block, previous, start, out_of_order, descending)
+        if disorder_at is not None:
+            return disorder_at
+        start += len(block)
+        previous = block[-1:]
+    return None
+
+
+def random_salt():
+    """Salt for fingerprints that are compared with each other."""
+    return random.getrandbits(64)
+
+
+def fingerprint(items, salt):
+    """
+    Order-independent fingerprint of a multiset of any items.
+
+    Returns:
+        Tuple of (item count, sum of hash((salt, repr(item))) mod 2**64)
+    """
+    tally = count()
+    hashes = map(hash, zip(repeat(salt), map(repr, items)))
+    total = sum(map(operator.itemgetter(0), zip(hashes, tally)))
+    return next(tally), total & MASK
+
+
+def int_fingerprint(items, salt):
+    """
+    Order-independent fingerprint of a multiset of ints, hashing each
+    value itself rather than its repr.
+
+    Returns:
+        Tuple of (item count, sum of hash((salt, item)) mod 2**64,
+        sum of abs(item)); the last is not an int if some item was not
+
+    Raises:
+        TypeError: An item has no abs()
+    """
+    if isinstance(items, (list, tuple)):
+        return len(items), sum(map(hash, zip(repeat(salt), items))) & MASK, sum(map(abs, items))
+    size = total = absolute = 0
+    for block in _blocks(items):
+        size += len(block)
+        total += sum(map(hash, zip(repeat(salt), block)))
+        absolute += sum(map(abs, block))
+    return size, total & MASK, absolute
+
+
+def _hashes_exactly(items, ordered=False):
+    """
+    True if items (a sequence) holds only ints within +-HASH_MODULUS as
+    far as its extremes tell; when ordered, its ends are its extremes.
+    """
+    if not items:
+        return False
+    try:
+        ends = (items[0], items[-1]) if ordered else (min(items), max(items))
+        return -HASH_MODULUS < min(ends) and max(ends) < HASH_MODULUS
+    except TypeError:
+        return False
+
+
+def _same_elements(a, b, salt, expected, ordered):
+    """same_elements with int_fingerprint(b, salt) already taken (None if it was not)."""
+    if expected is not None and type(expected[2]) is int and _hashes_exactly(b, ordered):
+        try:
+            return int_fingerprint(a, salt) == expected
+        except TypeError:  # a holds an item that none of b's ints can equal
+            return False
+    return fingerprint(a, salt) == fingerprint(b, salt)
+
+
+def same_elements(a, b, salt=None, ordered=False):
+    """
+    True if a (any iterable, read once) and b (a sequence) hold the same
+    multiset, with high probability. Ints are fingerprinted by value when
+    b allows it (pass ordered=True if b is sorted), anything else by repr.
+    """
+    salt = random_salt() if salt is None else salt
+    expected = int_fingerprint(b, salt) if _hashes_exactly(b, ordered) else None
+    return _same_elements(a, b, salt, expected, ordered)
+
+
+def is_permutation(positions, n):
+    """True if positions holds each of 0 .. n - 1 exactly once (exact)."""
+    if len(positions) != n:
+        return False
+    if not n:
+        return True
+    if min(positions) < 0:  # would mark the flags from the end
+        return False
+    seen = bytearray(n)
+    try:
+        for block in _blocks(positions):
+            any(map(operator.setitem, repeat(seen), block, repeat(1)))  # setitem returns None
+    except (IndexError, TypeError):
+        return False
+    return 0 not in seen  # n marks and none missing, so none repeated
+
+
+class Verification:
+    """Outcome of verifying one sort; None means the check did not apply."""
+
+    def __init__(self, disorder_at=None, same_elements=None, stable=None, instability_at=None):
+        self.disorder_at = disorder_at
+        self.same_elements = same_elements
+        self.stable = stable
+        self.instability_at = instability_at
+
+    @property
+    def ordered(self):
+        return self.disorder_at is None
+
+    @property
+    def passed(self):
+        """Ordered and nothing lost or duplicated; stability is reported, not required."""
+        return self.ordered and self.same_elements is not False
+
+    def summary(self):
+        """'✓ ordered | ✓ same elements | ✗ not stable (first at 12)'"""
+        parts = ["✓ ordered" if self.ordered else f"✗ out of order at {self.disorder_at:,}"]
+        if self.same_elements is not None:
+            parts.append("✓ same elements" if self.same_elements else "✗ elements differ")
+        if self.stable is not None:
+            parts.append("✓ stable" if self.stable else f"✗ not stable (first at {self.instability_at:,})")
+        return " | ".join(parts)
+
+    def as_dict(self):
+        return {
+            "passed": self.passed, "ordered": self.ordered, "disorder_at": self.disorder_at,
+            "same_elements": self.same_elements, "stable": self.stable,
+            "instability_at": self.instability_at
+        }
+
+
+def _scan(items, descending, salt):
+    """
+    first_disorder(items) and int_fingerprint(items, salt), taken in one
+    pass over each block while its items are in cache.
+
+    Raises:
+        TypeError: An item has no abs()
+    """
+    out_of_order = operator.lt if descending else operator.gt
+    disorder_at = None
+    start, previous = 0, []
+    total = absolute = 0
+    for block in _blocks(items):
+        if disorder_at is None:
+            disorder_at = _disorder(block, previous, start, out_of_order, descending)
+        total += sum(map(hash, zip(repeat(salt), block)))
+        if disorder_at is None and block[0] >= 0 and block[-1] >= 0:  # ordered, so all >= 0
+            absolute += sum(block)
+        elif disorder_at is None and block[0] <= 0 and block[-1] <= 0:
+            absolute -= sum(block)
+        else:
+            absolute += sum(map(abs, block))
+        start += len(block)
+        previous = block[-1:]
+    return disorder_at, (start, total & MASK, absolute)
+
+
+def verify_sorted(original, result, descending=False):
+    """
+    Check that result is original in sorted order: one pass over original
+    (any iterable), one over result (so a sequence), O(1) extra memory.
+    Plain values have no identity, so stability is not checked.
+    """
+    salt = random_salt()
+    try:
+        disorder_at, expected = _scan(result, descending, salt)
+    except TypeError:  # not numbers: order alone here, and fingerprints by repr
+        disorder_at, expected = first_disorder(result, descending), None
+    return Verification(disorder_at, _same_elements(original, result, salt, expected, disorder_at is None))
+
+
+def _first_suspect(keys, order):
+    """
+    Index from which the (keys[position], position) pairs of order may stop
+    strictly increasing, or None if they never do and no position is
+    negative (the ascending fast path). A block of keys that strictly
+    increases passes in one C-level pass; otherwise its order is checked
+    with sorted() and its stability only where neighbours are equal.
+    """
+    lookup = keys.__getitem__
+    start, previous = 0, None
+    for positions in _blocks(order):
+        block = list(map(lookup, positions))
+        if min(positions) < 0 or previous is not None and previous >= (block[0], positions[0]):
+            return max(start - 1, 0)
+        if not all(map(operator.lt, block, islice(block, 1, None))):
+            if sorted(block) != block:
+                return start
+            equal = map(operator.eq, block, islice(block, 1, None))
+            backwards = map(operator.ge, positions, islice(positions, 1, None))
+            if any(map(operator.and_, equal, backwards)):
+                return start
+        start += len(block)
+        previous = (block[-1], positions[-1])
+    return None
+
+
+def _classify(keys, order, start, descending):
+    """First disorder and first instability at or after start (the slow path)."""
+    disorder_at = instability_at = None
+    previous_key, previous_position = keys[order[start]], order[start]
+    for i in range(start + 1, len(order)):
+        position = order[i]
+        key = keys[position]
+        out_of_order = (key > previous_key) if descending else (key < previous_key)
+        if out_of_order and disorder_at is None:
+            disorder_at = i - 1
+        elif key == previous_key and position < previous_position and instability_at is None:
+            instability_at = i - 1
+        if disorder_at is not None and instability_at is not None:
+            break
+        previous_key, previous_position = key, position
+    return disorder_at, instability_at
+
+
+def verify_order(keys, order, descending=False, complete=True):
+    """
+    Check a sort that returned row positions (order) for a key column.
+
+    keys[order[i]] must never be out of order with its successor, and
+    equal keys must keep increasing positions (stability). For ascending
+    order that is a few C-level passes per block: the (key, position)
+    pairs must be strictly increasing; only when they are not is the
+    first problem classified in Python. With complete=True order must be
+    a permutation of range(len(keys)): strictly increasing pairs already
+    have distinct positions, so then only their count and bounds are left
+    to check, and otherwise each position is marked once in a bytearray. Without
+    it (Top K) order must hold distinct positions within range, checked
+    with an O(k) set.
+    """
+    if not order:
+        start = None
+    elif descending:
+        start = 0
+    else:
+        start = _first_suspect(keys, order)
+    disorder_at, instability_at = _classify(keys, order, start, descending) if start is not None else (None, None)
+
+    if not complete:
+        seen = set(order)
+        same = len(seen) == len(order) and all(0 <= position < len(keys) for position in seen)
+    elif start is None and not descending:
+        # distinct, not negative and each one a valid index into keys
+        same = len(order) == len(keys)
+    else:
+        same = is_permutation(order, len(keys))
+    return Verification(disorder_at, same, instability_at is None, instability_at)